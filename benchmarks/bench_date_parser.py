@@ -0,0 +1,92 @@
+"""
+Benchmark: parsing Google News ``date`` strings for recency scoring.
+
+Times, per call, over a realistic mix of relative and absolute strings:
+
+* ``dateutil``: dateutil.parser.parse (the previous implementation; skipped
+  if python-dateutil is not installed). Relative strings fail and scored 0.
+* ``cold``: date_parser.parse_published_at with its memo caches cleared
+  before every call
+* ``cached``: the same parser on repeated strings (the common case, since
+  the same "N hours ago" values recur across every search)
+
+Usage:
+    poetry run python benchmarks/bench_date_parser.py
+    poetry run python benchmarks/bench_date_parser.py --strings 20000
+"""
+
+import argparse
+import random
+import time
+
+from news_agent.agents.ingestion import date_parser
+
+
+def make_strings(count: int):
+    rng = random.Random(42)
+    relative = (
+        [f"{n} hours ago" for n in range(1, 24)]
+        + [f"{n} mins ago" for n in range(1, 60)]
+        + [f"{n} days ago" for n in range(1, 7)]
+        + ["1 hour ago", "1 day ago", "1 week ago", "2 weeks ago", "yesterday"]
+    )
+    absolute = [
+        f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2024, 07:00 AM, +0000 UTC"
+        for _ in range(50)
+    ] + [f"Oct {d}, 2024" for d in range(1, 29)]
+    # Google News results are mostly relative
+    return [
+        rng.choice(relative) if rng.random() < 0.8 else rng.choice(absolute)
+        for _ in range(count)
+    ]
+
+
+def clear_caches():
+    date_parser.parse_relative.cache_clear()
+    date_parser.parse_absolute.cache_clear()
+    date_parser._parse_month_day.cache_clear()
+
+
+def parse_uncached(text):
+    clear_caches()
+    return date_parser.parse_published_at(text)
+
+
+def time_per_call(fn, strings):
+    start = time.perf_counter()
+    parsed = sum(1 for s in strings if fn(s) is not None)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e6 / len(strings), parsed
+
+
+def dateutil_parse(text):
+    try:
+        return dateutil_parser.parse(text)
+    except (ValueError, OverflowError):
+        return None
+
+
+def main() -> None:
+    global dateutil_parser
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--strings", type=int, default=5000)
+    args = parser.parse_args()
+
+    strings = make_strings(args.strings)
+    cases = []
+    try:
+        from dateutil import parser as dateutil_parser
+
+        cases.append(("dateutil", dateutil_parse))
+    except ImportError:
+        print("python-dateutil not installed; skipping the dateutil baseline")
+    cases.append(("cold", parse_uncached))
+    cases.append(("cached", date_parser.parse_published_at))
+
+    for name, fn in cases:
+        us, parsed = time_per_call(fn, strings)
+        print(f"{name:<9} {us:8.2f} us/string  parsed={parsed}/{len(strings)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark: per-subscriber trend queries vs. the single-query delivery plan.
+
+Seeds a throwaway SQLite database with N subscribers (each following a few
+tags) and a batch of unnotified trends, then times:
+
+* ``legacy``: the old EmailSenderAgent loop (load every Subscription with
+  its tags, then one Trend join query per subscriber)
+* ``plan``: SQLAlchemySubscriptionDB.get_delivery_plan()
+
+Only the read side is measured; no e-mails are sent.
+
+Usage:
+    poetry run python benchmarks/bench_delivery_plan.py
+    poetry run python benchmarks/bench_delivery_plan.py --subscribers 10000
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import selectinload
+
+from news_agent.agents.db.fingerprint import trend_fingerprint
+from news_agent.agents.db.sqlachemy_db import (
+    SQLAlchemySubscriptionDB,
+    Subscription,
+    Tag,
+    Trend,
+    subscription_tags,
+    trend_tags,
+)
+
+
+async def seed(db, subscribers: int, tags: int, trends: int, tags_per_sub: int):
+    rng = random.Random(42)
+    async with db.get_db() as session:
+        await session.execute(
+            insert(Tag), [{"id": i + 1, "name": f"tag-{i}"} for i in range(tags)]
+        )
+        await session.execute(
+            insert(Subscription),
+            [
+                {"id": i + 1, "email": f"user{i}@example.com"}
+                for i in range(subscribers)
+            ],
+        )
+        await session.execute(
+            subscription_tags.insert(),
+            [
+                {"subscription_id": sub_id, "tag_id": tag_id}
+                for sub_id in range(1, subscribers + 1)
+                for tag_id in rng.sample(range(1, tags + 1), tags_per_sub)
+            ],
+        )
+        trend_rows = []
+        for i in range(trends):
+            url = f"https://example.com/{i}"
+            url_hash, title_hash = trend_fingerprint(f"Trend {i}", url)
+            trend_rows.append(
+                {
+                    "id": i + 1,
+                    "topic": f"Trend {i}",
+                    "summary": "summary",
+                    "url": url,
+                    "notified": False,
+                    "url_hash": url_hash,
+                    "title_hash": title_hash,
+                }
+            )
+        await session.execute(insert(Trend), trend_rows)
+        await session.execute(
+            trend_tags.insert(),
+            [
+                {"trend_id": i + 1, "tag_id": rng.randint(1, tags)}
+                for i in range(trends)
+            ],
+        )
+        await session.commit()
+
+
+async def legacy_loop(db) -> int:
+    """Query pattern of the previous send_for_subscriptions implementation."""
+    pairs = 0
+    async with db.get_db() as session:
+        result = await session.execute(
+            select(Subscription).options(selectinload(Subscription.tags))
+        )
+        for subscription in result.scalars().all():
+            tag_ids = [tag.id for tag in subscription.tags]
+            if not tag_ids:
+                continue
+            trends_result = await session.execute(
+                select(Trend)
+                .join(trend_tags, Trend.id == trend_tags.c.trend_id)
+                .where(trend_tags.c.tag_id.in_(tag_ids))
+                .where(Trend.notified.is_(False))
+                .distinct()
+            )
+            pairs += len(trends_result.scalars().all())
+    return pairs
+
+
+async def delivery_plan(db) -> int:
+    plan = await db.get_delivery_plan()
+    return sum(len(entry["trends"]) for entry in plan)
+
+
+async def run(subscribers: int, args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        db = SQLAlchemySubscriptionDB(engine=engine)
+        await db.init_db()
+        await seed(db, subscribers, args.tags, args.trends, args.tags_per_sub)
+
+        for name, fn in (("legacy", legacy_loop), ("plan", delivery_plan)):
+            start = time.perf_counter()
+            pairs = await fn(db)
+            elapsed = time.perf_counter() - start
+            print(
+                f"subscribers={subscribers:>7} {name:<7} "
+                f"{elapsed:8.3f}s  pairs={pairs}"
+            )
+        await engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--trends", type=int, default=200)
+    parser.add_argument("--tags-per-sub", type=int, default=3)
+    args = parser.parse_args()
+
+    for subscribers in args.subscribers:
+        await run(subscribers, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+"""
+Benchmark: per-article cost of hotness scoring for SerpAPI results.
+
+Generates synthetic news results and times:
+
+* ``legacy``: the previous list-scan helpers (keyword lists rebuilt on every
+  call, substring ``in`` matching)
+* ``scorer``: HotnessScorer.score_articles() over the whole batch
+
+``--extra-terms`` pads the keyword and authority lists with synthetic
+entries to show how each approach scales as the lists grow. Recency is
+excluded from both sides so only keyword / authority matching is measured.
+
+Usage:
+    poetry run python benchmarks/bench_hotness_scoring.py
+    poetry run python benchmarks/bench_hotness_scoring.py --articles 5000 --extra-terms 0 500
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+
+from news_agent.agents.ingestion import scoring
+from news_agent.agents.ingestion.scoring import (
+    BREAKING_KEYWORDS,
+    HOT_KEYWORDS,
+    SOURCE_AUTHORITY,
+    HotnessScorer,
+)
+
+WORDS = (
+    "market chip model launch vote storm team city court study energy bank "
+    "rally deal talks price record season report health space"
+).split()
+SOURCES = ["Reuters", "AP News", "The Japan Times", "Some Blog", "The Guardian"]
+
+
+def make_articles(count: int):
+    rng = random.Random(42)
+    keywords = list(HOT_KEYWORDS)
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=6))
+        if rng.random() < 0.3:
+            title = f"{rng.choice(keywords).title()}: {title}"
+        articles.append(
+            {
+                "title": title,
+                "snippet": " ".join(rng.choices(WORDS + keywords, k=25)),
+                "source": rng.choice(SOURCES),
+                "link": f"https://example.com/{i}",
+            }
+        )
+    return articles
+
+
+def legacy_authority(source, high_authority, medium_authority):
+    source_lower = source.lower()
+    for auth_source in list(high_authority):
+        if auth_source in source_lower:
+            return 5
+    for auth_source in list(medium_authority):
+        if auth_source in source_lower:
+            return 3
+    return 1
+
+
+def legacy_keywords(text, hot_keywords):
+    text_lower = text.lower()
+    return [k for k in list(hot_keywords) if k in text_lower]
+
+
+def legacy_is_breaking(title):
+    title_lower = title.lower()
+    return any(k in title_lower for k in list(BREAKING_KEYWORDS))
+
+
+def legacy_score(articles, hot_keywords, high_authority, medium_authority):
+    """
+    Scoring as done by the original per-call helper functions, building the
+    same article records as ``score_articles`` (timestamped per article, as
+    the original loop did).
+    """
+    scored = []
+    for item in articles:
+        published_at = item.get("date")
+        scored.append(
+            {
+                "id": item.get("link"),
+                "source": item.get("source", ""),
+                "url": item.get("link"),
+                "title": item.get("title", ""),
+                "content": item.get("snippet", ""),
+                "published_at": published_at,
+                "language": "en",
+                "recency_score": scoring.recency_score(published_at),
+                "source_authority": legacy_authority(
+                    item.get("source", ""), high_authority, medium_authority
+                ),
+                "engagement_keywords": legacy_keywords(
+                    item.get("title", "") + " " + item.get("snippet", ""),
+                    hot_keywords,
+                ),
+                "is_breaking": legacy_is_breaking(item.get("title", "")),
+                "search_query": "q",
+                "search_timestamp": datetime.now().isoformat(),
+            }
+        )
+    scored.sort(
+        key=lambda x: x["is_breaking"] * 10
+        + x["recency_score"]
+        + x["source_authority"],
+        reverse=True,
+    )
+    return scored
+
+
+def run(articles, extra_terms: int, repeat: int) -> None:
+    padding = [f"term{i}" for i in range(extra_terms)]
+    hot_keywords = list(HOT_KEYWORDS) + padding
+    authority = {**SOURCE_AUTHORITY, **{t: 3 for t in padding}}
+    high = [k for k, v in authority.items() if v == 5 and "." not in k]
+    medium = [k for k, v in authority.items() if v == 3 and "." not in k]
+    scorer = HotnessScorer(hot_keywords=hot_keywords, source_authority=authority)
+
+    cases = (
+        ("legacy", lambda: legacy_score(articles, hot_keywords, high, medium)),
+        ("scorer", lambda: scorer.score_articles(articles, "q", "en")),
+    )
+    for name, fn in cases:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"terms={len(hot_keywords):>5} {name:<7} "
+            f"{best * 1e6 / len(articles):8.2f} us/article"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=3000)
+    parser.add_argument("--extra-terms", type=int, nargs="+", default=[0, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Keep date parsing out of the measurement
+    scoring.recency_score = lambda published_at: 0
+
+    articles = make_articles(args.articles)
+    for extra_terms in args.extra_terms:
+        run(articles, extra_terms, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
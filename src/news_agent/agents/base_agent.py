@@ -3,13 +3,13 @@ from __future__ import annotations
 from typing import Any, List, Optional
 
 from agents import Agent, OpenAIResponsesModel
-from agents.mcp import MCPServerStdio
+from agents.mcp import MCPServer
 from openai import AsyncOpenAI
 
 
 def init_agent(
     instructions: str,
-    mcp_servers: Optional[List[MCPServerStdio]] = None,
+    mcp_servers: Optional[List[MCPServer]] = None,
     tool: Optional[List[Any]] = None,
     name: str = "Assistant",
     output_guardrails: Optional[List[Any]] = None,
@@ -0,0 +1,111 @@
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from news_agent.config.settings import Settings
+from news_agent.config.settings import settings as default_settings
+
+logger = logging.getLogger("subscription_db")
+
+# =====================================================
+# ENGINE PROFILES
+# =====================================================
+# Each profile turns Settings into create_async_engine kwargs plus the SQLite
+# pragmas applied on every new connection.
+
+
+def _default_profile(settings: Settings) -> Dict[str, Any]:
+    """SQLAlchemy defaults: rollback journal, default pool."""
+    return {"engine_kwargs": {}, "pragmas": {}}
+
+
+def _sqlite_wal_profile(settings: Settings) -> Dict[str, Any]:
+    """
+    High-concurrency SQLite: readers never block the single writer and writers
+    wait for the lock instead of failing with "database is locked".
+    """
+    return {
+        "engine_kwargs": {},
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+            "mmap_size": settings.SQLITE_MMAP_SIZE,
+            "cache_size": settings.SQLITE_CACHE_SIZE,
+        },
+    }
+
+
+def _server_profile(settings: Settings) -> Dict[str, Any]:
+    """Client/server databases (e.g. PostgreSQL) with an explicitly sized pool."""
+    return {
+        "engine_kwargs": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": True,
+        },
+        "pragmas": {},
+    }
+
+
+ENGINE_PROFILES: Dict[str, Callable[[Settings], Dict[str, Any]]] = {
+    "default": _default_profile,
+    "sqlite_wal": _sqlite_wal_profile,
+    "server": _server_profile,
+}
+
+
+def apply_sqlite_pragmas(engine: AsyncEngine, pragmas: Dict[str, Any]) -> None:
+    """Run ``PRAGMA name=value`` on every new DBAPI connection of ``engine``."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_engine_from_settings(settings: Optional[Settings] = None) -> AsyncEngine:
+    """
+    Create the application engine for ``settings.DB_ENGINE_PROFILE``.
+
+    Args:
+        settings: Settings instance (defaults to the module singleton)
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    settings = settings or default_settings
+    profile_name = settings.DB_ENGINE_PROFILE
+    if profile_name not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown engine profile: {profile_name} "
+            f"(expected one of {sorted(ENGINE_PROFILES)})"
+        )
+    profile = ENGINE_PROFILES[profile_name](settings)
+
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DB_ECHO,
+        future=True,
+        **profile["engine_kwargs"],
+    )
+
+    if profile["pragmas"]:
+        if engine.dialect.name == "sqlite":
+            apply_sqlite_pragmas(engine, profile["pragmas"])
+        else:
+            logger.warning(
+                f"Engine profile '{profile_name}' sets SQLite pragmas; "
+                f"ignoring them for dialect '{engine.dialect.name}'"
+            )
+
+    logger.info(f"Database engine created with profile '{profile_name}'")
+    return engine
@@ -0,0 +1,69 @@
+import hashlib
+import re
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click and never change the article
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ocid"}
+TRACKING_PREFIXES = ("utm_",)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL used for duplicate detection.
+
+    Lowercases the URL, drops the fragment, default ports, a leading ``www.``,
+    tracking parameters and trailing slashes, and sorts the remaining query
+    parameters.
+    """
+    url = (url or "").strip().lower()
+    if not url:
+        return ""
+
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url.rstrip("/")
+
+    host = parts.hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and not (
+        (parts.scheme == "http" and parts.port == 80)
+        or (parts.scheme == "https" and parts.port == 443)
+    ):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith(TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", host, path, urlencode(query), ""))[2:]
+
+
+def normalize_title(title: str) -> str:
+    """Unicode-normalized, case-folded title with collapsed whitespace."""
+    title = unicodedata.normalize("NFKC", title or "")
+    return _WHITESPACE_RE.sub(" ", title).strip().casefold()
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def url_fingerprint(url: str) -> str:
+    """Hex digest of the canonical URL."""
+    return _digest(canonicalize_url(url))
+
+
+def title_fingerprint(title: str) -> str:
+    """Hex digest of the normalized title."""
+    return _digest(normalize_title(title))
+
+
+def trend_fingerprint(title: str, url: str) -> tuple[str, str]:
+    """``(url_hash, title_hash)`` pair stored on every trend."""
+    return url_fingerprint(url), title_fingerprint(title)
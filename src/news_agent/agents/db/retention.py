@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from opentelemetry.metrics import Observation, get_meter_provider
+
+from news_agent.agents.db.sqlachemy_db import SQLAlchemySubscriptionDB
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+class TrendRetentionJob:
+    """
+    Periodically moves delivered trends older than ``max_age_days`` from the hot
+    ``trends`` / ``trend_tags`` tables into ``trends_archive``.
+
+    Row counts of both tables are exported as OpenTelemetry gauges, and the
+    number of archived rows as a counter.
+    """
+
+    def __init__(
+        self,
+        db: SQLAlchemySubscriptionDB,
+        max_age_days: int = 30,
+        batch_size: int = 500,
+        max_batches_per_run: int | None = None,
+    ):
+        self.db = db
+        self.max_age = timedelta(days=max_age_days)
+        self.batch_size = batch_size
+        self.max_batches_per_run = max_batches_per_run
+
+        self._row_counts = {"live": 0, "archived": 0}
+
+        meter = get_meter_provider().get_meter("trend-news-metrics")
+        self.archived_counter = meter.create_counter(
+            name="trends.retention.archived",
+            description="Trends moved to the archive by the retention job",
+            unit="rows",
+        )
+        self.live_rows_gauge = meter.create_observable_gauge(
+            name="trends.live.rows",
+            description="Rows in the live trends table",
+            unit="rows",
+            callbacks=[self._live_rows_callback],
+        )
+        self.archived_rows_gauge = meter.create_observable_gauge(
+            name="trends.archive.rows",
+            description="Rows in the trends archive table",
+            unit="rows",
+            callbacks=[self._archived_rows_callback],
+        )
+
+    # -------------------------
+    # Observable callbacks
+    # -------------------------
+    def _live_rows_callback(self, options):
+        return [Observation(self._row_counts["live"])]
+
+    def _archived_rows_callback(self, options):
+        return [Observation(self._row_counts["archived"])]
+
+    async def run_once(self) -> Dict[str, Any]:
+        """Archive one round of eligible trends and refresh the row counts."""
+        # Trend.created_at is written by SQL now(), i.e. naive UTC
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - self.max_age
+        archived = await self.db.archive_trends(
+            cutoff,
+            batch_size=self.batch_size,
+            max_batches=self.max_batches_per_run,
+        )
+        if archived:
+            self.archived_counter.add(archived)
+        self._row_counts = await self.db.count_trend_rows()
+        return {
+            "archived": archived,
+            "live_rows": self._row_counts["live"],
+            "archived_rows": self._row_counts["archived"],
+        }
+
+    async def run_forever(self, interval_minutes: int = 360):
+        """Run the retention job every ``interval_minutes``."""
+        while True:
+            try:
+                stats = await self.run_once()
+                logger.info(f"Trend retention run completed: {stats}")
+            except Exception as e:
+                logger.error(f"Error during trend retention run: {e}")
+            await asyncio.sleep(interval_minutes * 60)
@@ -1,21 +1,54 @@
+import asyncio
+import json
 import logging
+import re
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, List
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
 
 from sqlalchemy import (
     Boolean,
     Column,
+    DateTime,
     ForeignKey,
+    Index,
     Integer,
+    MetaData,
     String,
     Table,
     Text,
-    and_,
+    bindparam,
+    delete,
     func,
+    insert,
+    inspect,
+    literal,
+    or_,
     select,
+    text,
+    union_all,
+    update,
 )
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import declarative_base, relationship, selectinload, sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from news_agent.agents.db.engine import create_engine_from_settings
+from news_agent.agents.db.fingerprint import trend_fingerprint
+from news_agent.agents.db.write_queue import BatchingWriteQueue, WriteIntent
 
 logger = logging.getLogger("subscription_db")
 logging.basicConfig(level=logging.INFO)
@@ -24,8 +57,15 @@ logging.basicConfig(level=logging.INFO)
 # CONFIGURATION
 # =====================================================
 
-DATABASE_URL = "sqlite+aiosqlite:///./subscriptions.db"
 Base = declarative_base()
+# Upper bound on cached tag name -> id entries per DB instance
+TAG_CACHE_SIZE = 4096
+# Page size of the streaming iter_* readers
+DEFAULT_BATCH_SIZE = 500
+# How much a fresh trend outranks an older one with the same bm25 score
+SEARCH_RECENCY_WEIGHT = 1.0
+
+_SEARCH_TERM_RE = re.compile(r"\w+", re.UNICODE)
 
 # =====================================================
 # ASSOCIATION TABLES
@@ -45,6 +85,8 @@ trend_tags = Table(
     Base.metadata,
     Column("trend_id", Integer, ForeignKey("trends.id"), primary_key=True),
     Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True),
+    # Serves "trends in these tags newer than a cursor" as an index range scan
+    Index("ix_trend_tags_tag_trend", "tag_id", "trend_id"),
 )
 
 # =====================================================
@@ -58,6 +100,10 @@ class Subscription(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     email = Column(String(256), nullable=False, unique=True)
     notes = Column(Text, nullable=True)
+    # High-water mark: highest trend id already delivered to this subscriber
+    last_delivered_trend_id = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     tags = relationship(
         "Tag", secondary=subscription_tags, back_populates="subscriptions"
     )
@@ -82,11 +128,274 @@ class Trend(Base):
     summary = Column(Text, nullable=True)
     url = Column(String(2048), nullable=True)
     source = Column(String(256), nullable=True)
+    # Legacy global delivery flag; delivery is tracked per subscription now
     notified = Column(Boolean, default=False)
+    # Hashes of the canonical URL and normalized title (see fingerprint.py)
+    url_hash = Column(String(32), nullable=True)
+    title_hash = Column(String(32), nullable=True)
+    created_at = Column(DateTime, nullable=True, default=func.now())
     tags = relationship(
         "Tag", secondary=trend_tags, back_populates="trends", lazy="selectin"
     )
 
+    __table_args__ = (
+        Index("ix_trends_fingerprint", "url_hash", "title_hash", unique=True),
+        Index("ix_trends_created_at", "created_at"),
+        # Ids of archived trends must never be handed out again: delivery
+        # cursors and trends_archive.id both rely on ids only growing
+        {"sqlite_autoincrement": True},
+    )
+
+
+class TrendArchive(Base):
+    """Delivered trends moved out of ``trends`` by the retention job."""
+
+    __tablename__ = "trends_archive"
+
+    # Same id the trend had in ``trends``
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    topic = Column(String(512), nullable=False)
+    summary = Column(Text, nullable=True)
+    url = Column(String(2048), nullable=True)
+    source = Column(String(256), nullable=True)
+    url_hash = Column(String(32), nullable=True)
+    title_hash = Column(String(32), nullable=True)
+    # JSON list of tag names the trend had when it was archived
+    tags = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=False, default=func.now())
+
+    # Archived fingerprints keep blocking re-ingestion of the same article
+    __table_args__ = (
+        Index("ix_trends_archive_fingerprint", "url_hash", "title_hash", unique=True),
+    )
+
+
+# =====================================================
+# MIGRATIONS
+# =====================================================
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _add_missing_columns(conn: Connection, table: Table) -> List[str]:
+    """ALTER an existing table to add model columns it does not have yet."""
+    existing = {col["name"] for col in inspect(conn).get_columns(table.name)}
+    added = []
+    for column in table.columns:
+        if column.name in existing:
+            continue
+        ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+        ddl += column.type.compile(dialect=conn.dialect)
+        if column.server_default is not None:
+            ddl += f" NOT NULL DEFAULT {column.server_default.arg}"
+        conn.execute(text(ddl))
+        added.append(column.name)
+    if added:
+        logger.info(f"Added columns to '{table.name}': {added}")
+    return added
+
+
+def _backfill_trend_fingerprints(conn: Connection) -> int:
+    """
+    Compute fingerprints for trends stored before the columns existed.
+
+    Legacy duplicates keep NULL hashes so the unique index can still be built;
+    the first occurrence carries the fingerprint and keeps matching lookups.
+    """
+    seen = {
+        (row.url_hash, row.title_hash)
+        for row in conn.execute(
+            select(Trend.url_hash, Trend.title_hash).where(Trend.url_hash.is_not(None))
+        )
+    }
+    last_id = 0
+    filled = 0
+    while True:
+        rows = conn.execute(
+            select(Trend.id, Trend.topic, Trend.url)
+            .where(Trend.url_hash.is_(None), Trend.id > last_id)
+            .order_by(Trend.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        updates = []
+        for row in rows:
+            fingerprint = trend_fingerprint(row.topic, row.url or "")
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            updates.append(
+                {"b_id": row.id, "b_url": fingerprint[0], "b_title": fingerprint[1]}
+            )
+        if updates:
+            conn.execute(
+                update(Trend.__table__)
+                .where(Trend.__table__.c.id == bindparam("b_id"))
+                .values(url_hash=bindparam("b_url"), title_hash=bindparam("b_title")),
+                updates,
+            )
+            filled += len(updates)
+
+    if filled:
+        logger.info(f"Backfilled fingerprints for {filled} trends")
+    return filled
+
+
+def _backfill_delivery_cursors(conn: Connection) -> None:
+    """
+    Derive each subscription's cursor from the legacy ``Trend.notified`` flag.
+
+    The cursor stops just before the oldest unnotified trend in the subscriber's
+    tags, so everything still pending under the old scheme stays pending.
+    """
+    oldest_pending = (
+        select(func.min(trend_tags.c.trend_id) - 1)
+        .select_from(subscription_tags)
+        .join(trend_tags, trend_tags.c.tag_id == subscription_tags.c.tag_id)
+        .join(Trend, Trend.id == trend_tags.c.trend_id)
+        .where(
+            subscription_tags.c.subscription_id == Subscription.id,
+            Trend.notified.is_not(True),
+        )
+        .scalar_subquery()
+    )
+    newest = select(func.max(Trend.id)).scalar_subquery()
+    conn.execute(
+        update(Subscription.__table__).values(
+            last_delivered_trend_id=func.coalesce(oldest_pending, newest, 0)
+        )
+    )
+
+
+def _ensure_trend_autoincrement(conn: Connection) -> None:
+    """
+    Rebuild a legacy ``trends`` rowid table as AUTOINCREMENT (SQLite only).
+
+    Without AUTOINCREMENT SQLite reuses the ids of the newest rows once the
+    retention job archives them. The rebuild keeps every id, so trend_tags,
+    the FTS index and delivery cursors stay valid; the id sequence starts past
+    the largest live or archived id.
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    ddl = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'trends'"
+    ).scalar()
+    if ddl is None or "AUTOINCREMENT" in ddl.upper():
+        return
+
+    rebuilt = Trend.__table__.to_metadata(MetaData(), name="trends_rebuild")
+    rebuilt.indexes.clear()
+    conn.execute(CreateTable(rebuilt))
+    # Runs after _add_missing_columns, so both tables have the same columns
+    columns = ", ".join(c.name for c in rebuilt.columns)
+    conn.exec_driver_sql(
+        f"INSERT INTO trends_rebuild ({columns}) SELECT {columns} FROM trends"
+    )
+    # Dropping the table drops its indexes and FTS triggers; both are
+    # recreated by upgrade_schema
+    conn.exec_driver_sql("DROP TABLE trends")
+    conn.exec_driver_sql("ALTER TABLE trends_rebuild RENAME TO trends")
+    conn.exec_driver_sql("DELETE FROM sqlite_sequence WHERE name = 'trends'")
+    conn.exec_driver_sql(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'trends', "
+        "MAX(COALESCE((SELECT MAX(id) FROM trends), 0), "
+        "COALESCE((SELECT MAX(id) FROM trends_archive), 0))"
+    )
+    logger.info("Rebuilt 'trends' with AUTOINCREMENT ids")
+
+
+# External-content FTS5 index over trends.topic / trends.summary, kept in sync
+# by triggers (SQLite only)
+TRENDS_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS trends_fts USING fts5("
+    "topic, summary, content='trends', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS trends_fts_ai AFTER INSERT ON trends BEGIN "
+    "INSERT INTO trends_fts(rowid, topic, summary) "
+    "VALUES (new.id, new.topic, new.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS trends_fts_ad AFTER DELETE ON trends BEGIN "
+    "INSERT INTO trends_fts(trends_fts, rowid, topic, summary) "
+    "VALUES ('delete', old.id, old.topic, old.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS trends_fts_au AFTER UPDATE OF topic, summary "
+    "ON trends BEGIN "
+    "INSERT INTO trends_fts(trends_fts, rowid, topic, summary) "
+    "VALUES ('delete', old.id, old.topic, old.summary); "
+    "INSERT INTO trends_fts(rowid, topic, summary) "
+    "VALUES (new.id, new.topic, new.summary); END",
+]
+
+
+def _ensure_trend_search_index(conn: Connection) -> None:
+    """Create the FTS5 index and triggers, indexing existing rows on creation."""
+    if conn.dialect.name != "sqlite":
+        return
+    is_new = not inspect(conn).has_table("trends_fts")
+    try:
+        for ddl in TRENDS_FTS_DDL:
+            conn.exec_driver_sql(ddl)
+    except OperationalError as e:
+        logger.warning(f"FTS5 unavailable, trend search falls back to LIKE: {e}")
+        return
+    if is_new:
+        conn.exec_driver_sql("INSERT INTO trends_fts(trends_fts) VALUES ('rebuild')")
+        logger.info("Built full-text index over stored trends")
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """Bring a database created by an older version up to the current models."""
+    added = _add_missing_columns(conn, Trend.__table__)
+    if "url_hash" in added:
+        _backfill_trend_fingerprints(conn)
+    if "created_at" in added:
+        # Age of legacy rows is unknown; start their retention clock now
+        conn.execute(
+            update(Trend.__table__)
+            .where(Trend.__table__.c.created_at.is_(None))
+            .values(created_at=func.now())
+        )
+    if "last_delivered_trend_id" in _add_missing_columns(conn, Subscription.__table__):
+        _backfill_delivery_cursors(conn)
+    _ensure_trend_autoincrement(conn)
+    for table in (Trend.__table__, trend_tags):
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    _ensure_trend_search_index(conn)
+
+
+def _item_field(item: Any, name: str) -> Any:
+    """Read a field from either a dict or an object such as NewsItem."""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _search_row(row) -> Dict[str, Any]:
+    created_at = row.created_at
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    return {
+        "id": row.id,
+        "topic": row.topic,
+        "summary": row.summary,
+        "url": row.url,
+        "created_at": created_at,
+        "score": row.score,
+    }
+
+
+def _public_row(row: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+    """Strip internal fingerprint fields from a row reported to callers."""
+    return {
+        "topic": row["topic"],
+        "summary": row["summary"],
+        "link": row["link"],
+        **extra,
+    }
+
 
 # =====================================================
 # DATABASE CLASS
@@ -96,20 +405,22 @@ class Trend(Base):
 class SQLAlchemySubscriptionDB:
     """Async DB layer for subscriptions, tags, and trends."""
 
-    def __init__(self, engine: AsyncEngine = None, session_maker=None):
+    def __init__(
+        self,
+        engine: AsyncEngine = None,
+        session_maker=None,
+        tag_cache_size: int = TAG_CACHE_SIZE,
+    ):
         """
         Initialize database with optional engine and session maker.
 
         Args:
-            engine: AsyncEngine instance (creates default if None)
+            engine: AsyncEngine instance (built from Settings if None)
             session_maker: Session maker factory (creates default if None)
+            tag_cache_size: Maximum number of cached tag name -> id entries
         """
         if engine is None:
-            self.engine = create_async_engine(
-                DATABASE_URL,
-                echo=False,
-                future=True,
-            )
+            self.engine = create_engine_from_settings()
         else:
             self.engine = engine
 
@@ -122,6 +433,14 @@ class SQLAlchemySubscriptionDB:
         else:
             self.session_maker = session_maker
 
+        # LRU of tag name -> id; the lock serializes creation of missing tags
+        self._tag_cache: OrderedDict[str, int] = OrderedDict()
+        self._tag_cache_size = tag_cache_size
+        self._tag_lock = asyncio.Lock()
+
+        # Optional single-writer queue, see start_write_queue()
+        self.write_queue: Optional[BatchingWriteQueue] = None
+
     @asynccontextmanager
     async def get_db(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session context manager."""
@@ -132,9 +451,46 @@ class SQLAlchemySubscriptionDB:
                 await session.close()
 
     async def init_db(self):
-        """Initialize database tables."""
+        """Initialize database tables and migrate older schemas."""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all, checkfirst=True)
+            await conn.run_sync(upgrade_schema)
+
+    # -----------------------
+    # Write path
+    # -----------------------
+    async def start_write_queue(
+        self, max_batch_size: int = 64, max_latency_ms: float = 10.0
+    ) -> None:
+        """Route all writes through a single group-committing writer task."""
+        if self.write_queue is None or not self.write_queue.running:
+            self.write_queue = BatchingWriteQueue(
+                self.session_maker,
+                max_batch_size=max_batch_size,
+                max_latency_ms=max_latency_ms,
+            )
+            self.write_queue.start()
+            logger.info(
+                f"Write queue started (batch={max_batch_size}, "
+                f"latency={max_latency_ms}ms)"
+            )
+
+    async def stop_write_queue(self) -> None:
+        if self.write_queue is not None:
+            await self.write_queue.stop()
+            self.write_queue = None
+
+    async def _write(self, intent: WriteIntent) -> Any:
+        """
+        Run a write intent and commit it: through the write queue when it is
+        running, otherwise in a transaction of its own.
+        """
+        if self.write_queue is not None and self.write_queue.running:
+            return await self.write_queue.submit(intent)
+        async with self.get_db() as db:
+            result = await intent(db)
+            await db.commit()
+            return result
 
     # -----------------------
     # Subscription methods
@@ -142,11 +498,12 @@ class SQLAlchemySubscriptionDB:
     async def add_subscription(
         self, email: str, topics: list[str], notes: str | None = None
     ):
-        async with self.get_db() as db:
-            logger.info(
-                "💾 add_subscription called with email=%s, topics=%s", email, topics
-            )
+        logger.info(
+            "💾 add_subscription called with email=%s, topics=%s", email, topics
+        )
+        tag_ids = await self.resolve_tag_ids(topics)
 
+        async def write(db: AsyncSession) -> Dict[str, Any]:
             result = await db.execute(
                 select(Subscription)
                 .where(Subscription.email == email)
@@ -157,63 +514,299 @@ class SQLAlchemySubscriptionDB:
             if subscription:
                 if notes:
                     subscription.notes = notes
+                linked = {t.id for t in subscription.tags}
             else:
-                subscription = Subscription(email=email, notes=notes)
+                # New subscribers get trends stored from now on, not the
+                # whole retained history of their topics
+                newest = await db.scalar(select(func.coalesce(func.max(Trend.id), 0)))
+                subscription = Subscription(
+                    email=email, notes=notes, last_delivered_trend_id=newest
+                )
                 db.add(subscription)
                 await db.flush()
-                await db.refresh(subscription, ["tags"])
-
-            for topic in topics:
-                tag_result = await db.execute(select(Tag).where(Tag.name == topic))
-                tag = tag_result.scalar_one_or_none()
-                if not tag:
-                    tag = Tag(name=topic)
-                    db.add(tag)
-                    await db.flush()
-                if tag not in subscription.tags:
-                    subscription.tags.append(tag)
+                linked = set()
 
-            await db.commit()
-            await db.refresh(subscription, ["tags"])
+            new_links = [
+                {"subscription_id": subscription.id, "tag_id": tag_id}
+                for tag_id in tag_ids.values()
+                if tag_id not in linked
+            ]
+            if new_links:
+                await db.execute(subscription_tags.insert(), new_links)
+
+            tag_names = await db.execute(
+                select(Tag.name)
+                .join(subscription_tags, subscription_tags.c.tag_id == Tag.id)
+                .where(subscription_tags.c.subscription_id == subscription.id)
+                .order_by(Tag.id)
+            )
             return {
                 "id": subscription.id,
                 "email": subscription.email,
-                "tags": [t.name for t in subscription.tags],
+                "tags": tag_names.scalars().all(),
             }
 
+        return await self._write(write)
+
     # -----------------------
     # Tag methods
     # -----------------------
     async def add_tag(self, tag: Tag):
-        async with self.get_db() as db:
+        async def write(db: AsyncSession) -> Tag:
             db.add(tag)
-            await db.commit()
-            await db.refresh(tag)
+            await db.flush()
             return tag
 
+        await self._write(write)
+        self._cache_tag(tag.name, tag.id)
+        return tag
+
+    def _cache_tag(self, name: str, tag_id: int) -> None:
+        self._tag_cache[name] = tag_id
+        self._tag_cache.move_to_end(name)
+        while len(self._tag_cache) > self._tag_cache_size:
+            self._tag_cache.popitem(last=False)
+
+    async def resolve_tag_ids(self, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Map tag names to ids, creating missing tags.
+
+        Served from the in-process cache when possible. Misses are looked up
+        and created under a lock in their own committed transaction, so two
+        coroutines racing on a new tag insert it only once. Call this before
+        opening the session that uses the ids.
+        """
+        names = list(dict.fromkeys(names))
+        # Ids are collected as they are found: caching more names than the
+        # cache holds (or a concurrent caller) may evict them again
+        resolved: Dict[str, int] = {}
+        missing = []
+        for name in names:
+            tag_id = self._tag_cache.get(name)
+            if tag_id is None:
+                missing.append(name)
+            else:
+                self._tag_cache.move_to_end(name)
+                resolved[name] = tag_id
+
+        if missing:
+            async with self._tag_lock:
+                # A concurrent caller may have resolved them while we waited
+                still_missing = []
+                for name in missing:
+                    tag_id = self._tag_cache.get(name)
+                    if tag_id is None:
+                        still_missing.append(name)
+                    else:
+                        resolved[name] = tag_id
+                if still_missing:
+                    for name, tag_id in (
+                        await self._load_or_create_tags(still_missing)
+                    ).items():
+                        self._cache_tag(name, tag_id)
+                        resolved[name] = tag_id
+
+        return {name: resolved[name] for name in names}
+
+    async def _load_or_create_tags(self, names: List[str]) -> Dict[str, int]:
+        async def write(db: AsyncSession) -> Dict[str, int]:
+            result = await db.execute(
+                select(Tag.name, Tag.id).where(Tag.name.in_(names))
+            )
+            found = dict(result.all())
+            new_names = [name for name in names if name not in found]
+            if new_names:
+                result = await db.execute(
+                    insert(Tag).returning(Tag.name, Tag.id),
+                    [{"name": name} for name in new_names],
+                )
+                found.update(result.all())
+                logger.info(f"Created tags: {new_names}")
+            return found
+
+        try:
+            return await self._write(write)
+        except IntegrityError:
+            # Created by another process between our SELECT and INSERT
+            async with self.get_db() as db:
+                result = await db.execute(
+                    select(Tag.name, Tag.id).where(Tag.name.in_(names))
+                )
+                return dict(result.all())
+
     # -----------------------
     # Trend methods
     # -----------------------
     async def add_trend(self, topic: str, summary: str, url: str, tag: str):
-        async with self.get_db() as db:
-            trend = Trend(topic=topic, summary=summary, url=url, notified=False)
-            db.add(trend)
-            await db.flush()
+        result = await self.add_trends_bulk(
+            [{"topic": topic, "summary": summary, "link": url}], tag
+        )
+        if result["inserted"]:
+            logger.info(f"✅ Trend saved with tags: {tag}")
+        return result
 
-            results = await db.execute(select(Tag).where(Tag.name == tag))
-            tag_obj = results.scalar_one_or_none()
-            if not tag_obj:
-                tag_obj = Tag(name=tag)
-                db.add(tag_obj)
-                await db.flush()
+    async def add_trends_bulk(self, items: Iterable[Any], tag: str) -> Dict[str, Any]:
+        """
+        Insert many trends under one tag in a single transaction.
 
-            # if tag_obj not in trend.tags:
-            # trend.tags.append(tag_obj)
-            await db.execute(
-                trend_tags.insert().values(trend_id=trend.id, tag_id=tag_obj.id)
+        The tag is resolved once, duplicates (same trend fingerprint, either
+        already stored or repeated within ``items``) are skipped, and the
+        remaining trends plus their ``trend_tags`` rows are written with
+        multi-row INSERTs.
+
+        Args:
+            items: NewsItem objects or dicts with ``topic``, ``summary`` and ``link``
+            tag: Tag name to attach to every inserted trend
+
+        Returns:
+            dict with ``inserted`` (rows with their new ``id``) and ``skipped``
+            (rows rejected as duplicates or incomplete, with a ``reason``)
+        """
+        inserted: List[Dict[str, Any]] = []
+        skipped: List[Dict[str, Any]] = []
+        candidates: List[Dict[str, Any]] = []
+        seen = set()
+
+        for item in items:
+            row = {
+                "topic": (_item_field(item, "topic") or "").strip(),
+                "summary": (_item_field(item, "summary") or "").strip(),
+                "link": (_item_field(item, "link") or "").strip(),
+            }
+            if not row["topic"] or not row["link"]:
+                skipped.append(_public_row(row, reason="incomplete"))
+                continue
+            row["url_hash"], row["title_hash"] = trend_fingerprint(
+                row["topic"], row["link"]
             )
-            await db.commit()
-            logger.info(f"✅ Trend saved with tags: {tag}")
+            key = (row["url_hash"], row["title_hash"])
+            if key in seen:
+                skipped.append(_public_row(row, reason="duplicate"))
+                continue
+            seen.add(key)
+            candidates.append(row)
+
+        if not candidates:
+            return {"inserted": inserted, "skipped": skipped}
+
+        tag_id = (await self.resolve_tag_ids([tag]))[tag]
+        skipped_before = len(skipped)
+
+        async def write(db: AsyncSession) -> None:
+            # The duplicate check runs in the same transaction as the insert;
+            # reset outputs in case the write queue replays this intent
+            inserted.clear()
+            del skipped[skipped_before:]
+
+            existing_result = await db.execute(
+                self._stored_fingerprints_query({key[0] for key in seen})
+            )
+            existing = {tuple(row) for row in existing_result.all()}
+
+            new_rows = []
+            for row in candidates:
+                if (row["url_hash"], row["title_hash"]) in existing:
+                    skipped.append(_public_row(row, reason="duplicate"))
+                else:
+                    new_rows.append(row)
+            if not new_rows:
+                return
+
+            # A concurrent batch (another worker or process, or writes that
+            # bypass the queue) may store the same fingerprint after the check
+            # above; those rows are skipped by the unique index, not fatal
+            id_result = await db.execute(
+                self._insert_new_trends().returning(
+                    Trend.id, Trend.url_hash, Trend.title_hash
+                ),
+                [
+                    {
+                        "topic": row["topic"],
+                        "summary": row["summary"],
+                        "url": row["link"],
+                        "url_hash": row["url_hash"],
+                        "title_hash": row["title_hash"],
+                        "notified": False,
+                    }
+                    for row in new_rows
+                ],
+            )
+            ids = {(r.url_hash, r.title_hash): r.id for r in id_result.all()}
+            for row in new_rows:
+                trend_id = ids.get((row["url_hash"], row["title_hash"]))
+                if trend_id is None:
+                    skipped.append(_public_row(row, reason="duplicate"))
+                else:
+                    inserted.append({"id": trend_id, **_public_row(row)})
+            if inserted:
+                await db.execute(
+                    trend_tags.insert(),
+                    [{"trend_id": row["id"], "tag_id": tag_id} for row in inserted],
+                )
+
+        await self._write(write)
+        logger.info(
+            f"Bulk insert for tag '{tag}': {len(inserted)} inserted, "
+            f"{len(skipped)} skipped"
+        )
+        return {"inserted": inserted, "skipped": skipped}
+
+    def _insert_new_trends(self):
+        """INSERT into trends that skips rows whose fingerprint is stored."""
+        fingerprint = ["url_hash", "title_hash"]
+        dialect = self.engine.dialect.name
+        if dialect == "sqlite":
+            return sqlite_insert(Trend).on_conflict_do_nothing(
+                index_elements=fingerprint
+            )
+        if dialect == "postgresql":
+            return postgresql_insert(Trend).on_conflict_do_nothing(
+                index_elements=fingerprint
+            )
+        return insert(Trend)
+
+    @staticmethod
+    def _stored_fingerprints_query(url_hashes: Iterable[str]):
+        """(url_hash, title_hash) of live or archived trends with these URLs."""
+        url_hashes = list(url_hashes)
+        return union_all(
+            select(Trend.url_hash, Trend.title_hash).where(
+                Trend.url_hash.in_(url_hashes)
+            ),
+            select(TrendArchive.url_hash, TrendArchive.title_hash).where(
+                TrendArchive.url_hash.in_(url_hashes)
+            ),
+        )
+
+    async def filter_new_trends(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Return the ``items`` that are not stored yet, in one query.
+
+        Items (NewsItem objects or dicts with ``topic`` and ``link``) whose
+        fingerprint matches a live or archived trend, or an earlier item in
+        the same batch, are dropped, as are items without a topic or link.
+        """
+        fingerprinted = []
+        seen = set()
+        for item in items:
+            topic = (_item_field(item, "topic") or "").strip()
+            link = (_item_field(item, "link") or "").strip()
+            if not topic or not link:
+                continue
+            key = trend_fingerprint(topic, link)
+            if key in seen:
+                continue
+            seen.add(key)
+            fingerprinted.append((key, item))
+        if not fingerprinted:
+            return []
+
+        async with self.get_db() as db:
+            result = await db.execute(
+                self._stored_fingerprints_query({key[0] for key in seen})
+            )
+            existing = {tuple(row) for row in result.all()}
+        return [item for key, item in fingerprinted if key not in existing]
 
     async def get_all_topics(self, limit: int = 10) -> List[str]:
         async with self.get_db() as db:
@@ -222,18 +815,31 @@ class SQLAlchemySubscriptionDB:
             )
             return [row[0] for row in result.all()]
 
-    def select_trend_by_topic_or_link(self, topic: str, link: str):
-        """Build query for finding trends by topic or link (case-insensitive)."""
-        return (
-            select(Trend)
-            .where(
-                and_(
-                    (func.lower(Trend.topic) == func.lower(topic)),
-                    (func.lower(Trend.url) == func.lower(link)),
-                )
+    async def get_topic_subscriber_counts(self) -> Dict[str, int]:
+        """Subscriber count of every tag (0 for tags nobody subscribes to)."""
+        async with self.get_db() as db:
+            result = await db.execute(
+                select(Tag.name, func.count(subscription_tags.c.subscription_id))
+                .outerjoin(subscription_tags, subscription_tags.c.tag_id == Tag.id)
+                .group_by(Tag.id, Tag.name)
             )
-            .limit(1)
-        )
+            return {name: count for name, count in result.all()}
+
+    def select_trend_by_topic_or_link(self, topic: str, link: str):
+        """
+        Build an index-backed query for a live or archived trend with the same
+        fingerprint.
+        """
+        url_hash, title_hash = trend_fingerprint(topic, link)
+        return union_all(
+            select(Trend.id).where(
+                Trend.url_hash == url_hash, Trend.title_hash == title_hash
+            ),
+            select(TrendArchive.id).where(
+                TrendArchive.url_hash == url_hash,
+                TrendArchive.title_hash == title_hash,
+            ),
+        ).limit(1)
 
     async def db_exists(self, topic: str, link: str) -> bool:
         """Check if a trend with given topic or link already exists."""
@@ -248,8 +854,69 @@ class SQLAlchemySubscriptionDB:
                 logger.error(f"Database existence check failed: {e}")
                 return False
 
+    # -----------------------
+    # Search methods
+    # -----------------------
+    async def search_trends(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Full-text search over stored trend topics and summaries.
+
+        Results are ranked by bm25 (topic weighted above summary) with a boost
+        for recent trends. Falls back to a LIKE scan when FTS5 is unavailable.
+
+        Returns:
+            List of ``{"id", "topic", "summary", "url", "created_at", "score"}``
+        """
+        terms = _SEARCH_TERM_RE.findall(query)
+        if not terms:
+            return []
+
+        async with self.get_db() as db:
+            if self.engine.dialect.name == "sqlite":
+                try:
+                    result = await db.execute(
+                        text(
+                            "SELECT t.id, t.topic, t.summary, t.url, t.created_at, "
+                            "bm25(trends_fts, 2.0, 1.0) - :recency_weight / "
+                            "(1.0 + julianday('now') - julianday(t.created_at)) "
+                            "AS score "
+                            "FROM trends_fts JOIN trends t ON t.id = trends_fts.rowid "
+                            "WHERE trends_fts MATCH :match "
+                            "ORDER BY score LIMIT :limit"
+                        ).columns(created_at=DateTime),
+                        {
+                            "match": " OR ".join(f'"{term}"*' for term in terms),
+                            "recency_weight": SEARCH_RECENCY_WEIGHT,
+                            "limit": limit,
+                        },
+                    )
+                    return [_search_row(row) for row in result.all()]
+                except OperationalError as e:
+                    logger.warning(f"Full-text search failed, using LIKE: {e}")
+                    await db.rollback()
+
+            conditions = []
+            for term in terms:
+                pattern = f"%{term.lower()}%"
+                conditions.append(func.lower(Trend.topic).like(pattern))
+                conditions.append(func.lower(Trend.summary).like(pattern))
+            result = await db.execute(
+                select(
+                    Trend.id,
+                    Trend.topic,
+                    Trend.summary,
+                    Trend.url,
+                    Trend.created_at,
+                    literal(None).label("score"),
+                )
+                .where(or_(*conditions))
+                .order_by(Trend.id.desc())
+                .limit(limit)
+            )
+            return [_search_row(row) for row in result.all()]
+
     async def get_trends_for_user(self, email: str) -> list[Trend]:
-        """Get unnotified trends matching user's subscribed tags."""
+        """Get trends in the user's tags that were not delivered to them yet."""
         async with self.get_db() as db:
             result = await db.execute(
                 select(Subscription)
@@ -267,10 +934,234 @@ class SQLAlchemySubscriptionDB:
 
             trend_result = await db.execute(
                 select(Trend)
-                .join(Trend.tags)
-                .where(Tag.id.in_(tag_ids))
-                .where(Trend.notified.is_(False))
+                .join(trend_tags, trend_tags.c.trend_id == Trend.id)
+                .where(trend_tags.c.tag_id.in_(tag_ids))
+                .where(trend_tags.c.trend_id > subscription.last_delivered_trend_id)
+                .order_by(Trend.id)
                 .options(selectinload(Trend.tags))
             )
             trends = trend_result.scalars().unique().all()
             return trends
+
+    # -----------------------
+    # Delivery methods
+    # -----------------------
+    def _delivery_plan_query(self):
+        """(subscriber, undelivered trend) pairs ordered by subscriber, then trend."""
+        return (
+            select(
+                Subscription.id,
+                Subscription.email,
+                Trend.id,
+                Trend.topic,
+                Trend.summary,
+                Trend.url,
+            )
+            .join(
+                subscription_tags,
+                subscription_tags.c.subscription_id == Subscription.id,
+            )
+            .join(trend_tags, trend_tags.c.tag_id == subscription_tags.c.tag_id)
+            .join(Trend, Trend.id == trend_tags.c.trend_id)
+            .where(trend_tags.c.trend_id > Subscription.last_delivered_trend_id)
+            .distinct()
+            .order_by(Subscription.id, Trend.id)
+        )
+
+    @staticmethod
+    def _group_delivery_rows(rows) -> List[Dict[str, Any]]:
+        plan: List[Dict[str, Any]] = []
+        trends_by_id: Dict[int, Dict[str, Any]] = {}
+        for sub_id, email, trend_id, topic, summary, url in rows:
+            if not plan or plan[-1]["subscription_id"] != sub_id:
+                plan.append({"subscription_id": sub_id, "email": email, "trends": []})
+            trend = trends_by_id.get(trend_id)
+            if trend is None:
+                trend = trends_by_id[trend_id] = {
+                    "id": trend_id,
+                    "topic": topic,
+                    "summary": summary,
+                    "url": url,
+                }
+            plan[-1]["trends"].append(trend)
+        return plan
+
+    async def get_delivery_plan(self) -> List[Dict[str, Any]]:
+        """
+        Fetch every (subscriber, undelivered trend) pair in one query.
+
+        A trend is pending for a subscriber when it is tagged with one of their
+        tags and its id is above their ``last_delivered_trend_id`` cursor.
+
+        Returns:
+            One entry per subscriber with pending trends, ordered by subscription id:
+            ``{"subscription_id", "email", "trends": [{"id", "topic", "summary",
+            "url"}, ...]}``. Trends are ordered by id and their dicts are shared
+            between subscribers.
+        """
+        async with self.get_db() as db:
+            result = await db.execute(self._delivery_plan_query())
+            return self._group_delivery_rows(result.all())
+
+    async def iter_delivery_plan(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream the delivery plan one page of ``batch_size`` subscribers at a time.
+
+        Yields lists of plan entries shaped like ``get_delivery_plan``; each page
+        costs two queries regardless of how many trends it holds.
+        """
+        last_id = 0
+        while True:
+            async with self.get_db() as db:
+                id_result = await db.execute(
+                    select(Subscription.id)
+                    .where(Subscription.id > last_id)
+                    .order_by(Subscription.id)
+                    .limit(batch_size)
+                )
+                sub_ids = id_result.scalars().all()
+                if not sub_ids:
+                    return
+                result = await db.execute(
+                    self._delivery_plan_query().where(
+                        Subscription.id > last_id, Subscription.id <= sub_ids[-1]
+                    )
+                )
+                rows = result.all()
+            last_id = sub_ids[-1]
+            entries = self._group_delivery_rows(rows)
+            if entries:
+                yield entries
+
+    async def record_deliveries(self, cursors: Dict[int, int]) -> int:
+        """
+        Advance delivery cursors for many subscriptions in one bulk UPDATE.
+
+        Args:
+            cursors: subscription id -> highest trend id delivered to it
+
+        Cursors only move forward, so a stale value never re-sends old trends.
+        """
+        if not cursors:
+            return 0
+        table = Subscription.__table__
+
+        async def write(db: AsyncSession) -> None:
+            await db.execute(
+                update(table)
+                .where(
+                    table.c.id == bindparam("b_id"),
+                    table.c.last_delivered_trend_id < bindparam("b_cursor"),
+                )
+                .values(last_delivered_trend_id=bindparam("b_cursor")),
+                [
+                    {"b_id": sub_id, "b_cursor": cursor}
+                    for sub_id, cursor in cursors.items()
+                ],
+            )
+
+        await self._write(write)
+        return len(cursors)
+
+    async def count_subscriptions(self) -> int:
+        async with self.get_db() as db:
+            return await db.scalar(select(func.count()).select_from(Subscription))
+
+    # -----------------------
+    # Retention methods
+    # -----------------------
+    def _archivable_trends_query(self, older_than: datetime, batch_size: int):
+        """
+        Trends created before ``older_than`` that every subscriber of their
+        tags has already received (their cursor is at or past the trend id).
+        """
+        pending = (
+            select(trend_tags.c.trend_id)
+            .join(
+                subscription_tags,
+                subscription_tags.c.tag_id == trend_tags.c.tag_id,
+            )
+            .join(Subscription, Subscription.id == subscription_tags.c.subscription_id)
+            .where(
+                trend_tags.c.trend_id == Trend.id,
+                Subscription.last_delivered_trend_id < Trend.id,
+            )
+            .exists()
+        )
+        return (
+            select(Trend)
+            .where(Trend.created_at < older_than, ~pending)
+            .order_by(Trend.id)
+            .limit(batch_size)
+        )
+
+    async def archive_trends(
+        self,
+        older_than: datetime,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batches: int | None = None,
+        pause_seconds: float = 0.05,
+    ) -> int:
+        """
+        Move delivered trends older than ``older_than`` to ``trends_archive``.
+
+        Works in batches of ``batch_size`` rows, each in its own short
+        transaction followed by a pause, so other writers are never blocked for
+        long. Fingerprints move with the rows and keep deduplicating.
+
+        Returns:
+            Number of trends archived
+        """
+        archived = 0
+        batches = 0
+
+        async def write(db: AsyncSession) -> int:
+            result = await db.execute(
+                self._archivable_trends_query(older_than, batch_size)
+            )
+            trends = result.scalars().all()
+            if not trends:
+                return 0
+
+            ids = [t.id for t in trends]
+            await db.execute(
+                insert(TrendArchive),
+                [
+                    {
+                        "id": t.id,
+                        "topic": t.topic,
+                        "summary": t.summary,
+                        "url": t.url,
+                        "source": t.source,
+                        "url_hash": t.url_hash,
+                        "title_hash": t.title_hash,
+                        "tags": json.dumps([tag.name for tag in t.tags]),
+                        "created_at": t.created_at,
+                    }
+                    for t in trends
+                ],
+            )
+            await db.execute(trend_tags.delete().where(trend_tags.c.trend_id.in_(ids)))
+            await db.execute(delete(Trend).where(Trend.id.in_(ids)))
+            return len(ids)
+
+        while max_batches is None or batches < max_batches:
+            moved = await self._write(write)
+            archived += moved
+            batches += 1
+            if moved < batch_size:
+                break
+            await asyncio.sleep(pause_seconds)
+
+        if archived:
+            logger.info(f"Archived {archived} trends older than {older_than}")
+        return archived
+
+    async def count_trend_rows(self) -> Dict[str, int]:
+        """Row counts of the live and archive trend tables."""
+        async with self.get_db() as db:
+            live = await db.scalar(select(func.count()).select_from(Trend))
+            archived = await db.scalar(select(func.count()).select_from(TrendArchive))
+        return {"live": live, "archived": archived}
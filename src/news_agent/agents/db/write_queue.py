@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger("subscription_db")
+
+# A unit of work executed inside the writer's transaction. It must not commit
+# or roll back; the queue does that for the whole batch.
+WriteIntent = Callable[[AsyncSession], Awaitable[Any]]
+
+_STOP = object()
+
+
+class BatchingWriteQueue:
+    """
+    Single writer task that group-commits queued write intents.
+
+    SQLite admits one writer at a time, so instead of every caller opening its
+    own write transaction, callers ``submit`` an intent and await its result.
+    The writer drains up to ``max_batch_size`` intents, waiting at most
+    ``max_latency_ms`` after the first one, and runs them in one transaction.
+    If the batch fails, each intent is replayed in its own transaction so only
+    the failing caller sees the error.
+    """
+
+    def __init__(
+        self,
+        session_maker,
+        max_batch_size: int = 64,
+        max_latency_ms: float = 10.0,
+    ):
+        self.session_maker = session_maker
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+        # Counters for logging / tests
+        self.batches_committed = 0
+        self.intents_committed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="db-write-queue")
+
+    async def stop(self) -> None:
+        """Commit everything already queued, then stop the writer task."""
+        if not self.running:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def submit(self, intent: WriteIntent) -> Any:
+        """
+        Queue ``intent`` and wait until its batch is committed. Raises
+        ``RuntimeError`` if the writer is not running or stops first.
+        """
+        if not self.running:
+            raise RuntimeError("Write queue is not running.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((intent, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        batch: List[Tuple[WriteIntent, asyncio.Future]] = []
+        try:
+            while not stopping:
+                batch = []
+                item = await self._queue.get()
+                if item is _STOP:
+                    break
+
+                batch.append(item)
+                deadline = loop.time() + self.max_latency
+                while len(batch) < self.max_batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(self._queue.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                await self._commit_batch(batch)
+        finally:
+            # However the writer ends (stop(), cancellation, an error escaping
+            # the session), nobody may be left awaiting a write it won't do
+            self._fail_pending(batch)
+
+    def _fail_pending(self, batch: List[Tuple[WriteIntent, asyncio.Future]]) -> None:
+        pending = list(batch)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is not _STOP:
+                pending.append(item)
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(
+                    RuntimeError("Write queue stopped before the write was committed.")
+                )
+
+    async def _commit_batch(self, batch: List[Tuple[WriteIntent, asyncio.Future]]):
+        batch = [(intent, future) for intent, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            async with self.session_maker() as session:
+                results = []
+                for intent, _ in batch:
+                    results.append(await intent(session))
+                await session.commit()
+        except Exception as e:
+            if len(batch) > 1:
+                logger.warning(
+                    f"Group commit of {len(batch)} writes failed ({e}); "
+                    "retrying them one by one"
+                )
+                for intent, future in batch:
+                    await self._commit_batch([(intent, future)])
+            else:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches_committed += 1
+        self.intents_committed += len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
-from agents.mcp import MCPServerStdio
+from agents.mcp import MCPServer
 
 from .handlers import BaseMCPHandler, FirecrawlHandler, SerpAPISearchHandler
 
@@ -16,6 +16,8 @@ class AbstractIngestion:
 
     def __init__(self, handlers: List[BaseMCPHandler]):
         self.handlers = handlers
+        self._tool_owners: Optional[Dict[str, BaseMCPHandler]] = None
+        self._health_tasks: List[asyncio.Task] = []
 
     @classmethod
     async def from_config(cls, config_path: str) -> AbstractIngestion:
@@ -25,7 +27,8 @@ class AbstractIngestion:
         with open(config_path, "r") as f:
             config = json.load(f)
 
-        servers: Dict[str, dict] = config.get("mcp", {}).get("servers", {})
+        mcp_config = config.get("mcp", {})
+        servers: Dict[str, dict] = mcp_config.get("servers", {})
         handlers_obj = []
 
         for name, params in servers.items():
@@ -40,9 +43,56 @@ class AbstractIngestion:
 
             handlers_obj.append(handler)
         await asyncio.gather(*(handler.connect() for handler in handlers_obj))
-        return cls(handlers=handlers_obj)
+        ingestion = cls(handlers=handlers_obj)
 
-    def get_mcp_servers(self) -> List[MCPServerStdio]:
+        interval = mcp_config.get("health_check_interval_seconds")
+        if interval:
+            ingestion.start_health_checks(interval)
+        return ingestion
+
+    def start_health_checks(self, interval_seconds: float = 30.0) -> None:
+        """
+        Probe every handler's connection pool in the background.
+        """
+        if self._health_tasks:
+            return
+        self._health_tasks = [
+            asyncio.create_task(handler.run_health_checks(interval_seconds))
+            for handler in self.handlers
+            if handler.connected
+        ]
+
+    async def cleanup(self) -> None:
+        """
+        Stop health checks and close every MCP connection.
+        """
+        for task in self._health_tasks:
+            task.cancel()
+        self._health_tasks = []
+        await asyncio.gather(*(handler.cleanup() for handler in self.handlers))
+        self._tool_owners = None
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> List[Any]:
+        """
+        Call ``tool_name`` on whichever connected MCP server provides it.
+
+        Raises:
+            ValueError: If no connected server exposes the tool
+        """
+        if self._tool_owners is None:
+            owners: Dict[str, BaseMCPHandler] = {}
+            for handler in self.handlers:
+                if handler.connected:
+                    for name in await handler.list_tool_names():
+                        owners.setdefault(name, handler)
+            self._tool_owners = owners
+
+        handler = self._tool_owners.get(tool_name)
+        if handler is None:
+            raise ValueError(f"No connected MCP server provides tool: {tool_name}")
+        return await handler.call_tool(tool_name, arguments)
+
+    def get_mcp_servers(self) -> List[MCPServer]:
         """
         Get a list of connected MCP server instances.
         """
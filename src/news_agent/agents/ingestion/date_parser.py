@@ -0,0 +1,152 @@
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Google News mostly reports relative ages ("3 hours ago"); older articles get
+# an absolute date. Results are cached per string: relative strings cache the
+# offset (not the timestamp), so a cached entry stays correct as time passes.
+PARSE_CACHE_SIZE = 4096
+
+_UNIT_SECONDS = {
+    "second": 1,
+    "sec": 1,
+    "s": 1,
+    "minute": 60,
+    "min": 60,
+    "m": 60,
+    "hour": 3600,
+    "hr": 3600,
+    "h": 3600,
+    "day": 86400,
+    "d": 86400,
+    "week": 7 * 86400,
+    "wk": 7 * 86400,
+    "w": 7 * 86400,
+    "month": 30 * 86400,
+    "mo": 30 * 86400,
+    "year": 365 * 86400,
+    "yr": 365 * 86400,
+    "y": 365 * 86400,
+}
+_NUMBER_WORDS = {"a": 1, "an": 1, "one": 1}
+_RELATIVE_RE = re.compile(
+    r"^(\d+|an?|one)\s*("
+    + "|".join(sorted(_UNIT_SECONDS, key=len, reverse=True))
+    # Plural "s" is optional; "mins", "hrs", "days" ...
+    + r")s?\.?\s+ago$"
+)
+_RELATIVE_WORDS = {
+    "just now": timedelta(0),
+    "now": timedelta(0),
+    "today": timedelta(0),
+    "yesterday": timedelta(days=1),
+}
+
+# Absolute formats seen in SerpAPI results, most common first
+_ABSOLUTE_FORMATS = (
+    "%m/%d/%Y, %I:%M %p, %z UTC",  # 10/17/2024, 07:00 AM, +0000 UTC
+    "%b %d, %Y",  # Oct 17, 2024
+    "%B %d, %Y",  # October 17, 2024
+    "%d %b %Y",  # 17 Oct 2024
+    "%d %B %Y",  # 17 October 2024
+    "%m/%d/%Y",  # 10/17/2024
+    "%Y-%m-%d %H:%M:%S",
+)
+# Current-year dates are shown without a year ("Oct 17")
+_MONTH_DAY_FORMATS = ("%b %d", "%B %d")
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_relative(text: str) -> Optional[timedelta]:
+    """Age of a relative date string, e.g. ``"3 hours ago"`` -> 3h."""
+    text = text.strip().lower()
+    if text in _RELATIVE_WORDS:
+        return _RELATIVE_WORDS[text]
+
+    match = _RELATIVE_RE.match(text)
+    if match is None:
+        return None
+    count, unit = match.groups()
+    count = _NUMBER_WORDS.get(count) or int(count)
+    return timedelta(seconds=count * _UNIT_SECONDS[unit])
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_absolute(text: str) -> Optional[datetime]:
+    """Timezone-aware datetime for an absolute date string (UTC if naive)."""
+    text = text.strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        for fmt in _ABSOLUTE_FORMATS:
+            try:
+                parsed = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+    if parsed is None:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_month_day(text: str) -> Optional[Tuple[int, int]]:
+    for fmt in _MONTH_DAY_FORMATS:
+        try:
+            # Leap year so "Feb 29" parses
+            parsed = datetime.strptime(f"2000 {text.strip()}", f"%Y {fmt}")
+            return parsed.month, parsed.day
+        except ValueError:
+            continue
+    return None
+
+
+def parse_published_at(
+    text: Optional[str], now: Optional[datetime] = None
+) -> Optional[datetime]:
+    """
+    Parse a Google News ``date`` field into an aware UTC datetime.
+
+    Args:
+        text: e.g. "3 hours ago", "yesterday", "Oct 17, 2024",
+            "10/17/2024, 07:00 AM, +0000 UTC" or an ISO-8601 string
+        now: Reference time for relative dates. Defaults to the current time
+
+    Returns:
+        The publication time, or None if the string is not recognised
+    """
+    if not text:
+        return None
+    now = now or datetime.now(timezone.utc)
+
+    age = parse_relative(text)
+    if age is not None:
+        return now - age
+
+    parsed = parse_absolute(text)
+    if parsed is not None:
+        return parsed
+
+    month_day = _parse_month_day(text)
+    if month_day is not None:
+        for year in (now.year, now.year - 1):
+            try:
+                parsed = datetime(year, *month_day, tzinfo=timezone.utc)
+            except ValueError:  # Feb 29 outside a leap year
+                continue
+            # "Dec 30" seen on Jan 2 is last year
+            if parsed <= now + timedelta(days=1):
+                return parsed
+    return None
+
+
+def hours_since(text: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Hours between the publication time in ``text`` and ``now``."""
+    now = now or datetime.now(timezone.utc)
+    published_at = parse_published_at(text, now)
+    if published_at is None:
+        return None
+    return (now - published_at).total_seconds() / 3600
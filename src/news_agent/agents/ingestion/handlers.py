@@ -1,36 +1,155 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Dict, Optional
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-from agents.mcp import MCPServerStdio
+import anyio
+import httpx
+from agents.mcp import MCPServer, MCPServerStdio, MCPServerStreamableHttp
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, CallToolResult
 
-# logger = logging.getLogger(__name__)
+from news_agent.agents.ingestion.page_cache import PageCache
+
+logger = logging.getLogger(__name__)
+
+# Keys of a server entry in ingest_mcp_config.json that configure the handler
+# rather than the MCP server itself
+HANDLER_OPTIONS = ("pool_size", "page_cache")
+
+
+class MCPUnavailableError(RuntimeError):
+    """No connection to the MCP server came up within the caller's wait."""
+
+
+def is_transport_error(error: BaseException) -> bool:
+    """
+    Whether ``error`` means the connection itself is broken (closed pipe,
+    dead child process, dropped HTTP stream). Timeouts and errors raised by
+    the tool leave the connection usable.
+    """
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    if isinstance(error, TimeoutError):
+        return False
+    return isinstance(
+        error,
+        (
+            OSError,
+            EOFError,
+            anyio.ClosedResourceError,
+            anyio.BrokenResourceError,
+            anyio.EndOfStream,
+            httpx.TransportError,
+        ),
+    )
 
 
 class BaseMCPHandler(abc.ABC):
     """
     Abstract base class for MCP handlers.
+
+    ``params`` with a ``url`` connect to an already running streamable-HTTP
+    MCP endpoint (shared by every app worker); otherwise ``command``/``args``
+    launch the server as a stdio child process.
+
+    The handler keeps ``pool_size`` connections to the server and dispatches
+    calls round-robin over the healthy ones, so concurrent tool calls don't
+    serialize on one stdio pipe. A connection that breaks during a call or
+    fails a health probe is reconnected in the background with exponential
+    backoff; callers wait at most ``unavailable_timeout`` for one to come
+    back before ``MCPUnavailableError`` is raised.
+
+    Handlers whose stdio server keeps per-process state (caches, rate limits,
+    quotas) set ``STATEFUL_SERVER`` and only accept ``pool_size`` 1 unless
+    they connect to a shared ``url``.
     """
 
-    def __init__(self, name: str, params: Dict[str, Any]):
+    STATEFUL_SERVER = False
+
+    def __init__(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        pool_size: Optional[int] = None,
+        health_check_timeout: float = 10.0,
+        reconnect_backoff_seconds: float = 0.5,
+        max_reconnect_backoff_seconds: float = 30.0,
+        unavailable_timeout: float = 10.0,
+    ):
         self.name = name
-        self.params = params
-        self.server: Optional[MCPServerStdio] = None
+        self.params = {k: v for k, v in params.items() if k not in HANDLER_OPTIONS}
+        self.pool_size = max(pool_size or params.get("pool_size", 1), 1)
+        if self.STATEFUL_SERVER and self.pool_size > 1 and "url" not in self.params:
+            raise ValueError(
+                f"{name} keeps per-process state; pool_size must be 1 for a "
+                "stdio server (use a shared url to scale it)"
+            )
+        self.health_check_timeout = health_check_timeout
+        self.reconnect_backoff = reconnect_backoff_seconds
+        self.max_reconnect_backoff = max_reconnect_backoff_seconds
+        self.unavailable_timeout = unavailable_timeout
+
+        self.server: Optional[MCPServer] = None
         self.connected = False
+        self._pool: List[Optional[MCPServer]] = []
+        self._healthy: List[bool] = []
+        self._slot_locks: List[asyncio.Lock] = []
+        self._reconnect_tasks: Dict[int, asyncio.Task] = {}
+        self._available = asyncio.Event()
+        self._next = 0
+
+        # Counters for logging / tests
+        self.reconnects = 0
+
+    def _create_server(self) -> MCPServer:
+        if "url" not in self.params:
+            return MCPServerStdio(
+                params=self.params, name=self.name, client_session_timeout_seconds=10
+            )
+
+        params = dict(self.params)
+        transport = params.pop("transport", "streamable-http")
+        if transport != "streamable-http":
+            raise ValueError(f"Unsupported MCP transport for {self.name}: {transport}")
+        return MCPServerStreamableHttp(
+            params=params, name=self.name, client_session_timeout_seconds=10
+        )
+
+    async def _open(self) -> MCPServer:
+        server = self._create_server()
+        await server.connect()
+        return server
 
     async def connect(self) -> None:
         """
         Connect to the MCP server.
         """
-        self.server = MCPServerStdio(
-            params=self.params, name=self.name, client_session_timeout_seconds=10
+        results = await asyncio.gather(
+            *(self._open() for _ in range(self.pool_size)), return_exceptions=True
         )
-        await self.server.connect()
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if len(errors) == len(results):
+            raise errors[0]
+
+        self._pool = [None if isinstance(r, BaseException) else r for r in results]
+        self._healthy = [server is not None for server in self._pool]
+        self._slot_locks = [asyncio.Lock() for _ in self._pool]
+        self._available.set()
+        self.server = PooledMCPServer(self)
         self.connected = True
-        # logger.info(f"Connected to MCP server: {self.name}")
+        logger.info(
+            f"Connected to MCP server: {self.name} "
+            f"({sum(self._healthy)}/{self.pool_size} connections)"
+        )
+        for index, healthy in enumerate(self._healthy):
+            if not healthy:
+                self._schedule_reconnect(index)
 
-    def get_mcp_server(self) -> MCPServerStdio:
+    def get_mcp_server(self) -> MCPServer:
         """
         Get the MCP server instance.
         """
@@ -38,18 +157,289 @@ class BaseMCPHandler(abc.ABC):
             raise RuntimeError("MCP server is not connected.")
         return self.server
 
+    # -------------------------
+    # Pool
+    # -------------------------
+    @property
+    def healthy_connections(self) -> int:
+        return sum(self._healthy)
+
+    async def _checkout(self) -> tuple:
+        """
+        Next healthy connection, round-robin. If none is healthy, wait up to
+        ``unavailable_timeout`` for a background reconnect to bring one back.
+        """
+        deadline = asyncio.get_running_loop().time() + self.unavailable_timeout
+        while True:
+            size = len(self._pool)
+            for offset in range(size):
+                index = (self._next + offset) % size
+                if self._healthy[index]:
+                    self._next = index + 1
+                    return index, self._pool[index]
+
+            self._available.clear()
+            remaining = deadline - asyncio.get_running_loop().time()
+            try:
+                await asyncio.wait_for(self._available.wait(), max(remaining, 0))
+            except asyncio.TimeoutError:
+                raise MCPUnavailableError(
+                    f"No connection to MCP server {self.name} within "
+                    f"{self.unavailable_timeout}s"
+                )
+
+    async def dispatch(self, call: Callable[[MCPServer], Awaitable[Any]]) -> Any:
+        """
+        Run ``call`` on a pooled connection. If the connection turns out to be
+        broken, it is marked unhealthy and the call is retried once on another
+        one; any other error is the caller's.
+        """
+        if not self._pool:
+            raise RuntimeError("MCP server is not connected.")
+        index, server = await self._checkout()
+        try:
+            return await call(server)
+        except Exception as e:
+            if not is_transport_error(e):
+                raise
+            logger.warning(f"MCP server {self.name}[{index}] failed: {e!r}")
+            self._mark_unhealthy(index)
+
+        index, server = await self._checkout()
+        return await call(server)
+
+    def _mark_unhealthy(self, index: int) -> None:
+        if self._healthy[index]:
+            self._healthy[index] = False
+            self._schedule_reconnect(index)
+
+    def _schedule_reconnect(self, index: int) -> None:
+        task = self._reconnect_tasks.get(index)
+        if task is None or task.done():
+            self._reconnect_tasks[index] = asyncio.create_task(self._reconnect(index))
+
+    async def _reconnect(self, index: int) -> None:
+        """Replace connection ``index``, retrying with exponential backoff."""
+        async with self._slot_locks[index]:
+            if self._healthy[index]:
+                return
+
+            old = self._pool[index]
+            self._pool[index] = None
+            if old is not None:
+                try:
+                    await old.cleanup()
+                except Exception as e:
+                    logger.debug(f"Cleanup of {self.name}[{index}] failed: {e!r}")
+
+            attempt = 0
+            while True:
+                try:
+                    server = await self._open()
+                except Exception as e:
+                    attempt += 1
+                    delay = min(
+                        self.reconnect_backoff * 2 ** (attempt - 1),
+                        self.max_reconnect_backoff,
+                    )
+                    logger.warning(
+                        f"Reconnecting {self.name}[{index}] failed ({e!r}); "
+                        f"retrying in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                self._pool[index] = server
+                self._healthy[index] = True
+                self.reconnects += 1
+                self._available.set()
+                logger.info(f"Reconnected to MCP server: {self.name}[{index}]")
+                return
+
+    async def check_health(self) -> int:
+        """Probe every connection with ``list_tools``; returns healthy count."""
+
+        async def probe(index: int, server: Optional[MCPServer]) -> None:
+            if server is None or not self._healthy[index]:
+                return
+            try:
+                await asyncio.wait_for(server.list_tools(), self.health_check_timeout)
+            except Exception as e:
+                logger.warning(f"Health probe of {self.name}[{index}] failed: {e!r}")
+                self._mark_unhealthy(index)
+
+        await asyncio.gather(*(probe(i, s) for i, s in enumerate(self._pool)))
+        return self.healthy_connections
+
+    async def run_health_checks(self, interval_seconds: float = 30.0) -> None:
+        """Probe the pool every ``interval_seconds``."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"Health check of {self.name} failed: {e!r}")
+
+    async def cleanup(self) -> None:
+        for task in self._reconnect_tasks.values():
+            task.cancel()
+        for server in self._pool:
+            if server is not None:
+                try:
+                    await server.cleanup()
+                except Exception as e:
+                    logger.debug(f"Cleanup of {self.name} failed: {e!r}")
+        self._pool, self._healthy = [], []
+        self.connected = False
+
+    async def invoke_tool(
+        self, tool_name: str, arguments: Optional[Dict[str, Any]]
+    ) -> CallToolResult:
+        """Call a tool on a pooled connection and return the raw MCP result."""
+        return await self.dispatch(lambda s: s.call_tool(tool_name, arguments))
+
+    async def list_tool_names(self) -> List[str]:
+        tools = await self.get_mcp_server().list_tools()
+        return [tool.name for tool in tools]
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> List[Any]:
+        """
+        Call a tool directly (no LLM involved) and decode its JSON result.
+
+        Raises:
+            RuntimeError: If the tool reports an error
+        """
+        result = await self.get_mcp_server().call_tool(tool_name, arguments)
+        if result.isError:
+            text = " ".join(getattr(c, "text", "") for c in result.content)
+            raise RuntimeError(f"MCP tool {tool_name} failed: {text}")
+        return decode_tool_result(result)
+
+
+def decode_tool_result(result: Any) -> List[Any]:
+    """
+    JSON values of an MCP ``CallToolResult``, one per content block.
+
+    FastMCP returns a list as one text block per element, so a tool returning
+    a list of articles decodes to that list.
+    """
+    structured = getattr(result, "structuredContent", None)
+    if structured is not None:
+        value = structured.get("result", structured)
+        return value if isinstance(value, list) else [value]
+
+    values = []
+    for content in result.content:
+        text = getattr(content, "text", None)
+        if text is None:
+            continue
+        try:
+            values.append(json.loads(text))
+        except json.JSONDecodeError:
+            values.append(text)
+    return values
+
+
+class PooledMCPServer(MCPServer):
+    """
+    ``MCPServer`` facade over a handler's connection pool, so agents (which
+    expect one server object per source) get pooling and reconnects too.
+    """
+
+    def __init__(self, handler: BaseMCPHandler):
+        super().__init__()
+        self.handler = handler
+
+    @property
+    def name(self) -> str:
+        return self.handler.name
+
+    async def connect(self):
+        if not self.handler.connected:
+            await self.handler.connect()
+
+    async def cleanup(self):
+        await self.handler.cleanup()
+
+    async def list_tools(self, *args, **kwargs):
+        return await self.handler.dispatch(lambda s: s.list_tools(*args, **kwargs))
+
+    async def call_tool(self, tool_name: str, arguments: Optional[Dict[str, Any]]):
+        return await self.handler.invoke_tool(tool_name, arguments)
+
+    async def list_prompts(self):
+        return await self.handler.dispatch(lambda s: s.list_prompts())
+
+    async def get_prompt(self, name: str, arguments: Optional[Dict[str, Any]] = None):
+        return await self.handler.dispatch(lambda s: s.get_prompt(name, arguments))
+
+
+class _ToolError(Exception):
+    """Carries an error result past the page cache so it is not stored."""
+
+    def __init__(self, result: CallToolResult):
+        super().__init__()
+        self.result = result
+
 
 class FirecrawlHandler(BaseMCPHandler):
     """
     Handler for Firecrawl MCP server.
+
+    ``firecrawl_scrape`` results go through a ``PageCache`` when the server
+    entry has a ``page_cache`` section (or one is passed in), so pages that
+    are crawled again in later planner cycles or chat handoffs are served
+    locally unless the origin reports a change.
     """
 
-    pass
+    CACHED_TOOLS = ("firecrawl_scrape",)
+
+    def __init__(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        page_cache: Optional[PageCache] = None,
+        **kwargs,
+    ):
+        super().__init__(name, params, **kwargs)
+        if page_cache is None and params.get("page_cache"):
+            page_cache = PageCache(**params["page_cache"])
+        self.page_cache = page_cache
+
+    async def invoke_tool(
+        self, tool_name: str, arguments: Optional[Dict[str, Any]]
+    ) -> CallToolResult:
+        url = (arguments or {}).get("url")
+        if self.page_cache is None or tool_name not in self.CACHED_TOOLS or not url:
+            return await super().invoke_tool(tool_name, arguments)
+
+        async def scrape() -> Dict[str, Any]:
+            result = await super(FirecrawlHandler, self).invoke_tool(
+                tool_name, arguments
+            )
+            if result.isError:
+                raise _ToolError(result)
+            return result.model_dump(mode="json")
+
+        options = {k: v for k, v in arguments.items() if k != "url"}
+        try:
+            data = await self.page_cache.get_or_fetch(url, scrape, **options)
+        except _ToolError as e:
+            return e.result
+        return CallToolResult.model_validate(data)
+
+    async def cleanup(self) -> None:
+        await super().cleanup()
+        if self.page_cache is not None:
+            await self.page_cache.close()
 
 
 class SerpAPISearchHandler(BaseMCPHandler):
     """
     Handler for SerpAPISearch MCP server.
+
+    The server process owns the SerpAPI rate limiter, quota and response
+    cache, so it is never pooled over stdio.
     """
 
-    pass
+    STATEFUL_SERVER = True
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from agents import Runner, SQLiteSession
 
 from news_agent.agents.base_agent import init_agent
-from news_agent.agents.schema import NewsOutput
+from news_agent.agents.ingestion.singleflight import SingleFlight, normalize_query
+from news_agent.agents.schema import NewsItem, NewsOutput
+from news_agent.agents.summarizer.summarization_agent import SummarizationAgent
 
 from .abstract import AbstractIngestion
 
@@ -49,6 +52,7 @@ class IngestionAgent:
     You are a news assistant.
     Given a trending topic or keyword, search the web using SerpApi or Firecrawl and produce a concise summary of the latest news.
     - If news is duplicated, skip it.
+    - When covering several topics, call `search_hot_news_many` once with all of them instead of searching one topic at a time.
     - The summary must be **2-3 sentences**.
     - Include the **most relevant link** for the topic.
     - Focus on **main points only**; ignore fluff, filler, or background context unless essential.
@@ -63,21 +67,51 @@ class IngestionAgent:
     """
 
     def __init__(
-        self, config_path: str, session_id: SQLiteSession, prompt: Optional[str] = None
+        self,
+        config_path: str,
+        session_id: SQLiteSession,
+        prompt: Optional[str] = None,
+        result_ttl_seconds: float = 30.0,
+        summarizer: Optional[SummarizationAgent] = None,
     ):
         self.config_path = config_path
         self.session_id = session_id
         self._ingestion: Optional[AbstractIngestion] = None
+        self.agent = None
         self.prompt = prompt or self.DEFAULT_PROMPT
+        # Identical concurrent queries (planner + chat users on the same breaking
+        # topic) share one LLM/search run; results are reused briefly afterwards
+        self._flights = SingleFlight(memo_ttl=result_ttl_seconds)
+        self.summarizer = summarizer
+        # Startup warms the MCP servers in the background; callers arriving
+        # meanwhile wait for that connection instead of opening their own
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ingestion is not None
 
     async def _ensure_connected(self) -> None:
-        if self._ingestion is None:
-            self._ingestion = await AbstractIngestion.from_config(self.config_path)
-            logger.info("Conected to ingestion MCP servers.")
-            mcp_servers = self._ingestion.get_mcp_servers()
-            self.agent = init_agent(
-                self.prompt, mcp_servers, name="IngestionAgent", output_type=NewsOutput
-            )
+        if self._ingestion is not None:
+            return
+        async with self._connect_lock:
+            if self._ingestion is None:
+                ingestion = await AbstractIngestion.from_config(self.config_path)
+                logger.info("Conected to ingestion MCP servers.")
+                mcp_servers = ingestion.get_mcp_servers()
+                self.agent = init_agent(
+                    self.prompt,
+                    mcp_servers,
+                    name="IngestionAgent",
+                    output_type=NewsOutput,
+                )
+                self._ingestion = ingestion
+
+    async def cleanup(self) -> None:
+        """Close the MCP server connections."""
+        if self._ingestion is not None:
+            await self._ingestion.cleanup()
+            self._ingestion = None
 
     async def get_agent(self):
         """Get the initialized agent for handoff."""
@@ -88,10 +122,14 @@ class IngestionAgent:
         """
         DOing ingestion with query
         """
+        return await self._flights.do(
+            normalize_query(query), lambda: self._run_query(query)
+        )
+
+    async def _run_query(self, query: str) -> Dict[str, Any]:
         logger.info(f"Doing ingestion with query: {query} ")
-        # await self._ensure_connected()
-        # if not self.agent:
-        #    raise RuntimeError("Agent not initialized.")
+        if self.agent is None:
+            await self._ensure_connected()
 
         result = await Runner.run(self.agent, query)
         logger.info(f"IngestionAgent output: {result.final_output}")
@@ -100,3 +138,76 @@ class IngestionAgent:
             return {"results": result.final_output}
         else:
             return {"results": "No results found."}
+
+    # -------------------------------------------------------------------------
+    # Direct (LLM-free) ingestion
+    # -------------------------------------------------------------------------
+    async def fetch_articles(
+        self, query: str, timeframe: str = "24h", num_results: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Call the search tool programmatically and return the scored articles."""
+        await self._ensure_connected()
+        return await self._ingestion.call_tool(
+            "search_hot_news",
+            {"query": query, "timeframe": timeframe, "num_results": num_results},
+        )
+
+    @staticmethod
+    def articles_to_news_items(articles: List[Dict[str, Any]]) -> List[NewsItem]:
+        """Map search tool articles to NewsItem, using the snippet as summary."""
+        return [
+            NewsItem(
+                topic=article["title"].strip(),
+                summary=(article.get("content") or "").strip(),
+                link=article["url"].strip(),
+            )
+            for article in articles
+            if isinstance(article, dict) and article.get("title") and article.get("url")
+        ]
+
+    async def process_query_direct(
+        self,
+        query: str,
+        filter_new: Optional[Callable[[List[NewsItem]], Awaitable[List]]] = None,
+        timeframe: str = "24h",
+        num_results: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Ingest ``query`` without an LLM-driven tool loop.
+
+        The search tool is called directly, its articles are mapped to
+        NewsItem, ``filter_new`` drops items that are already stored, and only
+        the remaining items are sent to the LLM for summaries. Identical
+        concurrent queries are coalesced like ``process_query``, under keys of
+        their own so the two modes never share results.
+        """
+        key = ("direct", normalize_query(query), timeframe, num_results)
+        return await self._flights.do(
+            key,
+            lambda: self._run_query_direct(query, filter_new, timeframe, num_results),
+        )
+
+    async def _run_query_direct(
+        self,
+        query: str,
+        filter_new: Optional[Callable[[List[NewsItem]], Awaitable[List]]],
+        timeframe: str,
+        num_results: int,
+    ) -> Dict[str, Any]:
+        logger.info(f"Doing direct ingestion with query: {query} ")
+        articles = await self.fetch_articles(query, timeframe, num_results)
+        items = self.articles_to_news_items(articles)
+        found = len(items)
+        if filter_new is not None and items:
+            items = await filter_new(items)
+        logger.info(f"Direct ingestion for '{query}': {len(items)}/{found} new items")
+        if not items:
+            return {"results": NewsOutput(news=[])}
+
+        return {"results": NewsOutput(news=await self.summarize(items))}
+
+    async def summarize(self, items: List[NewsItem]) -> List[NewsItem]:
+        """Summarize ``items``, keeping the snippet where the LLM fails."""
+        if self.summarizer is None:
+            self.summarizer = SummarizationAgent()
+        return await self.summarizer.summarize(items)
@@ -0,0 +1,325 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import aiohttp
+
+from news_agent.agents.db.fingerprint import canonicalize_url
+from news_agent.agents.ingestion.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache:
+    """
+    On-disk cache of extracted page content, keyed by canonical URL.
+
+    Content is stored zlib-compressed in content-addressed files
+    (``<dir>/blobs/ab/abcdef....z``), so identical pages reached through
+    different URLs are stored once; an SQLite index maps keys to blobs and
+    keeps the origin's ``ETag``/``Last-Modified``. The total blob size is
+    capped at ``max_bytes`` with least-recently-used eviction.
+
+    Entries younger than ``fresh_seconds`` are served without any network
+    access. Older entries are revalidated with a conditional GET against the
+    origin; a 304 keeps the stored content, anything else refetches. Only the
+    response headers are read: the validators they carry are stored with the
+    refetched content, and the body is never downloaded.
+    """
+
+    def __init__(
+        self,
+        path: str = "./page_cache",
+        max_bytes: int = 256 * 1024 * 1024,
+        fresh_seconds: float = 15 * 60,
+        revalidate_timeout: float = 5.0,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self.timeout = aiohttp.ClientTimeout(total=revalidate_timeout)
+        self._session = session
+        self._owns_session = session is None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        self._flights = SingleFlight()
+
+        # Counters for stats()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -------------------------
+    # Keys
+    # -------------------------
+    @staticmethod
+    def make_key(url: str, **options) -> str:
+        """Canonical URL, plus any options that change the extracted content."""
+        key = canonicalize_url(url)
+        if options:
+            key += "#" + json.dumps(options, sort_keys=True, default=str)
+        return key
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    async def get_or_fetch(
+        self, url: str, fetch: Callable[[], Awaitable[Any]], **options
+    ) -> Any:
+        """
+        Cached content for ``url``, calling ``fetch`` on a miss or when the
+        origin reports that the page changed. ``fetch`` must return JSON data.
+        """
+        key = self.make_key(url, **options)
+        return await self._flights.do(key, lambda: self._get_or_fetch(key, url, fetch))
+
+    async def _get_or_fetch(
+        self, key: str, url: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        entry = await asyncio.to_thread(self._lookup, key)
+        # Validators for the refetched content; unknown until the origin has
+        # answered a revalidation
+        etag = last_modified = None
+        if entry is not None:
+            content, etag, last_modified, fetched_at = entry
+            if time.time() - fetched_at < self.fresh_seconds:
+                self.hits += 1
+                return content
+            not_modified, etag, last_modified = await self._revalidate(
+                url, etag, last_modified
+            )
+            if not_modified:
+                self.revalidated += 1
+                await asyncio.to_thread(
+                    self._touch, key, time.time(), etag, last_modified
+                )
+                return content
+
+        self.misses += 1
+        content = await fetch()
+        await asyncio.to_thread(self._store, key, url, content, etag, last_modified)
+        return content
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.revalidated + self.misses
+        with self._conn_lock:
+            entries, stored_bytes = self._totals(self._connection())
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": stored_bytes,
+        }
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -------------------------
+    # Origin validators
+    # -------------------------
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            self._owns_session = True
+        return self._session
+
+    async def _revalidate(
+        self, url: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Conditional GET of ``url``: whether it is unchanged, and the
+        ``ETag``/``Last-Modified`` the origin sent (falling back to the stored
+        ones on a 304 without them). Entries stored without validators get an
+        unconditional GET, which only serves to learn them.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        try:
+            async with self._get_session().get(url, headers=headers) as resp:
+                if resp.status == 304 and headers:
+                    return (
+                        True,
+                        resp.headers.get("ETag", etag),
+                        resp.headers.get("Last-Modified", last_modified),
+                    )
+                # The page is refetched through the extractor; drop the
+                # connection rather than download a body nobody reads
+                resp.close()
+                return (
+                    False,
+                    resp.headers.get("ETag"),
+                    resp.headers.get("Last-Modified"),
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Revalidating {url} failed: {e!r}")
+            return False, None, None
+
+    # -------------------------
+    # Index and blobs (run in a worker thread)
+    # -------------------------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.join(self.path, "blobs"), exist_ok=True)
+            self._conn = sqlite3.connect(
+                os.path.join(self.path, "index.db"), check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, digest TEXT NOT NULL, "
+                "size INTEGER NOT NULL, etag TEXT, last_modified TEXT, "
+                "fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_pages_accessed ON pages (accessed_at)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_pages_digest ON pages (digest)"
+            )
+        return self._conn
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.path, "blobs", digest[:2], f"{digest}.z")
+
+    @staticmethod
+    def _totals(conn: sqlite3.Connection) -> Tuple[int, int]:
+        # Blobs shared by several keys count once
+        (entries,) = conn.execute("SELECT COUNT(*) FROM pages").fetchone()
+        (stored_bytes,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM pages GROUP BY digest)"
+        ).fetchone()
+        return entries, stored_bytes
+
+    def _lookup(self, key: str) -> Optional[Tuple[Any, str, str, float]]:
+        with self._conn_lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT digest, etag, last_modified, fetched_at FROM pages "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            digest, etag, last_modified, fetched_at = row
+            try:
+                with open(self._blob_path(digest), "rb") as f:
+                    content = json.loads(zlib.decompress(f.read()))
+            except (OSError, zlib.error, ValueError) as e:
+                logger.warning(f"Dropping unreadable cache entry {key}: {e!r}")
+                self._delete_keys(conn, [key])
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE pages SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            conn.commit()
+            return content, etag, last_modified, fetched_at
+
+    def _touch(
+        self,
+        key: str,
+        fetched_at: float,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        with self._conn_lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ?, etag = ?, "
+                "last_modified = ? WHERE key = ?",
+                (fetched_at, fetched_at, etag, last_modified, key),
+            )
+            conn.commit()
+
+    def _store(
+        self,
+        key: str,
+        url: str,
+        content: Any,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        blob = zlib.compress(json.dumps(content, sort_keys=True).encode())
+        digest = hashlib.blake2b(blob, digest_size=16).hexdigest()
+        blob_path = self._blob_path(digest)
+        with self._conn_lock:
+            conn = self._connection()
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(blob)
+                os.replace(tmp_path, blob_path)
+
+            previous = conn.execute(
+                "SELECT digest FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO pages (key, url, digest, size, etag, "
+                "last_modified, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, digest, len(blob), etag, last_modified, now, now),
+            )
+            if previous is not None and previous[0] != digest:
+                self._drop_unreferenced(conn, [previous[0]])
+            self._evict(conn, keep=key)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, keep: str) -> None:
+        _, stored_bytes = self._totals(conn)
+        if stored_bytes <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key FROM pages WHERE key != ? ORDER BY accessed_at", (keep,)
+        ).fetchall()
+        for (key,) in rows:
+            self._delete_keys(conn, [key])
+            self.evictions += 1
+            _, stored_bytes = self._totals(conn)
+            if stored_bytes <= self.max_bytes:
+                break
+
+    def _delete_keys(self, conn: sqlite3.Connection, keys) -> None:
+        placeholders = ",".join("?" * len(keys))
+        digests = [
+            digest
+            for (digest,) in conn.execute(
+                f"SELECT digest FROM pages WHERE key IN ({placeholders})", keys
+            )
+        ]
+        conn.execute(f"DELETE FROM pages WHERE key IN ({placeholders})", keys)
+        self._drop_unreferenced(conn, digests)
+
+    def _drop_unreferenced(self, conn: sqlite3.Connection, digests) -> None:
+        for digest in set(digests):
+            in_use = conn.execute(
+                "SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if in_use is None:
+                try:
+                    os.remove(self._blob_path(digest))
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,284 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from opentelemetry.metrics import Observation, get_meter_provider
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitError(Exception):
+    """Base class for requests refused by the rate limiter."""
+
+
+class QuotaExceededError(RateLimitError):
+    """The monthly request budget is used up."""
+
+
+class RateLimitTimeoutError(RateLimitError):
+    """No token became available before the caller's deadline."""
+
+
+def parse_retry_after(value: Optional[str], default: float) -> float:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or date)."""
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class QuotaStore:
+    """
+    Monthly call counters in an SQLite file.
+
+    Counting survives restarts and is shared by every process using the same
+    file: reservations are a single conditional UPDATE, so concurrent
+    processes cannot together go past the quota.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota_usage ("
+                "name TEXT NOT NULL, month TEXT NOT NULL, "
+                "used INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (name, month))"
+            )
+        return self._conn
+
+    def used(self, name: str, month: str) -> int:
+        with self._conn_lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT used FROM quota_usage WHERE name = ? AND month = ?",
+                    (name, month),
+                )
+                .fetchone()
+            )
+        return row[0] if row else 0
+
+    def reserve(self, name: str, month: str, quota: int) -> Optional[int]:
+        """Count one call; returns the new usage, or None if the quota is full."""
+        with self._conn_lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR IGNORE INTO quota_usage (name, month, used) "
+                "VALUES (?, ?, 0)",
+                (name, month),
+            )
+            row = conn.execute(
+                "UPDATE quota_usage SET used = used + 1 "
+                "WHERE name = ? AND month = ? AND used < ? RETURNING used",
+                (name, month, quota),
+            ).fetchone()
+            conn.commit()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket with a monthly quota for outbound API calls.
+
+    Tokens refill at ``rate_per_second`` up to ``burst``. Callers wait in FIFO
+    order for a token, but never past their own deadline. ``pause`` blocks
+    every caller for a while (e.g. after a 429 with ``Retry-After``). With a
+    ``monthly_quota``, calls past the budget for the current UTC month fail
+    fast with ``QuotaExceededError``. Pass a ``quota_store`` to persist the
+    monthly count across restarts and share it between processes.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int = 1,
+        monthly_quota: Optional[int] = None,
+        name: str = "serpapi",
+        quota_store: Optional[QuotaStore] = None,
+    ):
+        self.rate = rate_per_second
+        self.burst = burst
+        self.monthly_quota = monthly_quota or None
+        self.name = name
+        self.quota_store = quota_store
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._month = self._current_month()
+        self._used_this_month = 0
+        if quota_store is not None and self.monthly_quota is not None:
+            self._used_this_month = quota_store.used(name, self._month)
+
+        # Counters for stats()
+        self.acquired = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.quota_rejections = 0
+
+        meter = get_meter_provider().get_meter("trend-news-metrics")
+        self.throttled_counter = meter.create_counter(
+            name=f"{name}.ratelimit.throttled",
+            description="Calls that had to wait for a rate-limit token",
+            unit="calls",
+        )
+        self.remaining_quota_gauge = meter.create_observable_gauge(
+            name=f"{name}.quota.remaining",
+            description="Calls left in this month's quota",
+            unit="calls",
+            callbacks=[self._remaining_quota_callback],
+        )
+
+    # -------------------------
+    # Observable callbacks
+    # -------------------------
+    def _remaining_quota_callback(self, options):
+        remaining = self.remaining_quota
+        return [] if remaining is None else [Observation(remaining)]
+
+    # -------------------------
+    # Quota
+    # -------------------------
+    @staticmethod
+    def _current_month() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m")
+
+    def _roll_month(self) -> None:
+        month = self._current_month()
+        if month != self._month:
+            self._month = month
+            self._used_this_month = 0
+
+    async def _reserve_quota(self) -> bool:
+        """Count one call against the monthly quota, if there is room."""
+        if self.monthly_quota is None:
+            return True
+        self._roll_month()
+        if self.quota_store is None:
+            if self._used_this_month >= self.monthly_quota:
+                return False
+            self._used_this_month += 1
+            return True
+
+        used = await asyncio.to_thread(
+            self.quota_store.reserve, self.name, self._month, self.monthly_quota
+        )
+        if used is None:
+            self._used_this_month = self.monthly_quota
+            return False
+        self._used_this_month = used
+        return True
+
+    @property
+    def remaining_quota(self) -> Optional[int]:
+        if self.monthly_quota is None:
+            return None
+        self._roll_month()
+        return max(self.monthly_quota - self._used_this_month, 0)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for one token.
+
+        Raises:
+            QuotaExceededError: The monthly quota is used up
+            RateLimitTimeoutError: No token is available within ``timeout``
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            await asyncio.wait_for(self._lock.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise RateLimitTimeoutError(
+                f"Timed out after {timeout}s waiting for a {self.name} token"
+            )
+
+        try:
+            if self.remaining_quota == 0:
+                self.quota_rejections += 1
+                raise QuotaExceededError(
+                    f"Monthly {self.name} quota of {self.monthly_quota} calls used up"
+                )
+
+            waited = False
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = max(self._blocked_until - now, 0.0)
+                if self._tokens < 1:
+                    wait = max(wait, (1 - self._tokens) / self.rate)
+                if wait <= 0:
+                    break
+                if deadline is not None and now + wait > deadline:
+                    self.timeouts += 1
+                    raise RateLimitTimeoutError(
+                        f"Next {self.name} token in {wait:.2f}s, past the deadline"
+                    )
+                if not waited:
+                    waited = True
+                    self.throttled += 1
+                    self.throttled_counter.add(1)
+                await asyncio.sleep(wait)
+
+            # Other processes sharing the quota store may have used it up
+            if not await self._reserve_quota():
+                self.quota_rejections += 1
+                raise QuotaExceededError(
+                    f"Monthly {self.name} quota of {self.monthly_quota} calls used up"
+                )
+            self._tokens -= 1
+            self.acquired += 1
+        finally:
+            self._lock.release()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (e.g. from ``Retry-After``)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        # Don't let a full bucket burst right after the pause
+        self._tokens = min(self._tokens, 1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "timeouts": self.timeouts,
+            "quota_rejections": self.quota_rejections,
+            "remaining_quota": self.remaining_quota,
+        }
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
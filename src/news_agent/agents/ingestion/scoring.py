@@ -0,0 +1,288 @@
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from news_agent.agents.ingestion.date_parser import hours_since
+
+logger = logging.getLogger(__name__)
+
+# Words that indicate trending/hot news
+HOT_KEYWORDS = (
+    "breaking",
+    "urgent",
+    "just in",
+    "developing",
+    "latest",
+    "update",
+    "now",
+    "today",
+    "happening",
+    "live",
+    "exclusive",
+    "first",
+    "new",
+    "trending",
+    "viral",
+    "surge",
+    "spike",
+    "boom",
+    "crisis",
+    "alert",
+)
+
+BREAKING_KEYWORDS = ("breaking", "urgent", "just in", "developing", "alert")
+
+# Source name or domain -> authority (0-5). Names are matched as whole words,
+# so "ap" matches "AP News" but not "Japan Times".
+SOURCE_AUTHORITY = {
+    "reuters": 5,
+    "reuters.com": 5,
+    "ap": 5,
+    "associated press": 5,
+    "apnews.com": 5,
+    "bbc": 5,
+    "bbc.com": 5,
+    "bbc.co.uk": 5,
+    "cnn": 5,
+    "cnn.com": 5,
+    "nytimes": 5,
+    "new york times": 5,
+    "nytimes.com": 5,
+    "washingtonpost": 5,
+    "washington post": 5,
+    "washingtonpost.com": 5,
+    "wsj": 5,
+    "wall street journal": 5,
+    "wsj.com": 5,
+    "bloomberg": 5,
+    "bloomberg.com": 5,
+    "npr": 5,
+    "npr.org": 5,
+    "abc": 5,
+    "abcnews.go.com": 5,
+    "cbs": 5,
+    "cbsnews.com": 5,
+    "nbc": 5,
+    "nbcnews.com": 5,
+    "fox": 3,
+    "foxnews.com": 3,
+    "usa today": 3,
+    "usatoday.com": 3,
+    "guardian": 3,
+    "theguardian.com": 3,
+    "independent": 3,
+    "independent.co.uk": 3,
+    "time": 3,
+    "time.com": 3,
+    "newsweek": 3,
+    "newsweek.com": 3,
+    "politico": 3,
+    "politico.com": 3,
+    "axios": 3,
+    "axios.com": 3,
+}
+DEFAULT_AUTHORITY = 1
+
+DEFAULT_WEIGHTS = {"breaking": 10.0, "recency": 1.0, "authority": 1.0}
+
+_WORD_RE = re.compile(r"\w+")
+_TEXT_SEPARATOR = "\x00"
+# Lower-cases ASCII word characters and turns the others into spaces, except
+# the separator between the texts of a batch
+_ASCII_WORDS = str.maketrans(
+    {
+        c: c.lower() if c.isalnum() or c == "_" or c == _TEXT_SEPARATOR else " "
+        for c in map(chr, range(128))
+    }
+)
+
+
+def word_texts(texts: List[str]) -> List[str]:
+    """
+    ``texts`` lower-cased, with every non-word character replaced by a space,
+    so words are exactly the runs between spaces. ASCII batches are
+    translated in a single pass.
+    """
+    joined = _TEXT_SEPARATOR.join(texts)
+    if joined.isascii() and joined.count(_TEXT_SEPARATOR) == len(texts) - 1:
+        return joined.translate(_ASCII_WORDS).split(_TEXT_SEPARATOR)
+    return [" ".join(_WORD_RE.findall(text.lower())) for text in texts]
+
+
+def normalize_term(term: str) -> str:
+    """A term as ``TermMatcher`` reports it: lower-cased, single-spaced words."""
+    return " ".join(_WORD_RE.findall(term.lower()))
+
+
+class TermMatcher:
+    """
+    Whole-word matcher for a fixed list of (possibly multi-word) terms,
+    reporting the terms found in a text in list order.
+
+    Texts are split into words (see ``word_texts``) and intersected with the
+    terms, with a first-word index for phrases, so "new" never matches
+    "renewed" and the cost does not grow with the list.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = [t for t in dict.fromkeys(map(normalize_term, terms)) if t]
+        self.rank = {term: i for i, term in enumerate(self.terms)}
+        self.words = {term for term in self.terms if " " not in term}
+        # first word -> multi-word terms starting with it
+        self.phrases: Dict[str, List[str]] = {}
+        for term in self.terms:
+            if " " in term:
+                self.phrases.setdefault(term.split(" ")[0], []).append(term)
+        self._keys = self.words | self.phrases.keys()
+
+    def find_all(self, texts: List[str]) -> List[List[str]]:
+        """Terms found in each of ``texts``."""
+        return [self._match_words(words) for words in word_texts(texts)]
+
+    def find(self, text: str) -> List[str]:
+        return self.find_all([text or ""])[0]
+
+    def search(self, text: str) -> bool:
+        return bool(self.find(text))
+
+    def _match_words(self, words: str) -> List[str]:
+        tokens = words.split()
+        hits = self._keys.intersection(tokens)
+        if not hits:
+            return []
+        found = hits & self.words
+        starts = hits.intersection(self.phrases)
+        if starts:
+            line = " %s " % " ".join(tokens)
+            for first in starts:
+                found.update(p for p in self.phrases[first] if f" {p} " in line)
+        return sorted(found, key=self.rank.__getitem__)
+
+
+def recency_score(published_date_str: Optional[str]) -> int:
+    """Calculate how recent the news is (0-10 scale)"""
+    hours_ago = hours_since(published_date_str)
+    if hours_ago is None:
+        return 0
+
+    if hours_ago <= 1:
+        return 10  # Within 1 hour = super hot
+    elif hours_ago <= 6:
+        return 8  # Within 6 hours = very hot
+    elif hours_ago <= 24:
+        return 6  # Within 24 hours = hot
+    elif hours_ago <= 168:  # 1 week
+        return 3  # Within week = warm
+    else:
+        return 1  # Older = cold
+
+
+class HotnessScorer:
+    """
+    Scores search results by how "hot" they are.
+
+    Keyword and source lists are compiled once into matchers (see
+    ``TermMatcher``) and source authority is a dict lookup. Everything
+    matches as whole words, so "ap" rates "AP News" but not "The Japan Times";
+    each distinct source is rated once per batch.
+    """
+
+    def __init__(
+        self,
+        hot_keywords: Iterable[str] = HOT_KEYWORDS,
+        breaking_keywords: Iterable[str] = BREAKING_KEYWORDS,
+        source_authority: Mapping[str, int] = SOURCE_AUTHORITY,
+        default_authority: int = DEFAULT_AUTHORITY,
+        weights: Optional[Mapping[str, float]] = None,
+    ):
+        # Keywords are reported in the configured order, like the old list scan
+        self._hot = TermMatcher(hot_keywords)
+        self._breaking = TermMatcher(breaking_keywords)
+
+        self.source_authority_map = {k.lower(): v for k, v in source_authority.items()}
+        self._sources = TermMatcher(
+            k for k in self.source_authority_map if "." not in k
+        )
+        self.default_authority = default_authority
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+
+    # -------------------------
+    # Single-field scores
+    # -------------------------
+    def keywords(self, text: str) -> List[str]:
+        return self._hot.find(text)
+
+    def is_breaking(self, title: str) -> bool:
+        return self._breaking.search(title)
+
+    def source_authority(self, source: str) -> int:
+        source = (source or "").strip().lower()
+        if not source:
+            return self.default_authority
+
+        # Domains ("www.reuters.com") are looked up directly
+        domain = source.removeprefix("www.")
+        if domain in self.source_authority_map:
+            return self.source_authority_map[domain]
+
+        matches = self._sources.find(source)
+        if not matches:
+            return self.default_authority
+        return max(self.source_authority_map[m] for m in matches)
+
+    def hotness(self, article: Dict[str, Any]) -> float:
+        return (
+            article["is_breaking"] * self.weights["breaking"]
+            + article["recency_score"] * self.weights["recency"]
+            + article["source_authority"] * self.weights["authority"]
+        )
+
+    # -------------------------
+    # Batch scoring
+    # -------------------------
+    def score_articles(
+        self, news_results: Iterable[Dict[str, Any]], query: str, language: str
+    ) -> List[Dict[str, Any]]:
+        """Turn raw SerpAPI news results into scored articles, hottest first."""
+        search_timestamp = datetime.now().isoformat()  # When we found it
+        news_results = list(news_results)
+        titles = [item.get("title", "") for item in news_results]
+        texts = [
+            title + " " + item.get("snippet", "")
+            for title, item in zip(titles, news_results)
+        ]
+        # Results of one search repeat a handful of sources
+        authority: Dict[str, int] = {}
+        articles = []
+        for item, title, keywords, breaking in zip(
+            news_results,
+            titles,
+            self._hot.find_all(texts),
+            self._breaking.find_all(titles),
+        ):
+            source = item.get("source", "")
+            if source not in authority:
+                authority[source] = self.source_authority(source)
+            published_at = item.get("date")
+            articles.append(
+                {
+                    "id": item.get("link"),
+                    "source": source,
+                    "url": item.get("link"),
+                    "title": title,
+                    "content": item.get("snippet", ""),
+                    "published_at": published_at,
+                    "language": language,
+                    # HOT NEWS specific fields
+                    "recency_score": recency_score(published_at),
+                    "source_authority": authority[source],
+                    "engagement_keywords": keywords,
+                    "is_breaking": bool(breaking),
+                    "search_query": query,  # What query found this
+                    "search_timestamp": search_timestamp,
+                }
+            )
+
+        articles.sort(key=self.hotness, reverse=True)
+        return articles
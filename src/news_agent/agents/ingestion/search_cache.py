@@ -0,0 +1,190 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long a response stays fresh, by the requested SerpAPI timeframe. Short
+# windows change quickly; a "past year" search barely moves within a day.
+TIMEFRAME_TTL_SECONDS = {
+    "1h": 5 * 60,
+    "24h": 30 * 60,
+    "7d": 2 * 60 * 60,
+    "1m": 6 * 60 * 60,
+    "1y": 24 * 60 * 60,
+}
+DEFAULT_TTL_SECONDS = 30 * 60
+
+
+class SearchResponseCache:
+    """
+    Two-tier TTL cache for search responses.
+
+    An in-memory LRU (``max_memory_entries``) sits in front of an SQLite file
+    (``max_disk_entries``) so warm entries survive a restart of the MCP
+    server. Disk access runs in a worker thread to keep the event loop free.
+    Pass ``path=None`` for a memory-only cache.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_memory_entries: int = 256,
+        max_disk_entries: int = 5000,
+        ttl_by_timeframe: Optional[Dict[str, int]] = None,
+    ):
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_by_timeframe = ttl_by_timeframe or TIMEFRAME_TTL_SECONDS
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+
+        # Counters for stats()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -------------------------
+    # Keys / TTL
+    # -------------------------
+    @staticmethod
+    def make_key(**params) -> str:
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def ttl_for(self, timeframe: str) -> int:
+        return self.ttl_by_timeframe.get(timeframe, DEFAULT_TTL_SECONDS)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    async def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return value
+            del self._memory[key]
+
+        if self.path is not None:
+            entry = await asyncio.to_thread(self._disk_get, key, now)
+            if entry is not None:
+                expires_at, value = entry
+                self._remember(key, expires_at, value)
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        expires_at = time.time() + ttl_seconds
+        self._remember(key, expires_at, value)
+        if self.path is not None:
+            await asyncio.to_thread(self._disk_set, key, expires_at, value)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    def close(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -------------------------
+    # Memory tier
+    # -------------------------
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    # -------------------------
+    # Disk tier (runs in a worker thread)
+    # -------------------------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_search_cache_accessed "
+                "ON search_cache (accessed_at)"
+            )
+        return self._conn
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        with self._conn_lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            conn.commit()
+            return row[1], json.loads(row[0])
+
+    def _disk_set(self, key: str, expires_at: float, value: Any) -> None:
+        with self._conn_lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, time.time()),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+            if count > self.max_disk_entries:
+                # Expired rows go first, then the least recently used
+                conn.execute(
+                    "DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),)
+                )
+                (count,) = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+                overflow = count - self.max_disk_entries
+                if overflow > 0:
+                    cur = conn.execute(
+                        "DELETE FROM search_cache WHERE key IN ("
+                        "SELECT key FROM search_cache ORDER BY accessed_at LIMIT ?)",
+                        (overflow,),
+                    )
+                    self.evictions += max(cur.rowcount, 0)
+            conn.commit()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from news_agent.agents.ingestion.rate_limiter import (
+    TokenBucketLimiter,
+    parse_retry_after,
+)
+
+logger = logging.getLogger(__name__)
+
+SERPAPI_URL = "https://serpapi.com/search"
+
+
+class SerpAPIClient:
+    """
+    Long-lived SerpAPI HTTP client.
+
+    Owns one pooled ``aiohttp.ClientSession`` (keep-alive, DNS cache, per-host
+    connection limit, explicit timeouts) that is created lazily inside the
+    running event loop and reused by every tool call until ``close``.
+    An existing session can be injected, e.g. one pointed at a local stub.
+
+    With a ``limiter``, every request first waits (up to ``acquire_timeout``)
+    for a token, and 429 responses are retried up to ``max_retries`` times
+    after the ``Retry-After`` delay.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        base_url: str = SERPAPI_URL,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_connections: int = 32,
+        max_connections_per_host: int = 8,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        total_timeout: float = 20.0,
+        connect_timeout: float = 5.0,
+        limiter: Optional[TokenBucketLimiter] = None,
+        acquire_timeout: Optional[float] = 30.0,
+        max_retries: int = 3,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout
+        )
+        self.limiter = limiter
+        self.acquire_timeout = acquire_timeout
+        self.max_retries = max_retries
+        self._session = session
+        self._owns_session = session is None
+        self._lock = asyncio.Lock()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            async with self._lock:
+                if self._session is None or self._session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=self.max_connections,
+                        limit_per_host=self.max_connections_per_host,
+                        ttl_dns_cache=self.dns_cache_ttl,
+                        keepalive_timeout=self.keepalive_timeout,
+                    )
+                    self._session = aiohttp.ClientSession(
+                        connector=connector, timeout=self.timeout
+                    )
+                    self._owns_session = True
+                    logger.info("Opened pooled SerpAPI HTTP session.")
+        return self._session
+
+    async def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one SerpAPI search and return the decoded JSON body.
+
+        Raises:
+            aiohttp.ClientError: On connection errors or non-2xx responses
+            asyncio.TimeoutError: When the request exceeds the client timeouts
+            RateLimitError: When the limiter refuses the call
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.limiter is not None:
+                await self.limiter.acquire(timeout=self.acquire_timeout)
+            try:
+                return await self._get(params)
+            except aiohttp.ClientResponseError as e:
+                if e.status != 429 or attempt == self.max_retries:
+                    raise
+                delay = parse_retry_after(
+                    e.headers.get("Retry-After") if e.headers else None,
+                    default=2**attempt,
+                )
+                logger.warning(
+                    f"SerpAPI rate limited (429), retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+                if self.limiter is not None:
+                    self.limiter.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+
+    async def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        session = await self.get_session()
+        async with session.get(
+            self.base_url, params={**params, "api_key": self.api_key}
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def close(self) -> None:
+        """Close the pooled session if this client created it."""
+        if self._session is not None and not self._session.closed:
+            if self._owns_session:
+                await self._session.close()
+                logger.info("Closed pooled SerpAPI HTTP session.")
+        self._session = None
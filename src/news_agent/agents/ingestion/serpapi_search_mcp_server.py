@@ -1,20 +1,126 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
 import logging
 import os
-from datetime import datetime
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
 
 import aiohttp
-import requests
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+from news_agent.agents.db.fingerprint import canonicalize_url
+from news_agent.agents.ingestion.rate_limiter import (
+    QuotaStore,
+    RateLimitError,
+    TokenBucketLimiter,
+)
+from news_agent.agents.ingestion.scoring import (
+    DEFAULT_WEIGHTS,
+    HotnessScorer,
+    recency_score,
+)
+from news_agent.agents.ingestion.search_cache import SearchResponseCache
+from news_agent.agents.ingestion.serpapi_client import SERPAPI_URL, SerpAPIClient
+from news_agent.agents.ingestion.singleflight import SingleFlight, normalize_query
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 load_dotenv()
 
 api_key = os.getenv("SERPAPI_KEY")
-mcp = FastMCP("serpapisearch", port=8001)
+# SQLite file holding the response cache and the monthly quota counter;
+# "" keeps both in memory only
+SERPAPI_CACHE_PATH = os.getenv("SERPAPI_CACHE_PATH", "./serpapi_cache.db") or None
+
+# Outbound SerpAPI budget: steady rate, short bursts, optional monthly quota
+# (SERPAPI_MONTHLY_QUOTA=0 means unlimited). The quota is counted on disk, so
+# it holds across restarts and every server process sharing the file.
+limiter = TokenBucketLimiter(
+    rate_per_second=float(os.getenv("SERPAPI_RATE_PER_SECOND", "1")),
+    burst=int(os.getenv("SERPAPI_BURST", "5")),
+    monthly_quota=int(os.getenv("SERPAPI_MONTHLY_QUOTA", "0")),
+    quota_store=QuotaStore(SERPAPI_CACHE_PATH) if SERPAPI_CACHE_PATH else None,
+)
+
+# Shared for the whole server lifetime; replace with set_client() in tests
+_client = SerpAPIClient(
+    api_key=api_key,
+    base_url=os.getenv("SERPAPI_BASE_URL", SERPAPI_URL),
+    max_connections_per_host=int(os.getenv("SERPAPI_MAX_CONNECTIONS", "8")),
+    total_timeout=float(os.getenv("SERPAPI_TIMEOUT_SECONDS", "20")),
+    limiter=limiter,
+    acquire_timeout=float(os.getenv("SERPAPI_ACQUIRE_TIMEOUT_SECONDS", "30")),
+)
+# Raw SerpAPI responses, keyed by request parameters
+_cache = SearchResponseCache(
+    path=SERPAPI_CACHE_PATH,
+    max_memory_entries=int(os.getenv("SERPAPI_CACHE_MEMORY_ENTRIES", "256")),
+    max_disk_entries=int(os.getenv("SERPAPI_CACHE_DISK_ENTRIES", "5000")),
+)
+# Searches that found nothing are retried sooner than the timeframe's TTL
+EMPTY_RESULTS_TTL_SECONDS = int(os.getenv("SERPAPI_EMPTY_RESULTS_TTL_SECONDS", "60"))
+
+
+def scoring_weights() -> Dict[str, float]:
+    """
+    Hotness weights, each overridable with ``SERPAPI_WEIGHT_<NAME>`` (set in
+    the ``env`` of the serpapisearch entry in ingest_mcp_config.json).
+    """
+    return {
+        name: float(os.getenv(f"SERPAPI_WEIGHT_{name.upper()}", default))
+        for name, default in DEFAULT_WEIGHTS.items()
+    }
+
+
+# Keyword / source-authority matchers are compiled once per process
+scorer = HotnessScorer(weights=scoring_weights())
+
+# Upper bound on concurrent SerpAPI requests made by search_hot_news_many
+MAX_CONCURRENT_SEARCHES = int(os.getenv("SERPAPI_MAX_CONCURRENT_SEARCHES", "4"))
+# Identical concurrent searches share one SerpAPI request (the response cache
+# only helps once the first one has finished)
+_flights = SingleFlight()
+_active_sessions = 0
+
+
+def get_client() -> SerpAPIClient:
+    return _client
+
+
+def set_client(client: SerpAPIClient) -> None:
+    """Swap the shared SerpAPI client (e.g. for one pointed at a local stub)."""
+    global _client
+    _client = client
+
+
+def get_cache() -> SearchResponseCache:
+    return _cache
+
+
+def set_cache(cache: SearchResponseCache) -> None:
+    global _cache
+    _cache = cache
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the pooled HTTP client once the last MCP session ends."""
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await _client.close()
+            logger.info(f"Search cache stats: {_cache.stats()}")
+            logger.info(f"SerpAPI rate limiter stats: {limiter.stats()}")
+
+
+mcp = FastMCP("serpapisearch", port=8001, lifespan=lifespan)
 
 
 @mcp.tool()
@@ -35,8 +141,6 @@ async def search_hot_news(query, language="en", timeframe="1h", num_results=5):
     logger.info(
         f"LLM called tool 'search_hot_news' with query='{query}', language='{language}', timeframe='{timeframe}', num_results={num_results}"
     )
-    base_url = "https://serpapi.com/search"
-
     # Time-based parameters for hot news
     tbs_map = {
         "1h": "qdr:h",  # Past hour
@@ -47,7 +151,6 @@ async def search_hot_news(query, language="en", timeframe="1h", num_results=5):
     }
 
     params = {
-        "api_key": api_key,
         "engine": "google",
         "q": query,
         "tbm": "nws",  # News search
@@ -60,168 +163,157 @@ async def search_hot_news(query, language="en", timeframe="1h", num_results=5):
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(base_url, params=params) as response:
-                # response = requests.get(base_url, params=params)
-                # response.raise_for_status()
-                data = await response.json()
-                logger.info(
-                    f"SerpAPI search for '{query}' returned {len(data.get('news_results', []))} results."
-                )
-                # Extract hot news with focus on trending indicators
-                articles = []
-                for item in data.get("news_results", []):
-
-                    # Calculate recency score (newer = hotter)
-                    published_at = item.get("date")
-                    recency_score = calculate_recency_score(published_at)
-
-                    article = {
-                        "id": item.get("link"),
-                        "source": item.get("source", ""),
-                        "url": item.get("link"),
-                        "title": item.get("title", ""),
-                        "content": item.get("snippet", ""),
-                        "published_at": published_at,
-                        "language": language,
-                        # HOT NEWS specific fields
-                        "recency_score": recency_score,  # How recent (higher = newer)
-                        "source_authority": get_source_authority(
-                            item.get("source", "")
-                        ),  # Source credibility
-                        "engagement_keywords": extract_hot_keywords(
-                            item.get("title", "") + " " + item.get("snippet", "")
-                        ),
-                        "is_breaking": is_breaking_news(item.get("title", "")),
-                        "search_query": query,  # What query found this
-                        "search_timestamp": datetime.now().isoformat(),  # When we found it
-                    }
-
-                    articles.append(article)
-
-                # Sort by hotness (recency + authority + breaking news)
-                articles.sort(
-                    key=lambda x: (
-                        x["is_breaking"] * 10
-                        + x["recency_score"]  # Breaking news gets priority
-                        + x["source_authority"]  # Recent news  # Authoritative sources
-                    ),
-                    reverse=True,
-                )
-
-        return articles
-
-    except requests.exceptions.RequestException as e:
+        news_results = await fetch_news_results(params, timeframe)
+    except RateLimitError as e:
+        logger.warning(f"SerpAPI call refused by rate limiter: {e}")
+        return []
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.info(f"Error searching hot news: {e}")
         return []
 
+    return build_hot_articles(news_results, query, language)
 
-def calculate_recency_score(published_date_str):
-    """Calculate how recent the news is (0-10 scale)"""
-    if not published_date_str:
-        return 0
 
-    try:
-        # Parse different date formats from Google News
-        from dateutil import parser
+@mcp.tool()
+async def search_hot_news_many(
+    queries, language="en", timeframe="1h", num_results=5, max_concurrency=None
+):
+    """
+    Search hot news for several queries in one tool call.
+
+    Args:
+        queries (List[str]): Search queries
+        language (str): Language code
+        timeframe (str): "1h", "24h", "7d", "1m", "1y" or custom date
+        num_results (int): Number of results per query. Defaults to 5
+        max_concurrency (int): Concurrent SerpAPI requests. Defaults to
+            SERPAPI_MAX_CONCURRENT_SEARCHES
+
+    Returns:
+        Dict: ``results`` maps each query to its articles; ``merged`` holds
+        every article once, with ``search_queries`` listing the queries that
+        found it, sorted by hotness
+    """
+    # Keep order, drop repeated queries
+    queries = list(dict.fromkeys(q for q in queries if q and q.strip()))
+    logger.info(
+        f"LLM called tool 'search_hot_news_many' with {len(queries)} queries, language='{language}', timeframe='{timeframe}', num_results={num_results}"
+    )
+    semaphore = asyncio.Semaphore(max_concurrency or MAX_CONCURRENT_SEARCHES)
+
+    async def run_one(query):
+        async with semaphore:
+            return await search_hot_news(query, language, timeframe, num_results)
 
-        published_date = parser.parse(published_date_str)
-        now = datetime.now(published_date.tzinfo)
+    articles_per_query = await asyncio.gather(*(run_one(q) for q in queries))
+    results = dict(zip(queries, articles_per_query))
+    return {"results": results, "merged": merge_articles(results)}
 
-        hours_ago = (now - published_date).total_seconds() / 3600
 
-        if hours_ago <= 1:
-            return 10  # Within 1 hour = super hot
-        elif hours_ago <= 6:
-            return 8  # Within 6 hours = very hot
-        elif hours_ago <= 24:
-            return 6  # Within 24 hours = hot
-        elif hours_ago <= 168:  # 1 week
-            return 3  # Within week = warm
-        else:
-            return 1  # Older = cold
+def merge_articles(results):
+    """Merge per-query articles, deduplicating by canonical URL."""
+    merged = {}
+    for query, articles in results.items():
+        for article in articles:
+            key = canonicalize_url(article.get("url") or "") or article.get("title")
+            if key in merged:
+                if query not in merged[key]["search_queries"]:
+                    merged[key]["search_queries"].append(query)
+                continue
+            merged[key] = {**article, "search_queries": [query]}
 
-    except Exception:
-        return 0
+    return sorted(merged.values(), key=hotness, reverse=True)
+
+
+def hotness(article):
+    return scorer.hotness(article)
+
+
+async def fetch_news_results(params, timeframe):
+    """
+    Return SerpAPI ``news_results`` for ``params``, served from the response
+    cache while fresh. The raw results are cached rather than the scored
+    articles so recency scores are recomputed on every read.
+    """
+    cache = get_cache()
+    # Google queries are case-insensitive: "AI  Chips" and "ai chips" share
+    # a cache entry and an in-flight request
+    key = cache.make_key(**{**params, "q": normalize_query(params["q"])})
+    cached = await cache.get(key)
+    if cached is not None:
+        logger.info(f"SerpAPI cache hit for '{params['q']}'.")
+        return cached
+
+    return await _flights.do(key, lambda: _search_and_cache(key, params, timeframe))
+
+
+async def _search_and_cache(key, params, timeframe):
+    cache = get_cache()
+    data = await get_client().search(params)
+    if data.get("error"):
+        # Quota exhausted, bad query, ...: worth retrying, never cached
+        logger.warning(f"SerpAPI search for '{params['q']}' failed: {data['error']}")
+        return []
+
+    news_results = data.get("news_results", [])
+    logger.info(
+        f"SerpAPI search for '{params['q']}' returned {len(news_results)} results."
+    )
+    ttl = cache.ttl_for(timeframe)
+    if not news_results:
+        ttl = min(ttl, EMPTY_RESULTS_TTL_SECONDS)
+    await cache.set(key, news_results, ttl)
+    return news_results
+
+
+def build_hot_articles(news_results, query, language):
+    """Score and sort raw SerpAPI news results by hotness."""
+    return scorer.score_articles(news_results, query, language)
+
+
+def calculate_recency_score(published_date_str):
+    """Calculate how recent the news is (0-10 scale)"""
+    return recency_score(published_date_str)
 
 
 def get_source_authority(source):
     """Rate source authority/credibility (0-5 scale)"""
-    # Major news sources get higher authority scores
-    high_authority = [
-        "reuters",
-        "ap",
-        "bbc",
-        "cnn",
-        "nytimes",
-        "washingtonpost",
-        "wsj",
-        "bloomberg",
-        "npr",
-        "abc",
-        "cbs",
-        "nbc",
-    ]
-    medium_authority = [
-        "fox",
-        "usa today",
-        "guardian",
-        "independent",
-        "time",
-        "newsweek",
-        "politico",
-        "axios",
-    ]
-
-    source_lower = source.lower()
-
-    for auth_source in high_authority:
-        if auth_source in source_lower:
-            return 5
-
-    for auth_source in medium_authority:
-        if auth_source in source_lower:
-            return 3
-
-    return 1  # Unknown sources get low score
+    return scorer.source_authority(source)
 
 
 def extract_hot_keywords(text):
     """Extract keywords that indicate trending/hot news"""
-    hot_indicators = [
-        "breaking",
-        "urgent",
-        "just in",
-        "developing",
-        "latest",
-        "update",
-        "now",
-        "today",
-        "happening",
-        "live",
-        "exclusive",
-        "first",
-        "new",
-        "trending",
-        "viral",
-        "surge",
-        "spike",
-        "boom",
-        "crisis",
-        "alert",
-    ]
-
-    text_lower = text.lower()
-    found_keywords = [keyword for keyword in hot_indicators if keyword in text_lower]
-    return found_keywords
+    return scorer.keywords(text)
 
 
 def is_breaking_news(title):
     """Check if this appears to be breaking news"""
-    breaking_indicators = ["breaking", "urgent", "just in", "developing", "alert"]
-    title_lower = title.lower()
-    return any(indicator in title_lower for indicator in breaking_indicators)
+    return scorer.is_breaking(title)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SerpAPI hot-news MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "streamable-http"],
+        default=os.getenv("SERPAPI_MCP_TRANSPORT", "stdio"),
+        help="stdio: child process of one app; streamable-http: shared service",
+    )
+    parser.add_argument("--host", default=os.getenv("SERPAPI_MCP_HOST", "127.0.0.1"))
+    parser.add_argument(
+        "--port", type=int, default=int(os.getenv("SERPAPI_MCP_PORT", "8001"))
+    )
+    args = parser.parse_args()
+
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    if args.transport == "streamable-http":
+        logger.info(
+            f"Serving SerpAPI MCP at http://{args.host}:{args.port}"
+            f"{mcp.settings.streamable_http_path}"
+        )
+    mcp.run(transport=args.transport)
 
 
 if __name__ == "__main__":
-    mcp.run(transport="stdio")
+    main()
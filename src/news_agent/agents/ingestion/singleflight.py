@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Coalescing key for a free-text query: casefolded, whitespace collapsed."""
+    return " ".join(query.casefold().split())
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key starts ``fn`` as a task; callers arriving while
+    it runs await the same task. Successful results can be memoized for
+    ``memo_ttl`` seconds afterwards; failures are never memoized. The task is
+    shielded, so one caller being cancelled does not cancel the others.
+    """
+
+    def __init__(self, memo_ttl: float = 0.0, max_memo_entries: int = 256):
+        self.memo_ttl = memo_ttl
+        self.max_memo_entries = max_memo_entries
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._memo: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        # Counters for stats()
+        self.executions = 0
+        self.coalesced = 0
+        self.memo_hits = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._memo.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self.memo_hits += 1
+                return result
+            del self._memo[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.coalesced += 1
+            logger.info(f"Joining in-flight call for {key!r}")
+        return await asyncio.shield(task)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop a memoized result."""
+        self._memo.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "memo_hits": self.memo_hits,
+            "in_flight": len(self._inflight),
+        }
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if self.memo_ttl <= 0 or task.cancelled() or task.exception() is not None:
+            return
+        self._memo[key] = (time.monotonic() + self.memo_ttl, task.result())
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.max_memo_entries:
+            self._memo.popitem(last=False)
@@ -1,18 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any, Dict, Optional
+import os
+import time
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, Optional
 
-from sqlalchemy import select
-
-from news_agent.agents.db.sqlachemy_db import (
-    SQLAlchemySubscriptionDB,
-    Tag,
-    Trend,
-    trend_tags,
-)
+from news_agent.agents.db.sqlachemy_db import SQLAlchemySubscriptionDB
 from news_agent.agents.ingestion.ingestion import IngestionAgent
+from news_agent.agents.planner.scheduler import AdaptiveTopicScheduler
 from news_agent.agents.sender.abstract import AbstractSender
 from news_agent.agents.sender.email_sender import EmailSenderAgent
 from news_agent.agents.validator.deduplication_agent import DeduplicationAgent
@@ -20,6 +17,13 @@ from news_agent.agents.validator.deduplication_agent import DeduplicationAgent
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# "agent": the ingestion LLM drives the search tools (original behaviour)
+# "direct": search tools are called programmatically, the LLM only summarizes
+INGESTION_MODES = ("agent", "direct")
+
+DEFAULT_MAX_CONCURRENT_TOPICS = 4
+DEFAULT_TOPIC_TIMEOUT_SECONDS = 300
+
 
 class Planner:
     """
@@ -28,6 +32,14 @@ class Planner:
     2. Use DeduplicationAgent / DB to filter duplicates.
     3. Save new trends to the DB.
     4. Use SenderAgent to notify subscribers.
+
+    ``automatic_agent_loop`` runs each cycle's topics on a pool of
+    ``max_concurrent_topics`` workers, cancels topics that exceed
+    ``topic_timeout_seconds``, and notifies subscribers once at the end of
+    the cycle. Which topics a cycle covers is decided by an
+    ``AdaptiveTopicScheduler``: topics are polled more often the more new
+    stories they yield and the more subscribers they have, within the
+    ``scheduler_*_interval_minutes`` bounds.
     """
 
     def __init__(
@@ -45,11 +57,60 @@ class Planner:
         self.ingestion_agent = ingestion_agent
         self.sender_agent = sender_agent or EmailSenderAgent()
         self.deduplication_agent = deduplication_agent
+        self.config = self._load_config(config_path)
+        self.ingestion_mode = self.config.get("ingestion_mode", "agent")
+        if self.ingestion_mode not in INGESTION_MODES:
+            raise ValueError(f"Unknown ingestion mode: {self.ingestion_mode}")
+        self.max_concurrent_topics = max(
+            self.config.get("max_concurrent_topics", DEFAULT_MAX_CONCURRENT_TOPICS), 1
+        )
+        self.topic_timeout = self.config.get(
+            "topic_timeout_seconds", DEFAULT_TOPIC_TIMEOUT_SECONDS
+        )
+        # Cycle notifications and ad-hoc process_query calls must not send
+        # the same pending trends twice
+        self._send_lock = asyncio.Lock()
+        self.last_cycle_stats: Optional[Dict[str, Any]] = None
+        min_interval = self.config.get("scheduler_min_interval_minutes", 5)
+        max_interval = self.config.get("scheduler_max_interval_minutes", 360)
+        self.scheduler = AdaptiveTopicScheduler(
+            min_interval_seconds=min_interval * 60,
+            max_interval_seconds=max_interval * 60,
+            yield_alpha=self.config.get("scheduler_yield_alpha", 0.3),
+        )
 
-    async def process_query(self, query: str) -> Dict[str, Any]:
-        """Process a single query/topic."""
+    @staticmethod
+    def _load_config(config_path: str) -> Dict[str, Any]:
+        if not config_path or not os.path.exists(config_path):
+            logger.warning(f"Planner config not found: {config_path}; using defaults")
+            return {}
+        with open(config_path, "r") as f:
+            return json.load(f)
+
+    async def _ingest(self, query: str) -> Dict[str, Any]:
+        if self.ingestion_mode == "direct":
+            filter_new = (
+                self.deduplication_agent.filter_new
+                if self.deduplication_agent
+                else self.db.filter_new_trends
+            )
+            return await self.ingestion_agent.process_query_direct(
+                query,
+                filter_new=filter_new,
+                timeframe=self.config.get("direct_search_timeframe", "24h"),
+                num_results=self.config.get("direct_search_num_results", 10),
+            )
+        return await self.ingestion_agent.process_query(query)
+
+    async def process_query(self, query: str, notify: bool = True) -> Dict[str, Any]:
+        """
+        Process a single query/topic.
+
+        With ``notify=False`` new trends are stored but subscribers are not
+        emailed; the caller sends once for a whole batch of topics.
+        """
         try:
-            ingestion_results = await self.ingestion_agent.process_query(query)
+            ingestion_results = await self._ingest(query)
         except Exception as e:
             logger.error(f"Ingestion failed: {e}")
             return {"error": str(e)}
@@ -59,57 +120,24 @@ class Planner:
             logger.info("No results from ingestion.")
             return {"results": []}
 
-        processed_items = []
-
-        async with self.db.get_db() as db:  # SINGLE session context
-            for item in results.news:
-                topic = getattr(item, "topic", "").strip()
-                summary = getattr(item, "summary", "").strip()
-                link = getattr(item, "link", "").strip()
-                tag_name = query
-
-                if not topic or not link:
-                    logger.warning(f"Skipping incomplete item: {item}")
-                    continue
-
-                # Deduplication check
-                if await self.deduplication_agent.db_exists(topic, link):
-                    logger.info(f"Duplicate skipped: {topic}")
-                    continue
-
-                # Check or create tag
-                result = await db.execute(select(Tag).where(Tag.name == tag_name))
-                tag_obj = result.scalar_one_or_none()
-                if not tag_obj:
-                    tag_obj = Tag(name=tag_name)
-                    db.add(tag_obj)
-                    await db.flush()
-
-                # Create trend
-                trend = Trend(topic=topic, summary=summary, url=link, notified=False)
-                db.add(trend)
-                await db.flush()  # ensure trend.id is populated
-
-                # Insert into junction table directly
-                stmt = trend_tags.insert().values(trend_id=trend.id, tag_id=tag_obj.id)
-                await db.execute(stmt)
-
-                processed_items.append(
-                    {
-                        "topic": topic,
-                        "summary": summary,
-                        "link": link,
-                        "tags": [tag_name],
-                    }
-                )
-                logger.info(f"New trend added with tag '{tag_name}': {topic}")
+        # Dedup, tag resolution and inserts happen in one bulk transaction
+        bulk_result = await self.db.add_trends_bulk(results.news, query)
+        for skipped in bulk_result["skipped"]:
+            logger.info(f"Skipped ({skipped['reason']}): {skipped['topic']}")
 
-            await db.commit()  # commit everything at once
+        processed_items = [
+            {
+                "topic": row["topic"],
+                "summary": row["summary"],
+                "link": row["link"],
+                "tags": [query],
+            }
+            for row in bulk_result["inserted"]
+        ]
+        logger.info(f"{len(processed_items)} new trends added with tag '{query}'")
 
         # Send updates to subscribers
-        send_results = await self.sender_agent.send_for_subscriptions()
-
-        logger.info(f"Email send results: {send_results}")
+        send_results = await self.notify_subscribers() if notify else None
 
         return {
             "results": f"Pipeline completed for query: {query}",
@@ -117,19 +145,136 @@ class Planner:
             "sent_status": send_results,
         }
 
-    async def automatic_agent_loop(self, interval_minutes: int = 60):
-        """Continuously process all topics in the DB."""
+    async def notify_subscribers(self) -> Any:
+        async with self._send_lock:
+            send_results = await self.sender_agent.send_for_subscriptions()
+        logger.info(f"Email send results: {send_results}")
+        return send_results
+
+    # -------------------------
+    # Cycles
+    # -------------------------
+    async def run_cycle(
+        self,
+        topics: AsyncIterable[str],
+        on_topic_done: Optional[Callable[[str, Optional[int]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Process ``topics`` concurrently and notify subscribers once.
+
+        ``on_topic_done`` is called with each topic and its number of new
+        items (None if it failed or timed out). Returns the cycle stats:
+        duration, topics, new items, failures and timed-out topics.
+        """
+        started = time.monotonic()
+        stats = {"topics": 0, "items": 0, "failures": 0, "timeouts": 0}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent_topics)
+
+        async def worker() -> None:
+            while True:
+                topic = await queue.get()
+                try:
+                    if topic is None:
+                        return
+                    await run_topic(topic)
+                finally:
+                    queue.task_done()
+
+        async def run_topic(topic: str) -> None:
+            new_items = await process_topic(topic)
+            if on_topic_done is not None:
+                on_topic_done(topic, new_items)
+
+        async def process_topic(topic: str) -> Optional[int]:
+            logger.info(f"Processing topic: {topic}")
+            stats["topics"] += 1
+            try:
+                result = await asyncio.wait_for(
+                    self.process_query(topic, notify=False), self.topic_timeout
+                )
+            except asyncio.TimeoutError:
+                stats["timeouts"] += 1
+                logger.warning(
+                    f"Topic '{topic}' exceeded {self.topic_timeout}s; cancelled"
+                )
+                return None
+            except Exception as e:
+                stats["failures"] += 1
+                logger.error(f"Topic '{topic}' failed: {e}")
+                return None
+            if "error" in result:
+                stats["failures"] += 1
+                return None
+            new_items = len(result.get("ingestion", []))
+            stats["items"] += new_items
+            return new_items
+
+        workers = [
+            asyncio.create_task(worker()) for _ in range(self.max_concurrent_topics)
+        ]
+        try:
+            async for topic in topics:
+                await queue.put(topic)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        if stats["topics"]:
+            await self.notify_subscribers()
+        stats["duration_seconds"] = round(time.monotonic() - started, 3)
+        self.last_cycle_stats = stats
+        return stats
+
+    async def run_due_topics(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Sync the scheduler with every topic in the DB and run one cycle over
+        the topics that are due.
+        """
+        self.scheduler.sync(await self.db.get_topic_subscriber_counts(), now)
+        due = self.scheduler.pop_due(now)
+        pending = set(due)
+
+        def on_topic_done(topic: str, new_items: Optional[int]) -> None:
+            pending.discard(topic)
+            self.scheduler.record(topic, new_items)
+
+        try:
+            return await self.run_cycle(_iterate(due), on_topic_done)
+        finally:
+            # Topics the cycle never finished are retried like failed polls
+            for topic in pending:
+                self.scheduler.record(topic, None)
+
+    async def automatic_agent_loop(self, interval_minutes: Optional[int] = None):
+        """
+        Continuously process topics as they come due.
+
+        The loop wakes up when the next topic is due, and at least every
+        ``interval_minutes`` (default: the scheduler's minimum interval) to
+        pick up new topics.
+        """
+        max_sleep = (
+            interval_minutes * 60
+            if interval_minutes is not None
+            else self.scheduler.min_interval
+        )
         while True:
             try:
                 logger.info("Starting automatic agent run...")
-                topics = await self.db.get_all_topics()
-                if not topics:
-                    logger.info("No topics found. Skipping run.")
-                else:
-                    for topic in topics:
-                        logger.info(f"Processing topic: {topic}")
-                        await self.process_query(topic)
-                logger.info("Automatic agent run completed.")
+                stats = await self.run_due_topics()
+                if not stats["topics"]:
+                    logger.info("No topics due. Skipping run.")
+                logger.info(f"Automatic agent run completed: {stats}")
             except Exception as e:
                 logger.error(f"Error during automatic agent run: {e}")
-            await asyncio.sleep(interval_minutes * 60)
+            next_due = self.scheduler.next_due()
+            sleep = max_sleep if next_due is None else next_due - time.time()
+            await asyncio.sleep(min(max(sleep, 1.0), max_sleep))
+
+
+async def _iterate(topics: Iterable[str]) -> AsyncIterable[str]:
+    for topic in topics:
+        yield topic
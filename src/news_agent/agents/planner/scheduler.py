@@ -0,0 +1,147 @@
+import heapq
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TopicState:
+    """Polling state of one topic."""
+
+    __slots__ = ("subscribers", "yield_ewma", "interval", "due_at", "polls")
+
+    def __init__(self, subscribers: int, due_at: float):
+        self.subscribers = subscribers
+        self.yield_ewma: Optional[float] = None
+        self.interval: Optional[float] = None
+        self.due_at = due_at
+        self.polls = 0
+
+
+class AdaptiveTopicScheduler:
+    """
+    Priority queue of topics ordered by their next poll time.
+
+    New topics are due immediately. After each poll a topic's next poll is
+    set from an EWMA of the new items it yielded and its subscriber count:
+
+        heat = yield_ewma * log2(1 + subscribers)
+        interval = max_interval / (1 + heat), clamped to [min, max]
+
+    so topics that keep producing stories for many subscribers are polled
+    every ``min_interval_seconds``, and topics that yield nothing (or that
+    nobody subscribes to) back off to ``max_interval_seconds``.
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float = 5 * 60,
+        max_interval_seconds: float = 6 * 60 * 60,
+        yield_alpha: float = 0.3,
+    ):
+        if min_interval_seconds > max_interval_seconds:
+            raise ValueError("min_interval_seconds exceeds max_interval_seconds")
+        self.min_interval = min_interval_seconds
+        self.max_interval = max_interval_seconds
+        self.yield_alpha = yield_alpha
+
+        self._topics: Dict[str, TopicState] = {}
+        # (due_at, topic); entries whose due_at no longer matches the topic's
+        # state are stale and skipped when popped
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    # -------------------------
+    # Topics
+    # -------------------------
+    def sync(self, subscriber_counts: Dict[str, int], now: Optional[float] = None):
+        """Track exactly the topics in ``subscriber_counts``."""
+        now = time.time() if now is None else now
+        for topic in list(self._topics):
+            if topic not in subscriber_counts:
+                del self._topics[topic]
+        for topic, subscribers in subscriber_counts.items():
+            state = self._topics.get(topic)
+            if state is None:
+                self._topics[topic] = TopicState(subscribers, due_at=now)
+                heapq.heappush(self._heap, (now, topic))
+            elif state.subscribers != subscribers:
+                state.subscribers = subscribers
+                if state.yield_ewma is not None:
+                    self._reschedule(topic, state, state.due_at - state.interval)
+
+    def interval_for(self, yield_ewma: float, subscribers: int) -> float:
+        heat = yield_ewma * math.log2(1 + subscribers)
+        interval = self.max_interval / (1 + heat)
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    # -------------------------
+    # Polling
+    # -------------------------
+    def pop_due(self, now: Optional[float] = None) -> List[str]:
+        """Remove and return every topic due at ``now``, most overdue first."""
+        now = time.time() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, topic = heapq.heappop(self._heap)
+            state = self._topics.get(topic)
+            if state is not None and state.due_at == due_at:
+                due.append(topic)
+        return due
+
+    def record(
+        self, topic: str, new_items: Optional[int], now: Optional[float] = None
+    ) -> None:
+        """
+        Reschedule ``topic`` after a poll that yielded ``new_items``.
+
+        ``None`` marks a failed poll: the estimate is kept and the topic is
+        retried after its current interval (``min_interval_seconds`` if it
+        has never been polled successfully).
+        """
+        state = self._topics.get(topic)
+        if state is None:
+            return
+        now = time.time() if now is None else now
+        state.polls += 1
+        if new_items is not None:
+            if state.yield_ewma is None:
+                state.yield_ewma = float(new_items)
+            else:
+                state.yield_ewma += self.yield_alpha * (new_items - state.yield_ewma)
+        self._reschedule(topic, state, now)
+
+    def next_due(self) -> Optional[float]:
+        """Time the earliest topic is due, or None without topics."""
+        while self._heap:
+            due_at, topic = self._heap[0]
+            state = self._topics.get(topic)
+            if state is not None and state.due_at == due_at:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            topic: {
+                "subscribers": state.subscribers,
+                "yield_ewma": state.yield_ewma,
+                "interval_seconds": state.interval,
+                "due_at": state.due_at,
+                "polls": state.polls,
+            }
+            for topic, state in self._topics.items()
+        }
+
+    def _reschedule(self, topic: str, state: TopicState, polled_at: float) -> None:
+        if state.yield_ewma is None:
+            state.interval = self.min_interval
+        else:
+            state.interval = self.interval_for(state.yield_ewma, state.subscribers)
+        state.due_at = polled_at + state.interval
+        logger.debug(f"Next poll of '{topic}' in {state.interval:.0f}s")
+        heapq.heappush(self._heap, (state.due_at, topic))
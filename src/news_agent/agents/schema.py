@@ -17,6 +17,15 @@ class NewsOutput(BaseModel):
     news: List[NewsItem]
 
 
+class SummaryItem(BaseModel):
+    index: int
+    summary: str
+
+
+class SummaryBatch(BaseModel):
+    summaries: List[SummaryItem]
+
+
 class CheckExistence(BaseModel):
     exists: bool
 
@@ -3,15 +3,8 @@ from email.message import EmailMessage
 from typing import Dict
 
 import aiosmtplib
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-
-from news_agent.agents.db.sqlachemy_db import (
-    SQLAlchemySubscriptionDB,
-    Subscription,
-    Trend,
-    trend_tags,
-)
+
+from news_agent.agents.db.sqlachemy_db import SQLAlchemySubscriptionDB
 from news_agent.agents.sender.abstract import AbstractSender
 
 logger = logging.getLogger(__name__)
@@ -88,54 +81,35 @@ class EmailSenderAgent(AbstractSender):
         sent_count = 0
         failed_count = 0
 
-        async with self.db.get_db() as db:
-            # Load all subscriptions with tags
-            result = await db.execute(
-                select(Subscription).options(selectinload(Subscription.tags))
-            )
-            subscriptions = result.scalars().all()  # Fixed: removed [-1]
-
-            for subscription in subscriptions:
-                email = subscription.email
-
-                # Get tag IDs for this subscription
-                tag_ids = [tag.id for tag in subscription.tags]
-
-                if not tag_ids:
-                    continue
-
-                # Get all unnotified trends matching subscriber's tags
-                trends_result = await db.execute(
-                    select(Trend)
-                    .join(trend_tags, Trend.id == trend_tags.c.trend_id)
-                    .where(trend_tags.c.tag_id.in_(tag_ids))
-                    .where(Trend.notified.is_(False))
-                    .distinct()  # Avoid duplicates if trend has multiple matching tags
-                )
-                trends = trends_result.scalars().all()
-
-                if not trends:
-                    logger.info(f"No new trends for {email}")
-                    continue
+        # Stream the delivery plan in pages of subscribers; each page is one
+        # set-based query for its (subscriber, trend) pairs
+        async for page in self.db.iter_delivery_plan():
+            cursors = {}
+            for entry in page:
+                email = entry["email"]
+                trends = entry["trends"]
 
                 # Send all trends in one email per subscriber
                 trends_payload = [
-                    {"topic": t.topic, "summary": t.summary, "url": t.url}
+                    {"topic": t["topic"], "summary": t["summary"], "url": t["url"]}
                     for t in trends
                 ]
                 try:
                     if await self.send(email, {"trends": trends_payload}):
-                        for t in trends:
-                            t.notified = True
+                        cursors[entry["subscription_id"]] = trends[-1]["id"]
                         sent_count += len(trends)
-                        await db.commit()  # Commit per successful send
+                    else:
+                        failed_count += len(trends)
                 except Exception as e:
                     failed_count += len(trends)
                     logger.error(f"Error sending trends to {email}: {e}")
-                    await db.rollback()  # Rollback on failure
+
+            # Advance the page's cursors in one bulk write; failed subscribers
+            # keep theirs and get the same trends next dispatch
+            await self.db.record_deliveries(cursors)
 
         return {
             "sent_count": sent_count,
             "failed_count": failed_count,
-            "total_subscriptions": len(subscriptions),
+            "total_subscriptions": await self.db.count_subscriptions(),
         }
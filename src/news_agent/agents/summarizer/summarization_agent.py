@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from agents import Runner
+
+from news_agent.agents.base_agent import init_agent
+from news_agent.agents.schema import NewsItem, SummaryBatch
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+# Per-article JSON overhead (keys, quotes, index) counted against the budget
+ITEM_OVERHEAD_CHARS = 64
+
+
+class SummarizationAgent:
+    """
+    Summarizes new articles with bounded concurrency against the LLM endpoint.
+
+    Articles are packed into requests of at most ``char_budget`` characters
+    (and ``max_items_per_request`` articles), and up to ``max_concurrency``
+    requests run at once so vLLM can batch them. Each request gets
+    ``item_timeout_seconds`` per article it carries; a failed or timed-out
+    multi-article request is retried article by article, and an article that
+    still fails keeps its search snippet as summary.
+    """
+
+    DEFAULT_PROMPT = """
+    You are a news summarizer.
+    You receive a JSON list of news articles, each with "index", "topic", "link" and "snippet".
+    For every article write a summary of its main points:
+    - The summary must be **2-3 sentences**.
+    - Write in **clear, succinct language**, suitable for quick consumption.
+    - Do not include personal opinions, commentary, or unnecessary details.
+    Output one entry per article with the article's "index" copied exactly:
+    {"summaries": [{"index": <index as given>, "summary": <2-3 sentence summary>}, ...]}
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        char_budget: int = 6000,
+        max_items_per_request: int = 8,
+        item_timeout_seconds: float = 20.0,
+        prompt: Optional[str] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.char_budget = char_budget
+        self.max_items_per_request = max_items_per_request
+        self.item_timeout = item_timeout_seconds
+        self.prompt = prompt or self.DEFAULT_PROMPT
+        self.agent = None
+
+        # Counters for logging / tests
+        self.requests = 0
+        self.fallbacks = 0
+
+    def _get_agent(self):
+        if self.agent is None:
+            self.agent = init_agent(
+                self.prompt, name="SummarizationAgent", output_type=SummaryBatch
+            )
+        return self.agent
+
+    # -------------------------
+    # Packing
+    # -------------------------
+    def _payload_entry(self, index: int, item: NewsItem) -> Dict[str, Any]:
+        # Keep a single oversized article within the budget
+        snippet_budget = max(self.char_budget - len(item.topic) - len(item.link), 0)
+        return {
+            "index": index,
+            "topic": item.topic,
+            "link": item.link,
+            "snippet": item.summary[:snippet_budget],
+        }
+
+    def pack(self, items: List[NewsItem]) -> List[List[int]]:
+        """Greedily group item indexes into requests that fit the budget."""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        used = 0
+        for index, item in enumerate(items):
+            size = len(item.topic) + len(item.link) + len(item.summary)
+            size += ITEM_OVERHEAD_CHARS
+            if current and (
+                used + size > self.char_budget
+                or len(current) >= self.max_items_per_request
+            ):
+                batches.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += size
+        if current:
+            batches.append(current)
+        return batches
+
+    # -------------------------
+    # Summarization
+    # -------------------------
+    async def summarize(self, items: List[NewsItem]) -> List[NewsItem]:
+        """Return ``items`` with LLM summaries, in the same order."""
+        if not items:
+            return []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        summaries: Dict[int, str] = {}
+        batches = self.pack(items)
+
+        async def run_batch(indexes: List[int]) -> None:
+            try:
+                summaries.update(await self._request(items, indexes, semaphore))
+                return
+            except Exception as e:
+                if len(indexes) == 1:
+                    logger.warning(
+                        f"Summary failed for '{items[indexes[0]].topic}': {e}"
+                    )
+                    return
+                logger.warning(
+                    f"Summary request for {len(indexes)} articles failed ({e}); "
+                    "retrying them one by one"
+                )
+            await asyncio.gather(*(run_batch([index]) for index in indexes))
+
+        await asyncio.gather(*(run_batch(indexes) for indexes in batches))
+
+        results = []
+        for index, item in enumerate(items):
+            summary = summaries.get(index)
+            if not summary:
+                self.fallbacks += 1
+                summary = item.summary
+            results.append(NewsItem(topic=item.topic, summary=summary, link=item.link))
+        logger.info(
+            f"Summarized {len(items)} articles in {len(batches)} requests "
+            f"({len(items) - len(summaries)} kept their snippet)"
+        )
+        return results
+
+    async def _request(
+        self, items: List[NewsItem], indexes: List[int], semaphore: asyncio.Semaphore
+    ) -> Dict[int, str]:
+        payload = json.dumps([self._payload_entry(i, items[i]) for i in indexes])
+        async with semaphore:
+            self.requests += 1
+            result = await asyncio.wait_for(
+                Runner.run(self._get_agent(), payload),
+                timeout=self.item_timeout * len(indexes),
+            )
+        wanted = set(indexes)
+        return {
+            entry.index: entry.summary.strip()
+            for entry in result.final_output.summaries
+            if entry.index in wanted and entry.summary.strip()
+        }
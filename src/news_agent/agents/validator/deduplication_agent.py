@@ -1,4 +1,5 @@
 import logging
+from typing import Any, List
 
 from agents import SQLiteSession
 
@@ -52,6 +53,16 @@ class DeduplicationAgent:
             logger.error(f"Database existence check failed: {e}")
             return False
 
+    async def filter_new(self, items: List[Any]) -> List[Any]:
+        """Drop items that already exist in the database (one bulk query)."""
+        try:
+            new_items = await self.db.filter_new_trends(items)
+            logger.info(f"{len(new_items)} of {len(items)} items are new")
+            return new_items
+        except Exception as e:
+            logger.error(f"Bulk duplicate check failed: {e}")
+            return list(items)
+
     # -------------------------------------------------------------------------
     # 🚀 Main API method — combines all checks
     # -------------------------------------------------------------------------
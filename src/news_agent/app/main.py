@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 
@@ -5,13 +6,16 @@ from agents import SQLiteSession
 from fastapi import FastAPI
 
 from news_agent.agents.chat.chat_agent import ChatAgent
+from news_agent.agents.db.retention import TrendRetentionJob
 from news_agent.agents.db.sqlachemy_db import SQLAlchemySubscriptionDB
 from news_agent.agents.ingestion.ingestion import IngestionAgent
 from news_agent.agents.planner.planner import Planner
 from news_agent.agents.sender.email_sender import EmailSenderAgent
+from news_agent.agents.summarizer.summarization_agent import SummarizationAgent
 from news_agent.agents.validator.deduplication_agent import DeduplicationAgent
 from news_agent.app import state
-from news_agent.app.routes import chat, subscriptions
+from news_agent.app.routes import chat, health, subscriptions, trends
+from news_agent.config.settings import settings
 from news_agent.observability.setup_telemetry import init_metrics
 from news_agent.observability.telemtry_middleware import TelemetryMiddleware
 
@@ -27,6 +31,48 @@ app.add_middleware(TelemetryMiddleware)
 # Routers
 app.include_router(subscriptions.router, prefix="/api/subscribe")
 app.include_router(chat.router, prefix="/api/chat")
+app.include_router(trends.router, prefix="/api/trends")
+app.include_router(health.router)
+
+# Backoff between MCP warm-up attempts
+WARMUP_RETRY_SECONDS = 5.0
+WARMUP_MAX_RETRY_SECONDS = 60.0
+
+
+async def warm_up_agents(session_id: SQLiteSession) -> None:
+    """
+    Connect the MCP servers and build the LLM agents in the background.
+
+    Spawning the MCP servers (``npx -y firecrawl-mcp`` may download packages)
+    takes tens of seconds, so it must not hold back the subscription API.
+    Failed attempts are retried with backoff and reported by ``/readyz``.
+    """
+    delay = WARMUP_RETRY_SECONDS
+    while True:
+        try:
+            await state.ingestion_agent._ensure_connected()
+            break
+        except Exception as e:
+            state.startup_errors["ingestion"] = repr(e)
+            logger.error(f"MCP warm-up failed ({e!r}); retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARMUP_MAX_RETRY_SECONDS)
+    state.startup_errors.pop("ingestion", None)
+    state.readiness["ingestion"] = True
+    logger.info("IngestionAgent initialized.")
+
+    try:
+        state.chat_agent = await ChatAgent.create(
+            session_id,
+            state.ingestion_agent,
+        )
+    except Exception as e:
+        state.startup_errors["chat"] = repr(e)
+        logger.error(f"ChatAgent initialization failed: {e!r}")
+        return
+    state.chat_ready_event.set()
+    state.readiness["chat"] = True
+    logger.info("ChatAgent initialized.")
 
 
 @app.on_event("startup")
@@ -36,23 +82,38 @@ async def startup_event():
     # Initialize DB
     state.DB = SQLAlchemySubscriptionDB()
     await state.DB.init_db()
+    if settings.DB_WRITE_QUEUE_ENABLED:
+        await state.DB.start_write_queue(
+            max_batch_size=settings.DB_WRITE_BATCH_SIZE,
+            max_latency_ms=settings.DB_WRITE_MAX_LATENCY_MS,
+        )
+    state.readiness["database"] = True
     logger.info("Database initialized successfully.")
 
+    # Keep the hot trend tables small
+    state.retention_job = TrendRetentionJob(
+        state.DB,
+        max_age_days=settings.TREND_RETENTION_DAYS,
+        batch_size=settings.TREND_RETENTION_BATCH_SIZE,
+    )
+    state.retention_task = asyncio.create_task(
+        state.retention_job.run_forever(settings.TREND_RETENTION_INTERVAL_MINUTES)
+    )
+    logger.info("Trend retention job started.")
+
     # Initialize session
     session_id = SQLiteSession(session_id="user123")
 
-    # Initialize agents once
+    # Initialize agents once; MCP connections are made by warm_up_agents
     state.ingestion_agent = IngestionAgent(
-        "src/news_agent/config/ingest_mcp_config.json", session_id
-    )
-    await state.ingestion_agent._ensure_connected()
-    logger.info("IngestionAgent initialized.")
-
-    state.chat_agent = await ChatAgent.create(
+        "src/news_agent/config/ingest_mcp_config.json",
         session_id,
-        state.ingestion_agent,
+        summarizer=SummarizationAgent(
+            max_concurrency=settings.SUMMARY_MAX_CONCURRENCY,
+            char_budget=settings.SUMMARY_CHAR_BUDGET,
+            item_timeout_seconds=settings.SUMMARY_ITEM_TIMEOUT_SECONDS,
+        ),
     )
-    state.chat_ready_event.set()
 
     state.sender_agent = EmailSenderAgent(
         state.DB, os.getenv("SMTP_USER"), os.getenv("SMTP_PASS")
@@ -74,3 +135,27 @@ async def startup_event():
     # Start background loop
     # asyncio.create_task(state.planner.automatic_agent_loop())
     # logger.info("PlannerAgent background loop started.")
+
+    state.warmup_task = asyncio.create_task(warm_up_agents(session_id))
+    logger.info("Serving requests; MCP servers and agents warm up in background.")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if state.warmup_task is not None:
+        state.warmup_task.cancel()
+    if state.ingestion_agent is not None:
+        await state.ingestion_agent.cleanup()
+
+    # Stop retention before the write queue it may be writing through
+    if state.retention_task is not None:
+        state.retention_task.cancel()
+        try:
+            await state.retention_task
+        except asyncio.CancelledError:
+            pass
+        state.retention_task = None
+
+    # Commit writes that are still queued
+    if state.DB is not None:
+        await state.DB.stop_write_queue()
@@ -0,0 +1,32 @@
+import logging
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from news_agent.app import state
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/healthz")
+async def healthz():
+    """Liveness: the process is up and serving HTTP."""
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz():
+    """
+    Readiness per component. 503 until every component is ready, so rolling
+    deploys only route traffic that needs the agents once they are warm.
+    """
+    ready = all(state.readiness.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "components": dict(state.readiness),
+            "errors": dict(state.startup_errors),
+        },
+    )
@@ -0,0 +1,25 @@
+import logging
+
+from fastapi import APIRouter, HTTPException, Query
+
+from news_agent.app import state
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/search")
+async def search_trends(
+    q: str = Query(..., min_length=1, description="Full-text query"),
+    limit: int = Query(10, ge=1, le=100),
+):
+    """Search already-ingested trends without calling SerpAPI or the LLM."""
+    if state.DB is None:
+        raise HTTPException(status_code=503, detail="Database not initialized yet")
+
+    try:
+        results = await state.DB.search_trends(q, limit)
+        return {"query": q, "results": results}
+    except Exception as e:
+        logger.error(f"Trend search failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Trend search failed: {str(e)}")
@@ -1,5 +1,7 @@
 import asyncio
+from typing import Dict
 
+from news_agent.agents.db.retention import TrendRetentionJob
 from news_agent.agents.db.sqlachemy_db import SQLAlchemySubscriptionDB
 from news_agent.agents.ingestion.ingestion import IngestionAgent
 from news_agent.agents.planner.planner import Planner
@@ -11,8 +13,21 @@ ingestion_agent: IngestionAgent | None = None
 sender_agent: EmailSenderAgent | None = None
 deduplication_agent: DeduplicationAgent | None = None
 planner: Planner | None = None
+retention_job: TrendRetentionJob | None = None
+retention_task: asyncio.Task | None = None
 
 # Event used to signal chat agent readiness
 chat_ready_event: asyncio.Event = asyncio.Event()
 # Optional lock to protect initialization
 chat_init_lock: asyncio.Lock = asyncio.Lock()
+
+# Per-component readiness reported by /readyz. The database comes up before
+# the app serves requests; MCP servers and agents warm up in the background.
+readiness: Dict[str, bool] = {
+    "database": False,
+    "ingestion": False,
+    "chat": False,
+}
+# Last warm-up error per component, cleared once it is ready
+startup_errors: Dict[str, str] = {}
+warmup_task: asyncio.Task | None = None
@@ -10,7 +10,43 @@ class Settings(BaseSettings):
     DEBUG: bool = Field(False, env="DEBUG")
 
     # Database
-    DATABASE_URL: str = Field(..., env="DATABASE_URL")
+    DATABASE_URL: str = Field(
+        "sqlite+aiosqlite:///./subscriptions.db", env="DATABASE_URL"
+    )
+    # Engine profile: "default", "sqlite_wal" or "server" (see agents/db/engine.py)
+    DB_ENGINE_PROFILE: str = Field("sqlite_wal", env="DB_ENGINE_PROFILE")
+    DB_ECHO: bool = Field(False, env="DB_ECHO")
+
+    # Pool sizing (server profile)
+    DB_POOL_SIZE: int = Field(10, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(20, env="DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT: int = Field(30, env="DB_POOL_TIMEOUT")
+    DB_POOL_RECYCLE: int = Field(1800, env="DB_POOL_RECYCLE")
+
+    # SQLite pragmas (sqlite_wal profile)
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(5000, env="SQLITE_BUSY_TIMEOUT_MS")
+    SQLITE_MMAP_SIZE: int = Field(268435456, env="SQLITE_MMAP_SIZE")
+    # Negative values are KiB, positive values are pages
+    SQLITE_CACHE_SIZE: int = Field(-65536, env="SQLITE_CACHE_SIZE")
+
+    # Single-writer queue: group-commit writes from all components
+    DB_WRITE_QUEUE_ENABLED: bool = Field(True, env="DB_WRITE_QUEUE_ENABLED")
+    DB_WRITE_BATCH_SIZE: int = Field(64, env="DB_WRITE_BATCH_SIZE")
+    DB_WRITE_MAX_LATENCY_MS: float = Field(10.0, env="DB_WRITE_MAX_LATENCY_MS")
+
+    # LLM summarization stage (direct ingestion mode)
+    SUMMARY_MAX_CONCURRENCY: int = Field(4, env="SUMMARY_MAX_CONCURRENCY")
+    SUMMARY_CHAR_BUDGET: int = Field(6000, env="SUMMARY_CHAR_BUDGET")
+    SUMMARY_ITEM_TIMEOUT_SECONDS: float = Field(
+        20.0, env="SUMMARY_ITEM_TIMEOUT_SECONDS"
+    )
+
+    # Trend retention: delivered trends older than this move to trends_archive
+    TREND_RETENTION_DAYS: int = Field(30, env="TREND_RETENTION_DAYS")
+    TREND_RETENTION_BATCH_SIZE: int = Field(500, env="TREND_RETENTION_BATCH_SIZE")
+    TREND_RETENTION_INTERVAL_MINUTES: int = Field(
+        360, env="TREND_RETENTION_INTERVAL_MINUTES"
+    )
 
     # AWS credentials & region
     AWS_ACCESS_KEY_ID: Optional[str] = Field(None, env="AWS_ACCESS_KEY_ID")
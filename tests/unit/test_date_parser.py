@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from news_agent.agents.ingestion.date_parser import hours_since, parse_published_at
+from news_agent.agents.ingestion.scoring import recency_score
+
+NOW = datetime(2024, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "text, age",
+    [
+        ("3 hours ago", timedelta(hours=3)),
+        ("1 hour ago", timedelta(hours=1)),
+        ("an hour ago", timedelta(hours=1)),
+        ("45 mins ago", timedelta(minutes=45)),
+        ("1 min ago", timedelta(minutes=1)),
+        ("2 days ago", timedelta(days=2)),
+        ("1 week ago", timedelta(weeks=1)),
+        ("3 months ago", timedelta(days=90)),
+        ("5h ago", timedelta(hours=5)),
+        ("Yesterday", timedelta(days=1)),
+        ("just now", timedelta(0)),
+    ],
+)
+def test_relative_formats(text, age):
+    assert parse_published_at(text, NOW) == NOW - age
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("10/16/2024, 07:00 AM, +0000 UTC", datetime(2024, 10, 16, 7, 0)),
+        ("Oct 15, 2024", datetime(2024, 10, 15)),
+        ("October 15, 2024", datetime(2024, 10, 15)),
+        ("15 Oct 2024", datetime(2024, 10, 15)),
+        ("2024-10-15T08:30:00Z", datetime(2024, 10, 15, 8, 30)),
+        ("Oct 15", datetime(2024, 10, 15)),
+        # No year and after "now": previous year
+        ("Dec 30", datetime(2023, 12, 30)),
+    ],
+)
+def test_absolute_formats(text, expected):
+    assert parse_published_at(text, NOW) == expected.replace(tzinfo=timezone.utc)
+
+
+def test_unparseable_dates_return_none():
+    assert parse_published_at("sometime soon", NOW) is None
+    assert parse_published_at(None, NOW) is None
+    assert hours_since("", NOW) is None
+
+
+def test_recency_score_for_relative_dates():
+    assert recency_score("30 mins ago") == 10
+    assert recency_score("3 hours ago") == 8
+    assert recency_score("1 day ago") == 6
+    assert recency_score("3 days ago") == 3
+    assert recency_score("2 months ago") == 1
+    assert recency_score("not a date") == 0
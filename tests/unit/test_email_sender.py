@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from news_agent.agents.sender.email_sender import EmailSenderAgent
+
+
+@pytest.mark.asyncio
+async def test_delivery_plan_groups_trends_per_subscriber(db_instance):
+    await db_instance.add_subscription("a@example.com", ["AI", "Space"])
+    await db_instance.add_subscription("b@example.com", ["AI"])
+    await db_instance.add_subscription("c@example.com", ["Sports"])
+    await db_instance.add_trend("AI 1", "S", "https://example.com/ai1", "AI")
+    await db_instance.add_trend("Space 1", "S", "https://example.com/space1", "Space")
+
+    plan = await db_instance.get_delivery_plan()
+
+    assert [entry["email"] for entry in plan] == ["a@example.com", "b@example.com"]
+    assert [t["topic"] for t in plan[0]["trends"]] == ["AI 1", "Space 1"]
+    assert [t["topic"] for t in plan[1]["trends"]] == ["AI 1"]
+
+
+@pytest.mark.asyncio
+async def test_send_for_subscriptions_marks_delivered_trends(db_instance):
+    await db_instance.add_subscription("a@example.com", ["AI"])
+    await db_instance.add_subscription("b@example.com", ["AI"])
+    await db_instance.add_trend("AI 1", "S", "https://example.com/ai1", "AI")
+
+    sender = EmailSenderAgent(db_instance, "user", "pass")
+    sender.send = AsyncMock(return_value=True)
+
+    result = await sender.send_for_subscriptions()
+
+    assert result == {"sent_count": 2, "failed_count": 0, "total_subscriptions": 2}
+    assert sender.send.await_count == 2
+    assert await db_instance.get_delivery_plan() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_send_keeps_trends_pending_for_that_subscriber(db_instance):
+    await db_instance.add_subscription("a@example.com", ["AI"])
+    await db_instance.add_subscription("b@example.com", ["AI"])
+    await db_instance.add_trend("AI 1", "S", "https://example.com/ai1", "AI")
+
+    sender = EmailSenderAgent(db_instance, "user", "pass")
+    sender.send = AsyncMock(side_effect=lambda to, data: to == "a@example.com")
+
+    result = await sender.send_for_subscriptions()
+
+    assert result["sent_count"] == 1
+    assert result["failed_count"] == 1
+    plan = await db_instance.get_delivery_plan()
+    assert [entry["email"] for entry in plan] == ["b@example.com"]
+    assert await db_instance.get_trends_for_user("a@example.com") == []
+    assert len(await db_instance.get_trends_for_user("b@example.com")) == 1
+
+
+@pytest.mark.asyncio
+async def test_new_subscriber_only_gets_trends_stored_after_subscribing(db_instance):
+    await db_instance.add_trend("AI old", "S", "https://example.com/old", "AI")
+    await db_instance.add_subscription("new@example.com", ["AI"])
+    assert await db_instance.get_delivery_plan() == []
+
+    await db_instance.add_trend("AI new", "S", "https://example.com/new", "AI")
+    # Adding topics later keeps the existing cursor
+    await db_instance.add_subscription("new@example.com", ["AI", "Space"])
+
+    plan = await db_instance.get_delivery_plan()
+    assert [t["topic"] for t in plan[0]["trends"]] == ["AI new"]
@@ -0,0 +1,31 @@
+import pytest
+
+from news_agent.agents.db.engine import create_engine_from_settings
+from news_agent.config.settings import Settings
+
+
+@pytest.mark.asyncio
+async def test_sqlite_wal_profile_applies_pragmas(tmp_path):
+    settings = Settings(
+        DATABASE_URL=f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}",
+        DB_ENGINE_PROFILE="sqlite_wal",
+        SQLITE_BUSY_TIMEOUT_MS=1234,
+    )
+    engine = create_engine_from_settings(settings)
+
+    async with engine.connect() as conn:
+        journal_mode = await conn.exec_driver_sql("PRAGMA journal_mode")
+        busy_timeout = await conn.exec_driver_sql("PRAGMA busy_timeout")
+        synchronous = await conn.exec_driver_sql("PRAGMA synchronous")
+
+        assert journal_mode.scalar() == "wal"
+        assert busy_timeout.scalar() == 1234
+        assert synchronous.scalar() == 1  # NORMAL
+    await engine.dispose()
+
+
+def test_unknown_profile_raises():
+    settings = Settings(DB_ENGINE_PROFILE="does-not-exist")
+
+    with pytest.raises(ValueError):
+        create_engine_from_settings(settings)
@@ -0,0 +1,43 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from news_agent.app import state
+from news_agent.app.routes import health
+
+
+def make_client():
+    app = FastAPI()
+    app.include_router(health.router)
+    return TestClient(app)
+
+
+def test_healthz_is_live_before_warm_up(monkeypatch):
+    monkeypatch.setattr(
+        state, "readiness", {"database": True, "ingestion": False, "chat": False}
+    )
+
+    response = make_client().get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_readyz_reports_each_component(monkeypatch):
+    readiness = {"database": True, "ingestion": False, "chat": False}
+    monkeypatch.setattr(state, "readiness", readiness)
+    monkeypatch.setattr(state, "startup_errors", {"ingestion": "TimeoutError()"})
+    client = make_client()
+
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json() == {
+        "ready": False,
+        "components": readiness,
+        "errors": {"ingestion": "TimeoutError()"},
+    }
+
+    readiness.update(ingestion=True, chat=True)
+    state.startup_errors.clear()
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
@@ -5,7 +5,7 @@ from agents import SQLiteSession
 
 from news_agent.agents.ingestion.abstract import AbstractIngestion
 from news_agent.agents.ingestion.ingestion import IngestionAgent
-from news_agent.agents.schema import NewsItem, NewsOutput
+from news_agent.agents.schema import NewsItem, NewsOutput, SummaryBatch, SummaryItem
 
 
 @pytest.mark.asyncio
@@ -115,3 +115,360 @@ async def test_from_config_multiple_servers(tmp_path):
 
         # Ingestion object should have 2 handlers
         assert len(ingestion.handlers) == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_connects_to_streamable_http_server(unused_tcp_port):
+    """
+    A handler configured with a URL talks to an already running MCP service.
+    """
+    import asyncio
+
+    import uvicorn
+
+    from news_agent.agents.ingestion import serpapi_search_mcp_server as server
+    from news_agent.agents.ingestion.handlers import SerpAPISearchHandler
+
+    http_server = uvicorn.Server(
+        uvicorn.Config(
+            server.mcp.streamable_http_app(),
+            port=unused_tcp_port,
+            log_level="warning",
+        )
+    )
+    serve_task = asyncio.create_task(http_server.serve())
+    while not http_server.started:
+        await asyncio.sleep(0.01)
+
+    handler = SerpAPISearchHandler(
+        name="serpapisearch",
+        params={"url": f"http://127.0.0.1:{unused_tcp_port}/mcp"},
+    )
+    try:
+        await handler.connect()
+        tools = await handler.get_mcp_server().list_tools()
+        assert {"search_hot_news", "search_hot_news_many"} <= {t.name for t in tools}
+    finally:
+        if handler.server is not None:
+            await handler.server.cleanup()
+        http_server.should_exit = True
+        await serve_task
+
+
+def test_handler_rejects_unknown_transport():
+    from news_agent.agents.ingestion.handlers import FirecrawlHandler
+
+    handler = FirecrawlHandler(
+        name="firecrawl", params={"url": "http://localhost:1/sse", "transport": "sse"}
+    )
+    with pytest.raises(ValueError):
+        handler._create_server()
+
+
+@pytest.mark.asyncio
+@patch("agents.Runner.run", new_callable=AsyncMock)
+async def test_concurrent_identical_queries_run_once(mock_run):
+    """
+    Concurrent process_query calls for the same normalized query are coalesced.
+    """
+    import asyncio
+
+    async def slow_run(agent, query):
+        await asyncio.sleep(0.01)
+        result = MagicMock()
+        result.final_output = NewsOutput(news=[])
+        return result
+
+    mock_run.side_effect = slow_run
+    agent = IngestionAgent(
+        config_path="src/news_agent/config/ingest_mcp_config.json",
+        session_id=SQLiteSession("123"),
+    )
+    agent.agent = AsyncMock()
+
+    results = await asyncio.gather(
+        agent.process_query("Breaking AI news"),
+        agent.process_query("breaking ai  news"),
+        agent.process_query("Breaking AI news"),
+    )
+
+    assert mock_run.await_count == 1
+    assert results[0] is results[1] is results[2]
+    # Memoized briefly afterwards
+    await agent.process_query("breaking ai news")
+    assert mock_run.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_abstract_ingestion_call_tool_routes_and_decodes():
+    """
+    call_tool finds the server exposing the tool and decodes FastMCP's
+    one-text-block-per-element list encoding.
+    """
+    from mcp.types import CallToolResult, TextContent, Tool
+
+    from news_agent.agents.ingestion.handlers import (
+        FirecrawlHandler,
+        SerpAPISearchHandler,
+    )
+
+    firecrawl = FirecrawlHandler(name="firecrawl", params={})
+    serpapi = SerpAPISearchHandler(name="serpapisearch", params={})
+    for handler, tool in ((firecrawl, "firecrawl_scrape"), (serpapi, "search")):
+        handler.server = MagicMock()
+        handler.server.list_tools = AsyncMock(
+            return_value=[Tool(name=tool, inputSchema={"type": "object"})]
+        )
+        handler.connected = True
+    serpapi.server.call_tool = AsyncMock(
+        return_value=CallToolResult(
+            content=[
+                TextContent(type="text", text='{"title": "A"}'),
+                TextContent(type="text", text='{"title": "B"}'),
+            ]
+        )
+    )
+
+    ingestion = AbstractIngestion([firecrawl, serpapi])
+    result = await ingestion.call_tool("search", {"query": "ai"})
+
+    assert result == [{"title": "A"}, {"title": "B"}]
+    serpapi.server.call_tool.assert_awaited_once_with("search", {"query": "ai"})
+    with pytest.raises(ValueError):
+        await ingestion.call_tool("missing", {})
+
+
+@pytest.mark.asyncio
+@patch("agents.Runner.run", new_callable=AsyncMock)
+async def test_direct_ingestion_only_summarizes_new_items(mock_run):
+    """
+    Direct mode maps tool articles to NewsItem and sends only new ones to the LLM.
+    """
+    agent = IngestionAgent(
+        config_path="src/news_agent/config/ingest_mcp_config.json",
+        session_id=SQLiteSession("123"),
+    )
+    agent._ingestion = MagicMock()
+    agent._ingestion.call_tool = AsyncMock(
+        return_value=[
+            {"title": "Old", "url": "https://e.com/old", "content": "old snippet"},
+            {"title": "New", "url": "https://e.com/new", "content": "new snippet"},
+            {"title": "", "url": "https://e.com/blank"},
+        ]
+    )
+    summarized = MagicMock()
+    summarized.final_output = SummaryBatch(
+        summaries=[SummaryItem(index=0, summary="LLM summary")]
+    )
+    mock_run.return_value = summarized
+
+    async def filter_new(items):
+        return [item for item in items if item.topic != "Old"]
+
+    with patch("news_agent.agents.summarizer.summarization_agent.init_agent"):
+        result = await agent.process_query_direct("ai", filter_new=filter_new)
+
+    assert [(n.topic, n.summary) for n in result["results"].news] == [
+        ("New", "LLM summary")
+    ]
+    # The LLM saw only the new article
+    payload = mock_run.await_args.args[1]
+    assert "new snippet" in payload and "old snippet" not in payload
+
+
+@pytest.mark.asyncio
+async def test_concurrent_direct_queries_share_one_search():
+    import asyncio
+
+    agent = IngestionAgent(
+        config_path="src/news_agent/config/ingest_mcp_config.json",
+        session_id=SQLiteSession("123"),
+    )
+
+    async def slow_search(tool_name, arguments):
+        await asyncio.sleep(0.01)
+        return []
+
+    agent._ingestion = MagicMock()
+    agent._ingestion.call_tool = AsyncMock(side_effect=slow_search)
+
+    results = await asyncio.gather(
+        agent.process_query_direct("Breaking AI news"),
+        agent.process_query_direct("breaking ai  news"),
+    )
+
+    assert agent._ingestion.call_tool.await_count == 1
+    assert results[0] is results[1]
+    # Another timeframe is another search
+    await agent.process_query_direct("breaking ai news", timeframe="1h")
+    assert agent._ingestion.call_tool.await_count == 2
+
+
+class FakeMCPServer:
+    """Stands in for one MCP connection; ``broken`` makes every call fail."""
+
+    def __init__(self, number):
+        self.number = number
+        self.broken = False
+        self.calls = 0
+        self.closed = False
+
+    async def connect(self):
+        pass
+
+    async def cleanup(self):
+        self.closed = True
+
+    async def list_tools(self, *args, **kwargs):
+        if self.broken:
+            raise ConnectionError("pipe closed")
+        return []
+
+    async def call_tool(self, tool_name, arguments):
+        if self.broken:
+            raise ConnectionError("pipe closed")
+        self.calls += 1
+        return self.number
+
+
+def make_pooled_handler(pool_size, **kwargs):
+    from news_agent.agents.ingestion.handlers import FirecrawlHandler
+
+    created = []
+
+    def create_server():
+        created.append(FakeMCPServer(len(created)))
+        return created[-1]
+
+    handler = FirecrawlHandler(
+        name="firecrawl",
+        params={"command": "npx", "args": [], "pool_size": pool_size},
+        reconnect_backoff_seconds=0.01,
+        **kwargs,
+    )
+    handler._create_server = create_server
+    return handler, created
+
+
+@pytest.mark.asyncio
+async def test_pooled_handler_dispatches_round_robin():
+    handler, created = make_pooled_handler(pool_size=3)
+    await handler.connect()
+    assert "pool_size" not in handler.params
+
+    server = handler.get_mcp_server()
+    used = [await server.call_tool("search_hot_news", {}) for _ in range(6)]
+
+    assert server.name == "firecrawl"
+    assert used == [0, 1, 2, 0, 1, 2]
+    assert [fake.calls for fake in created] == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_pooled_handler_retries_and_reconnects_failed_connection():
+    import asyncio
+
+    handler, created = make_pooled_handler(pool_size=2)
+    await handler.connect()
+    created[0].broken = True
+
+    # The call fails over to the other connection...
+    assert await handler.get_mcp_server().call_tool("search_hot_news", {}) == 1
+    # ...while the broken one is replaced in the background
+    while handler.reconnects == 0:
+        await asyncio.sleep(0.01)
+
+    assert created[0].closed
+    assert len(created) == 3
+    assert handler.healthy_connections == 2
+
+    # Health probes catch a connection that died between calls
+    created[1].broken = True
+    await handler.check_health()
+    while handler.reconnects == 1:
+        await asyncio.sleep(0.01)
+    assert created[1].closed
+    assert handler.healthy_connections == 2
+
+    await handler.cleanup()
+    assert not handler.connected
+
+
+@pytest.mark.asyncio
+async def test_pooled_handler_keeps_connection_on_tool_errors():
+    import asyncio
+
+    handler, created = make_pooled_handler(pool_size=1)
+    await handler.connect()
+
+    async def slow_tool(tool_name, arguments):
+        raise asyncio.TimeoutError()
+
+    created[0].call_tool = slow_tool
+    with pytest.raises(asyncio.TimeoutError):
+        await handler.get_mcp_server().call_tool("firecrawl_scrape", {})
+
+    assert handler.healthy_connections == 1
+    assert len(created) == 1
+    await handler.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_pooled_handler_gives_up_when_no_connection_comes_back():
+    from news_agent.agents.ingestion.handlers import MCPUnavailableError
+
+    handler, created = make_pooled_handler(pool_size=1, unavailable_timeout=0.05)
+    await handler.connect()
+    created[0].broken = True
+
+    def refuse():
+        raise ConnectionRefusedError("server down")
+
+    handler._create_server = refuse
+
+    with pytest.raises(MCPUnavailableError):
+        await handler.get_mcp_server().call_tool("firecrawl_scrape", {})
+    await handler.cleanup()
+
+
+def test_stateful_stdio_servers_are_not_pooled():
+    from news_agent.agents.ingestion.handlers import SerpAPISearchHandler
+
+    with pytest.raises(ValueError):
+        SerpAPISearchHandler(
+            name="serpapisearch",
+            params={"command": "python", "args": [], "pool_size": 2},
+        )
+    # A shared HTTP server can be pooled
+    handler = SerpAPISearchHandler(
+        name="serpapisearch",
+        params={"url": "http://127.0.0.1:8001/mcp", "pool_size": 2},
+    )
+    assert handler.pool_size == 2
+
+
+@pytest.mark.asyncio
+@patch(
+    "news_agent.agents.ingestion.ingestion.AbstractIngestion.from_config",
+    new_callable=AsyncMock,
+)
+async def test_callers_during_warm_up_share_one_connection(mock_from_config):
+    import asyncio
+
+    async def slow_connect(config_path):
+        await asyncio.sleep(0.01)
+        ingestion = MagicMock()
+        ingestion.get_mcp_servers.return_value = []
+        return ingestion
+
+    mock_from_config.side_effect = slow_connect
+    agent = IngestionAgent(
+        config_path="src/news_agent/config/ingest_mcp_config.json",
+        session_id=SQLiteSession("123"),
+    )
+    assert not agent.ready
+
+    await asyncio.gather(agent._ensure_connected(), agent.get_agent())
+
+    assert mock_from_config.await_count == 1
+    assert agent.ready
@@ -0,0 +1,162 @@
+import hashlib
+import os
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from mcp.types import CallToolResult, TextContent
+
+from news_agent.agents.ingestion.handlers import FirecrawlHandler
+from news_agent.agents.ingestion.page_cache import PageCache
+
+
+@pytest_asyncio.fixture
+async def origin():
+    """Article server that honours If-None-Match and records every request."""
+    state = {"etag": '"v1"', "requests": []}
+
+    async def handle_article(request):
+        state["requests"].append((request.method, request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == state["etag"]:
+            return web.Response(status=304, headers={"ETag": state["etag"]})
+        return web.Response(
+            text="<html>article</html>", headers={"ETag": state["etag"]}
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/article", handle_article)
+    stub = TestServer(app)
+    await stub.start_server()
+    state["url"] = str(stub.make_url("/article"))
+    yield state
+    await stub.close()
+
+
+def make_fetch(calls, content):
+    async def fetch():
+        calls.append(1)
+        return content
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_repeat_crawls_are_cache_hits(tmp_path, origin):
+    cache = PageCache(path=str(tmp_path))
+    calls = []
+    fetch = make_fetch(calls, {"markdown": "article"})
+
+    first = await cache.get_or_fetch(origin["url"], fetch)
+    # Tracking parameters don't change the canonical URL
+    second = await cache.get_or_fetch(origin["url"] + "?utm_source=x", fetch)
+
+    assert first == second == {"markdown": "article"}
+    assert len(calls) == 1
+    # Nothing but the crawl itself touched the origin
+    assert origin["requests"] == []
+    assert cache.stats()["hits"] == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_revalidate_with_etag(tmp_path, origin):
+    cache = PageCache(path=str(tmp_path), fresh_seconds=0)
+    calls = []
+    fetch = make_fetch(calls, {"markdown": "article"})
+
+    await cache.get_or_fetch(origin["url"], fetch)
+    # No validators yet: the GET only learns the ETag, the page is recrawled
+    await cache.get_or_fetch(origin["url"], fetch)
+    assert len(calls) == 2
+    assert origin["requests"] == [("GET", None)]
+
+    # Unchanged at the origin: 304, no new crawl
+    await cache.get_or_fetch(origin["url"], fetch)
+    assert len(calls) == 2
+    assert origin["requests"][-1] == ("GET", '"v1"')
+    assert cache.revalidated == 1
+
+    # Changed at the origin: crawled again and stored with the new ETag
+    origin["etag"] = '"v2"'
+    await cache.get_or_fetch(origin["url"], fetch)
+    assert len(calls) == 3
+    await cache.get_or_fetch(origin["url"], fetch)
+    assert len(calls) == 3
+    assert origin["requests"][-1] == ("GET", '"v2"')
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_size_limit_evicts_least_recently_used(tmp_path):
+    def incompressible(name):
+        return "".join(
+            hashlib.sha256(f"{name}{i}".encode()).hexdigest() for i in range(4)
+        )
+
+    # Room for two of the ~185 byte pages
+    cache = PageCache(path=str(tmp_path), max_bytes=400)
+    calls = []
+    pages = {
+        f"http://127.0.0.1:1/{name}": {"markdown": incompressible(name)}
+        for name in ("a", "b", "c")
+    }
+
+    for url, content in pages.items():
+        await cache.get_or_fetch(url, make_fetch(calls, content))
+    # Same content under another URL shares the blob
+    await cache.get_or_fetch(
+        "http://127.0.0.1:1/copy", make_fetch(calls, pages["http://127.0.0.1:1/c"])
+    )
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 400
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 3
+    blobs = [f for _, _, files in os.walk(tmp_path / "blobs") for f in files]
+    assert len(blobs) == 2
+
+    # The oldest page was evicted and is crawled again
+    await cache.get_or_fetch("http://127.0.0.1:1/a", make_fetch(calls, {}))
+    assert len(calls) == 5
+    await cache.close()
+
+
+class FakeFirecrawl:
+    def __init__(self):
+        self.calls = 0
+
+    async def connect(self):
+        pass
+
+    async def cleanup(self):
+        pass
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls += 1
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"# page {arguments['url']}")]
+        )
+
+
+@pytest.mark.asyncio
+async def test_firecrawl_handler_serves_scrapes_from_page_cache(tmp_path, origin):
+    fake = FakeFirecrawl()
+    handler = FirecrawlHandler(
+        name="firecrawl",
+        params={"command": "npx", "args": [], "page_cache": {"path": str(tmp_path)}},
+    )
+    handler._create_server = lambda: fake
+    await handler.connect()
+    server = handler.get_mcp_server()
+    arguments = {"url": origin["url"], "formats": ["markdown"]}
+
+    first = await server.call_tool("firecrawl_scrape", arguments)
+    second = await server.call_tool("firecrawl_scrape", arguments)
+    await server.call_tool("firecrawl_map", arguments)
+
+    assert first == second
+    assert second.content[0].text == f"# page {origin['url']}"
+    # One scrape, plus the uncached firecrawl_map call
+    assert fake.calls == 2
+    await handler.cleanup()
@@ -0,0 +1,132 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from news_agent.agents.planner.planner import Planner
+from news_agent.agents.schema import NewsItem, NewsOutput
+
+
+def make_planner(tmp_path, db, config):
+    config_path = tmp_path / "planner_config.json"
+    config_path.write_text(json.dumps(config))
+    ingestion_agent = MagicMock()
+    sender_agent = MagicMock()
+    sender_agent.send_for_subscriptions = AsyncMock(return_value={"sent_count": 0})
+    planner = Planner(
+        config_path=str(config_path),
+        session_id="test",
+        db=db,
+        ingestion_agent=ingestion_agent,
+        sender_agent=sender_agent,
+    )
+    return planner, ingestion_agent
+
+
+@pytest.mark.asyncio
+async def test_direct_mode_ingests_without_the_agent_loop(tmp_path, db_instance):
+    planner, ingestion_agent = make_planner(
+        tmp_path, db_instance, {"ingestion_mode": "direct"}
+    )
+    ingestion_agent.process_query_direct = AsyncMock(
+        return_value={
+            "results": NewsOutput(
+                news=[NewsItem(topic="T", summary="S", link="https://e.com/t")]
+            )
+        }
+    )
+    ingestion_agent.process_query = AsyncMock()
+
+    result = await planner.process_query("AI")
+
+    assert [item["topic"] for item in result["ingestion"]] == ["T"]
+    ingestion_agent.process_query.assert_not_awaited()
+    kwargs = ingestion_agent.process_query_direct.await_args.kwargs
+    assert kwargs["filter_new"] == db_instance.filter_new_trends
+
+
+def test_unknown_ingestion_mode_is_rejected(tmp_path, db_instance):
+    with pytest.raises(ValueError):
+        make_planner(tmp_path, db_instance, {"ingestion_mode": "psychic"})
+
+
+async def topics_of(*names):
+    for name in names:
+        yield name
+
+
+@pytest.mark.asyncio
+async def test_cycle_runs_topics_concurrently_and_cancels_stragglers(
+    tmp_path, db_instance
+):
+    import asyncio
+    import time
+
+    planner, ingestion_agent = make_planner(
+        tmp_path,
+        db_instance,
+        {
+            "ingestion_mode": "direct",
+            "max_concurrent_topics": 4,
+            "topic_timeout_seconds": 0.3,
+        },
+    )
+    cancelled = []
+
+    async def ingest(query, **kwargs):
+        if query == "hangs":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+        if query == "broken":
+            raise RuntimeError("search down")
+        await asyncio.sleep(0.1)
+        return {
+            "results": NewsOutput(
+                news=[
+                    NewsItem(
+                        topic=f"{query} story",
+                        summary="S",
+                        link=f"https://e.com/{query}",
+                    )
+                ]
+            )
+        }
+
+    ingestion_agent.process_query_direct = AsyncMock(side_effect=ingest)
+
+    started = time.monotonic()
+    stats = await planner.run_cycle(topics_of("a", "b", "hangs", "broken", "c"))
+    elapsed = time.monotonic() - started
+
+    # Bounded by the slowest topic (the deadline), not the sum of all topics
+    assert elapsed < 0.6
+    assert cancelled == ["hangs"]
+    assert stats["topics"] == 5
+    assert stats["items"] == 3
+    assert stats["failures"] == 1
+    assert stats["timeouts"] == 1
+    assert planner.last_cycle_stats is stats
+    # Subscribers are notified once per cycle, not once per topic
+    planner.sender_agent.send_for_subscriptions.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_due_topics_cover_every_tag_and_are_rescheduled(tmp_path, db_instance):
+    for i in range(12):
+        await db_instance.add_subscription(f"user{i}@example.com", [f"topic{i}"])
+    planner, ingestion_agent = make_planner(
+        tmp_path, db_instance, {"ingestion_mode": "direct"}
+    )
+    ingestion_agent.process_query_direct = AsyncMock(return_value={"results": []})
+
+    stats = await planner.run_due_topics(now=0)
+    # All twelve topics, not just the ten most recent tags
+    assert stats["topics"] == 12
+
+    # Nothing yielded, so nothing is due again soon
+    stats = await planner.run_due_topics(now=60)
+    assert stats["topics"] == 0
+    assert planner.scheduler.next_due() > 60
@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from news_agent.agents.ingestion.rate_limiter import (
+    QuotaExceededError,
+    QuotaStore,
+    RateLimitTimeoutError,
+    TokenBucketLimiter,
+    parse_retry_after,
+)
+from news_agent.agents.ingestion.serpapi_client import SerpAPIClient
+
+
+@pytest.mark.asyncio
+async def test_burst_then_steady_rate():
+    limiter = TokenBucketLimiter(rate_per_second=50, burst=2)
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+    elapsed = time.monotonic() - start
+
+    # 2 immediate, then 4 more at 50/s
+    assert elapsed >= 0.07
+    assert limiter.stats()["acquired"] == 6
+    assert limiter.stats()["throttled"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_and_quota():
+    limiter = TokenBucketLimiter(rate_per_second=0.1, burst=1, monthly_quota=2)
+
+    await limiter.acquire(timeout=0.01)
+    with pytest.raises(RateLimitTimeoutError):
+        await limiter.acquire(timeout=0.01)
+
+    limiter._tokens = 1.0
+    await limiter.acquire()
+    assert limiter.remaining_quota == 0
+    with pytest.raises(QuotaExceededError):
+        await limiter.acquire()
+    assert limiter.stats()["quota_rejections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_quota_is_shared_and_survives_restarts(tmp_path):
+    store = QuotaStore(str(tmp_path / "quota.db"))
+    first = TokenBucketLimiter(
+        rate_per_second=100, burst=5, monthly_quota=3, quota_store=store
+    )
+    second = TokenBucketLimiter(
+        rate_per_second=100,
+        burst=5,
+        monthly_quota=3,
+        quota_store=QuotaStore(str(tmp_path / "quota.db")),
+    )
+
+    await first.acquire()
+    await first.acquire()
+    await second.acquire()
+    # The other limiter used the last call; this one only learns on acquire
+    with pytest.raises(QuotaExceededError):
+        await first.acquire()
+    assert first.remaining_quota == 0
+
+    # A restarted process starts from the stored count
+    store.close()
+    restarted = TokenBucketLimiter(
+        rate_per_second=100,
+        burst=5,
+        monthly_quota=3,
+        quota_store=QuotaStore(str(tmp_path / "quota.db")),
+    )
+    assert restarted.remaining_quota == 0
+    with pytest.raises(QuotaExceededError):
+        await restarted.acquire()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3", default=1) == 3.0
+    assert parse_retry_after(None, default=1) == 1
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", default=1) == 0.0
+    assert parse_retry_after("soon", default=2) == 2
+
+
+@pytest.mark.asyncio
+async def test_client_retries_after_429():
+    calls = []
+
+    async def handle_search(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return web.json_response(
+                {"error": "rate limited"}, status=429, headers={"Retry-After": "0.05"}
+            )
+        return web.json_response({"news_results": []})
+
+    app = web.Application()
+    app.router.add_get("/search", handle_search)
+    stub = TestServer(app)
+    await stub.start_server()
+    limiter = TokenBucketLimiter(rate_per_second=100, burst=5)
+    client = SerpAPIClient(
+        api_key="k", base_url=str(stub.make_url("/search")), limiter=limiter
+    )
+    try:
+        assert await client.search({"q": "ai"}) == {"news_results": []}
+    finally:
+        await client.close()
+        await stub.close()
+
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.05
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from news_agent.agents.db.retention import TrendRetentionJob
+from news_agent.agents.db.sqlachemy_db import Trend
+
+
+async def _age_all_trends(db, days):
+    async with db.get_db() as session:
+        await session.execute(
+            update(Trend).values(
+                created_at=datetime.now(timezone.utc).replace(tzinfo=None)
+                - timedelta(days=days)
+            )
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_retention_archives_only_delivered_trends(db_instance):
+    subscription = await db_instance.add_subscription("a@example.com", ["AI"])
+    first = await db_instance.add_trend("Old 1", "S", "https://example.com/1", "AI")
+    await db_instance.add_trend("Old 2", "S", "https://example.com/2", "AI")
+    await _age_all_trends(db_instance, days=10)
+    # Subscriber received only the first trend
+    await db_instance.record_deliveries(
+        {subscription["id"]: first["inserted"][0]["id"]}
+    )
+
+    job = TrendRetentionJob(db_instance, max_age_days=7, batch_size=1)
+    stats = await job.run_once()
+
+    assert stats == {"archived": 1, "live_rows": 1, "archived_rows": 1}
+    remaining = [p["trends"] for p in await db_instance.get_delivery_plan()]
+    assert [[t["topic"] for t in trends] for trends in remaining] == [["Old 2"]]
+    # Archived fingerprints still deduplicate
+    assert await db_instance.db_exists("Old 1", "https://example.com/1")
+    result = await db_instance.add_trends_bulk(
+        [{"topic": "Old 1", "summary": "S", "link": "https://example.com/1"}], "AI"
+    )
+    assert result["inserted"] == []
+
+
+@pytest.mark.asyncio
+async def test_retention_keeps_recent_trends(db_instance):
+    await db_instance.add_trend("Fresh", "S", "https://example.com/fresh", "Misc")
+
+    job = TrendRetentionJob(db_instance, max_age_days=7)
+    stats = await job.run_once()
+
+    assert stats["archived"] == 0
+    assert await db_instance.count_trend_rows() == {"live": 1, "archived": 0}
+
+
+@pytest.mark.asyncio
+async def test_archived_trend_ids_are_never_reused(db_instance):
+    subscription = await db_instance.add_subscription("a@example.com", ["AI"])
+    newest = await db_instance.add_trend("Old", "S", "https://example.com/1", "AI")
+    newest_id = newest["inserted"][0]["id"]
+    await _age_all_trends(db_instance, days=10)
+    await db_instance.record_deliveries({subscription["id"]: newest_id})
+    job = TrendRetentionJob(db_instance, max_age_days=7)
+    await job.run_once()
+
+    fresh = await db_instance.add_trend("New", "S", "https://example.com/2", "AI")
+
+    # A reused id would sit at or below the subscriber's cursor
+    assert fresh["inserted"][0]["id"] > newest_id
+    plan = await db_instance.get_delivery_plan()
+    assert [t["topic"] for t in plan[0]["trends"]] == ["New"]
+    await db_instance.record_deliveries(
+        {subscription["id"]: fresh["inserted"][0]["id"]}
+    )
+    await _age_all_trends(db_instance, days=10)
+    assert (await job.run_once())["archived"] == 1
@@ -0,0 +1,65 @@
+import pytest
+
+from news_agent.agents.planner.scheduler import AdaptiveTopicScheduler
+
+MINUTE = 60
+
+
+def make_scheduler():
+    return AdaptiveTopicScheduler(
+        min_interval_seconds=5 * MINUTE, max_interval_seconds=360 * MINUTE
+    )
+
+
+def test_new_topics_are_due_immediately():
+    scheduler = make_scheduler()
+    scheduler.sync({"AI": 3, "Space": 1}, now=0)
+
+    assert sorted(scheduler.pop_due(now=0)) == ["AI", "Space"]
+    assert scheduler.pop_due(now=0) == []
+
+
+def test_hot_topics_are_polled_more_often_than_cold_ones():
+    scheduler = make_scheduler()
+    scheduler.sync({"hot": 50, "cold": 50, "unsubscribed": 0}, now=0)
+    scheduler.pop_due(now=0)
+
+    scheduler.record("hot", 20, now=0)
+    scheduler.record("cold", 0, now=0)
+    scheduler.record("unsubscribed", 20, now=0)
+
+    snapshot = scheduler.snapshot()
+    assert snapshot["hot"]["interval_seconds"] == 5 * MINUTE
+    assert snapshot["cold"]["interval_seconds"] == 360 * MINUTE
+    assert snapshot["unsubscribed"]["interval_seconds"] == 360 * MINUTE
+    assert scheduler.next_due() == 5 * MINUTE
+    assert scheduler.pop_due(now=5 * MINUTE) == ["hot"]
+
+
+def test_yield_is_smoothed_and_failures_keep_the_estimate():
+    scheduler = make_scheduler()
+    scheduler.sync({"AI": 3}, now=0)
+    scheduler.pop_due(now=0)
+
+    scheduler.record("AI", 10, now=0)
+    scheduler.record("AI", 0, now=0)
+    assert scheduler.snapshot()["AI"]["yield_ewma"] == pytest.approx(7.0)
+
+    interval = scheduler.snapshot()["AI"]["interval_seconds"]
+    scheduler.record("AI", None, now=100)
+    assert scheduler.snapshot()["AI"]["yield_ewma"] == pytest.approx(7.0)
+    assert scheduler.snapshot()["AI"]["due_at"] == 100 + interval
+
+
+def test_sync_drops_deleted_topics():
+    scheduler = make_scheduler()
+    scheduler.sync({"AI": 1, "Old": 1}, now=0)
+    scheduler.sync({"AI": 1}, now=0)
+
+    assert scheduler.pop_due(now=0) == ["AI"]
+    assert len(scheduler) == 1
+
+
+def test_min_interval_above_max_is_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveTopicScheduler(min_interval_seconds=10, max_interval_seconds=5)
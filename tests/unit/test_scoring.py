@@ -0,0 +1,42 @@
+from news_agent.agents.ingestion.scoring import HotnessScorer
+
+
+def test_source_authority_matches_whole_words_and_domains():
+    scorer = HotnessScorer()
+
+    assert scorer.source_authority("AP News") == 5
+    assert scorer.source_authority("The Japan Times") == 1
+    assert scorer.source_authority("www.reuters.com") == 5
+    assert scorer.source_authority("The Guardian") == 3
+    assert scorer.source_authority("") == 1
+
+
+def test_keywords_and_breaking_use_word_boundaries():
+    scorer = HotnessScorer()
+
+    assert scorer.keywords("Breaking: New chip sales surge, just in") == [
+        "breaking",
+        "just in",
+        "new",
+        "surge",
+    ]
+    # "renewed" and "knowledge" must not match "new" / "now"
+    assert scorer.keywords("Renewed knowledge") == []
+    assert scorer.keywords("Adjust in place") == []
+    assert scorer.is_breaking("ALERT: storm")
+    assert not scorer.is_breaking("Alerting systems explained")
+
+
+def test_score_articles_sorts_with_custom_weights():
+    items = [
+        {"title": "Quiet story", "link": "https://a", "source": "Reuters"},
+        {"title": "Breaking story", "link": "https://b", "source": "Blog"},
+    ]
+
+    default = HotnessScorer().score_articles(items, "q", "en")
+    authority_first = HotnessScorer(
+        weights={"breaking": 1.0, "authority": 10.0}
+    ).score_articles(items, "q", "en")
+
+    assert [a["url"] for a in default] == ["https://b", "https://a"]
+    assert [a["url"] for a in authority_first] == ["https://a", "https://b"]
@@ -0,0 +1,51 @@
+import pytest
+
+from news_agent.agents.ingestion.search_cache import SearchResponseCache
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SearchResponseCache(path=path)
+    key = cache.make_key(q="ai", tbs="qdr:h")
+    await cache.set(key, [{"link": "https://example.com"}], ttl_seconds=60)
+    cache.close()
+
+    reopened = SearchResponseCache(path=path)
+    assert await reopened.get(key) == [{"link": "https://example.com"}]
+    assert await reopened.get(key) == [{"link": "https://example.com"}]
+    assert reopened.stats()["disk_hits"] == 1
+    assert reopened.stats()["memory_hits"] == 1
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_misses(tmp_path):
+    cache = SearchResponseCache(path=str(tmp_path / "cache.db"))
+    await cache.set("k", ["stale"], ttl_seconds=-1)
+
+    assert await cache.get("k") is None
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_size_bounded_eviction(tmp_path):
+    cache = SearchResponseCache(
+        path=str(tmp_path / "cache.db"), max_memory_entries=2, max_disk_entries=3
+    )
+    for i in range(5):
+        await cache.set(f"k{i}", i, ttl_seconds=60)
+
+    assert cache.stats()["memory_entries"] == 2
+    # Oldest entries were evicted from both tiers
+    assert await cache.get("k0") is None
+    assert await cache.get("k4") == 4
+    assert await cache.get("k2") == 2
+    cache.close()
+
+
+def test_ttl_follows_timeframe():
+    cache = SearchResponseCache()
+    assert cache.ttl_for("1h") < cache.ttl_for("24h") < cache.ttl_for("1y")
+    assert cache.make_key(q="a", num=5) == cache.make_key(num=5, q="a")
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from news_agent.agents.ingestion import serpapi_search_mcp_server as server
+from news_agent.agents.ingestion.search_cache import SearchResponseCache
+from news_agent.agents.ingestion.serpapi_client import SerpAPIClient
+
+
+@pytest_asyncio.fixture
+async def serpapi_stub():
+    """Local stand-in for SerpAPI that records every request it receives."""
+    requests = []
+    peers = set()
+    # Error messages to answer the next requests with, as SerpAPI does
+    errors = []
+
+    async def handle_search(request):
+        requests.append(dict(request.query))
+        peers.add(request.transport.get_extra_info("peername"))
+        if errors:
+            return web.json_response({"error": errors.pop(0)})
+        return web.json_response(
+            {
+                "news_results": [
+                    {
+                        "title": f"Breaking: {request.query['q']}",
+                        "link": "https://example.com/a",
+                        "source": "Reuters",
+                        "snippet": "viral story",
+                    }
+                ]
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/search", handle_search)
+    stub = TestServer(app)
+    await stub.start_server()
+    client = SerpAPIClient(api_key="test-key", base_url=str(stub.make_url("/search")))
+    original = server.get_client(), server.get_cache()
+    server.set_client(client)
+    server.set_cache(SearchResponseCache(path=None))
+
+    yield {"requests": requests, "peers": peers, "errors": errors}
+
+    server.set_client(original[0])
+    server.set_cache(original[1])
+    await client.close()
+    await stub.close()
+
+
+@pytest.mark.asyncio
+async def test_search_hot_news_reuses_pooled_session(serpapi_stub):
+    first = await server.search_hot_news("ai chips")
+    second = await server.search_hot_news("ai models")
+
+    assert first[0]["url"] == "https://example.com/a"
+    assert len(serpapi_stub["requests"]) == 2
+    assert first[0]["is_breaking"] is True
+    assert second[0]["search_query"] == "ai models"
+    assert [r["api_key"] for r in serpapi_stub["requests"]] == ["test-key"] * 2
+    # Both calls went over the same keep-alive connection
+    assert len(serpapi_stub["peers"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_client_after_last_session(serpapi_stub):
+    client = server.get_client()
+    session = await client.get_session()
+
+    async with server.lifespan(server.mcp):
+        async with server.lifespan(server.mcp):
+            pass
+        assert not session.closed
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_search_hot_news_returns_empty_on_http_error():
+    client = SerpAPIClient(api_key="k", base_url="http://127.0.0.1:1/search")
+    original = server.get_client(), server.get_cache()
+    server.set_client(client)
+    server.set_cache(SearchResponseCache(path=None))
+    try:
+        assert await server.search_hot_news("anything") == []
+    finally:
+        server.set_client(original[0])
+        server.set_cache(original[1])
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_repeat_search_is_served_from_cache(serpapi_stub):
+    first = await server.search_hot_news("ai chips", timeframe="24h")
+    second = await server.search_hot_news("ai chips", timeframe="24h")
+    await server.search_hot_news("ai chips", timeframe="7d")
+
+    assert [a["url"] for a in second] == [a["url"] for a in first]
+    # The 7d window is a different key and goes to the API
+    assert len(serpapi_stub["requests"]) == 2
+    stats = server.get_cache().stats()
+    assert stats["memory_hits"] == 1 and stats["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_error_responses_are_not_cached(serpapi_stub):
+    serpapi_stub["errors"].append("Your account has run out of searches.")
+
+    assert await server.search_hot_news("ai chips", timeframe="24h") == []
+    second = await server.search_hot_news("ai chips", timeframe="24h")
+
+    assert [a["url"] for a in second] == ["https://example.com/a"]
+    assert len(serpapi_stub["requests"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_search_hot_news_many_merges_shared_articles(serpapi_stub):
+    response = await server.search_hot_news_many(
+        ["ai chips", "ai models", "ai chips"], max_concurrency=2
+    )
+
+    assert list(response["results"]) == ["ai chips", "ai models"]
+    assert len(serpapi_stub["requests"]) == 2
+    # The stub returns the same link for every query
+    assert len(response["merged"]) == 1
+    assert response["merged"][0]["search_queries"] == ["ai chips", "ai models"]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_searches_share_one_request(serpapi_stub):
+    results = await asyncio.gather(
+        server.search_hot_news("AI chips"),
+        server.search_hot_news("ai  chips"),
+        server.search_hot_news("ai chips"),
+    )
+
+    assert len(serpapi_stub["requests"]) == 1
+    assert all(r[0]["url"] == "https://example.com/a" for r in results)
+
+
+def test_scoring_weights_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("SERPAPI_WEIGHT_AUTHORITY", "2.5")
+    monkeypatch.delenv("SERPAPI_WEIGHT_BREAKING", raising=False)
+
+    weights = server.scoring_weights()
+
+    assert weights["authority"] == 2.5
+    assert weights["breaking"] == 10.0
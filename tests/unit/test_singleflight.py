@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from news_agent.agents.ingestion.singleflight import SingleFlight, normalize_query
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flights.do("k", work) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert flights.stats() == {
+        "executions": 1,
+        "coalesced": 4,
+        "memo_hits": 0,
+        "in_flight": 0,
+    }
+    # Without a memo, a later call runs again
+    assert await flights.do("k", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_memo_reuses_results_but_not_errors():
+    flights = SingleFlight(memo_ttl=60)
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await flights.do("k", flaky)
+    assert await flights.do("k", flaky) == "ok"
+    assert await flights.do("k", flaky) == "ok"
+    assert attempts == 2 and flights.memo_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flights.do("k", work))
+    second = asyncio.create_task(flights.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+
+
+def test_normalize_query():
+    assert normalize_query("  AI   Chips ") == normalize_query("ai chips")
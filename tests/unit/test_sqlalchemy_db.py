@@ -0,0 +1,237 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from news_agent.agents.db.sqlachemy_db import (
+    SQLAlchemySubscriptionDB,
+    Tag,
+    Trend,
+    trend_tags,
+)
+from news_agent.agents.schema import NewsItem
+
+
+@pytest.mark.asyncio
+async def test_add_trends_bulk_inserts_trends_and_tags(db_instance):
+    items = [
+        NewsItem(topic="Topic 1", summary="Summary 1", link="https://example.com/1"),
+        NewsItem(topic="Topic 2", summary="Summary 2", link="https://example.com/2"),
+        NewsItem(topic="Topic 3", summary="Summary 3", link="https://example.com/3"),
+    ]
+
+    result = await db_instance.add_trends_bulk(items, "AI")
+
+    assert [row["topic"] for row in result["inserted"]] == [
+        "Topic 1",
+        "Topic 2",
+        "Topic 3",
+    ]
+    assert result["skipped"] == []
+
+    async with db_instance.get_db() as db:
+        tag_count = await db.scalar(select(func.count()).select_from(Tag))
+        link_count = await db.scalar(select(func.count()).select_from(trend_tags))
+        trends = (await db.execute(select(Trend).order_by(Trend.id))).scalars().all()
+
+    assert tag_count == 1
+    assert link_count == 3
+    assert [t.id for t in trends] == [row["id"] for row in result["inserted"]]
+
+
+@pytest.mark.asyncio
+async def test_add_trends_bulk_reports_duplicates(db_instance):
+    await db_instance.add_trend(
+        "Existing", "Summary", "https://example.com/existing", "AI"
+    )
+
+    result = await db_instance.add_trends_bulk(
+        [
+            {
+                "topic": "existing",
+                "summary": "",
+                "link": "https://example.com/existing",
+            },
+            {"topic": "Fresh", "summary": "S", "link": "https://example.com/fresh"},
+            {"topic": "Fresh", "summary": "S", "link": "https://example.com/fresh"},
+            {"topic": "", "summary": "S", "link": "https://example.com/empty"},
+        ],
+        "AI",
+    )
+
+    assert [row["topic"] for row in result["inserted"]] == ["Fresh"]
+    assert sorted(row["reason"] for row in result["skipped"]) == [
+        "duplicate",
+        "duplicate",
+        "incomplete",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_add_trends_bulk_survives_a_concurrent_insert(db_instance, monkeypatch):
+    await db_instance.add_trend("Raced", "S", "https://example.com/raced", "AI")
+    # Another writer stored "Raced" after this batch's duplicate check ran
+    monkeypatch.setattr(
+        db_instance,
+        "_stored_fingerprints_query",
+        lambda url_hashes: select(Trend.url_hash, Trend.title_hash).where(False),
+    )
+
+    result = await db_instance.add_trends_bulk(
+        [
+            {"topic": "Raced", "summary": "S", "link": "https://example.com/raced"},
+            {"topic": "New", "summary": "S", "link": "https://example.com/new"},
+        ],
+        "AI",
+    )
+
+    assert [row["topic"] for row in result["inserted"]] == ["New"]
+    assert [row["reason"] for row in result["skipped"]] == ["duplicate"]
+    assert await db_instance.count_trend_rows() == {"live": 2, "archived": 0}
+
+
+@pytest.mark.asyncio
+async def test_dedup_matches_canonical_url(db_instance):
+    await db_instance.add_trend(
+        "Big  News", "Summary", "https://www.example.com/story/?utm_source=x", "AI"
+    )
+
+    assert await db_instance.db_exists("big news", "http://example.com/story")
+    assert not await db_instance.db_exists("Other News", "http://example.com/story")
+
+
+@pytest.mark.asyncio
+async def test_filter_new_trends_drops_stored_and_repeated_items(db_instance):
+    await db_instance.add_trend("Old", "S", "https://example.com/old", "AI")
+    items = [
+        NewsItem(topic="Old", summary="S", link="https://www.example.com/old/"),
+        NewsItem(topic="New", summary="S", link="https://example.com/new"),
+        NewsItem(topic="New", summary="S", link="https://example.com/new#top"),
+        NewsItem(topic="", summary="S", link="https://example.com/blank"),
+    ]
+
+    new_items = await db_instance.filter_new_trends(items)
+
+    assert new_items == [items[1]]
+
+
+@pytest.mark.asyncio
+async def test_init_db_backfills_legacy_trends(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TABLE trends (id INTEGER PRIMARY KEY, topic VARCHAR(512) "
+            "NOT NULL, summary TEXT, url VARCHAR(2048), source VARCHAR(256), "
+            "notified BOOLEAN)"
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO trends (topic, url, notified) VALUES "
+            "('Legacy', 'https://example.com/a', 0), "
+            "('LEGACY', 'https://example.com/a', 0), "
+            "('Other', 'https://example.com/b', 0)"
+        )
+
+    db = SQLAlchemySubscriptionDB(engine=engine)
+    await db.init_db()
+
+    async with db.get_db() as session:
+        result = await session.execute(select(Trend.url_hash).order_by(Trend.id))
+        hashes = result.scalars().all()
+
+    assert hashes[0] is not None and hashes[2] is not None
+    assert hashes[1] is None  # legacy duplicate left out of the unique index
+    assert await db.db_exists("legacy", "https://example.com/a")
+
+    # The rowid table was rebuilt with AUTOINCREMENT, keeping every id
+    async with engine.begin() as conn:
+        ddl = await conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE name = 'trends'"
+        )
+        assert "AUTOINCREMENT" in ddl.scalar().upper()
+        await conn.exec_driver_sql("DELETE FROM trends WHERE id = 3")
+    result = await db.add_trend("New", "S", "https://example.com/c", "AI")
+    assert result["inserted"][0]["id"] == 4
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_resolve_tag_ids_creates_each_tag_once(db_instance):
+    results = await asyncio.gather(
+        *(db_instance.resolve_tag_ids(["New", "Other"]) for _ in range(5))
+    )
+
+    assert all(result == results[0] for result in results)
+    async with db_instance.get_db() as db:
+        assert await db.scalar(select(func.count()).select_from(Tag)) == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_tag_ids_with_more_tags_than_the_cache_holds(db_instance):
+    db_instance._tag_cache_size = 2
+    names = ["A", "B", "C", "D"]
+
+    first = await db_instance.resolve_tag_ids(names)
+    second = await db_instance.resolve_tag_ids(names)
+
+    assert list(first) == names
+    assert first == second
+    assert len(set(first.values())) == 4
+    assert len(db_instance._tag_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_subscription_merges_topics(db_instance):
+    await db_instance.add_subscription("a@example.com", ["AI"])
+    result = await db_instance.add_subscription("a@example.com", ["AI", "Space"])
+
+    assert sorted(result["tags"]) == ["AI", "Space"]
+
+
+@pytest.mark.asyncio
+async def test_topic_subscriber_counts_cover_every_tag(db_instance):
+    await db_instance.add_subscription("a@example.com", ["AI", "Space"])
+    await db_instance.add_subscription("b@example.com", ["AI"])
+    await db_instance.add_trend("T", "S", "https://example.com/t", "Chat query")
+
+    counts = await db_instance.get_topic_subscriber_counts()
+
+    assert counts == {"AI": 2, "Space": 1, "Chat query": 0}
+
+
+@pytest.mark.asyncio
+async def test_delivery_plan_is_streamed_in_subscriber_pages(db_instance):
+    for i in range(3):
+        await db_instance.add_subscription(f"user{i}@example.com", ["AI"])
+    for i in range(5):
+        await db_instance.add_trend(f"T{i}", "S", f"https://example.com/{i}", "AI")
+
+    pages = [page async for page in db_instance.iter_delivery_plan(batch_size=2)]
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert [entry for page in pages for entry in page] == (
+        await db_instance.get_delivery_plan()
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_trends_ranks_matches(db_instance):
+    await db_instance.add_trend(
+        "Old story", "Unrelated", "https://example.com/old", "Misc"
+    )
+    await db_instance.init_db()  # builds the FTS index over existing rows
+    await db_instance.add_trend(
+        "Quantum chip breakthrough", "A new quantum processor", "https://a.com", "AI"
+    )
+    await db_instance.add_trend(
+        "Chip exports", "Quantum mentioned in passing", "https://b.com", "AI"
+    )
+
+    results = await db_instance.search_trends("quantum", limit=5)
+
+    assert [r["topic"] for r in results] == [
+        "Quantum chip breakthrough",
+        "Chip exports",
+    ]
+    assert (await db_instance.search_trends("story"))[0]["topic"] == "Old story"
+    assert await db_instance.search_trends("!!!") == []
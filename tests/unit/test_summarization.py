@@ -0,0 +1,82 @@
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from news_agent.agents.schema import NewsItem, SummaryBatch, SummaryItem
+from news_agent.agents.summarizer.summarization_agent import SummarizationAgent
+
+
+def make_items(count, snippet="snippet"):
+    return [
+        NewsItem(topic=f"T{i}", summary=snippet, link=f"https://e.com/{i}")
+        for i in range(count)
+    ]
+
+
+def llm_result(payload):
+    result = MagicMock()
+    result.final_output = SummaryBatch(
+        summaries=[
+            SummaryItem(index=entry["index"], summary=f"summary of {entry['topic']}")
+            for entry in json.loads(payload)
+        ]
+    )
+    return result
+
+
+def test_pack_respects_char_budget_and_item_cap():
+    summarizer = SummarizationAgent(char_budget=400, max_items_per_request=3)
+    items = make_items(4, snippet="x" * 100) + make_items(1, snippet="y" * 1000)
+
+    batches = summarizer.pack(items)
+
+    # ~180 chars per short item: two per request; the long one goes alone
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_summarize_runs_packed_requests_concurrently():
+    summarizer = SummarizationAgent(max_concurrency=2, max_items_per_request=2)
+    active = peak = 0
+
+    async def fake_run(agent, payload):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return llm_result(payload)
+
+    with patch("agents.Runner.run", side_effect=fake_run), patch(
+        "news_agent.agents.summarizer.summarization_agent.init_agent"
+    ):
+        results = await summarizer.summarize(make_items(7))
+
+    assert [r.summary for r in results] == [f"summary of T{i}" for i in range(7)]
+    assert summarizer.requests == 4
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_timed_out_request_is_retried_per_item_then_falls_back():
+    summarizer = SummarizationAgent(item_timeout_seconds=0.05)
+
+    async def fake_run(agent, payload):
+        entries = json.loads(payload)
+        if any(entry["topic"] == "T1" for entry in entries):
+            await asyncio.sleep(1)
+        return llm_result(payload)
+
+    with patch("agents.Runner.run", side_effect=fake_run), patch(
+        "news_agent.agents.summarizer.summarization_agent.init_agent"
+    ):
+        results = await summarizer.summarize(make_items(3))
+
+    assert [r.summary for r in results] == [
+        "summary of T0",
+        "snippet",
+        "summary of T2",
+    ]
+    assert summarizer.fallbacks == 1
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from news_agent.agents.db.sqlachemy_db import Subscription
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_group_committed(db_instance):
+    await db_instance.start_write_queue(max_batch_size=50, max_latency_ms=50)
+    try:
+        results = await asyncio.gather(
+            *(
+                db_instance.add_subscription(f"user{i}@example.com", ["AI"])
+                for i in range(20)
+            )
+        )
+        queue = db_instance.write_queue
+        assert queue.intents_committed == 21  # 20 subscriptions + 1 tag
+        assert queue.batches_committed < queue.intents_committed
+    finally:
+        await db_instance.stop_write_queue()
+
+    assert sorted(r["email"] for r in results) == sorted(
+        f"user{i}@example.com" for i in range(20)
+    )
+    async with db_instance.get_db() as db:
+        assert await db.scalar(select(func.count()).select_from(Subscription)) == 20
+
+
+@pytest.mark.asyncio
+async def test_failing_intent_does_not_fail_its_batch(db_instance):
+    async def good(db):
+        db.add(Subscription(email="ok@example.com"))
+        return "ok"
+
+    async def bad(db):
+        raise ValueError("boom")
+
+    await db_instance.start_write_queue(max_latency_ms=50)
+    try:
+        queue = db_instance.write_queue
+        results = await asyncio.gather(
+            queue.submit(good), queue.submit(bad), return_exceptions=True
+        )
+    finally:
+        await db_instance.stop_write_queue()
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], ValueError)
+    async with db_instance.get_db() as db:
+        assert await db.scalar(select(func.count()).select_from(Subscription)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_writer_fails_pending_writes(db_instance):
+    started = asyncio.Event()
+
+    async def blocked(db):
+        started.set()
+        await asyncio.Event().wait()
+
+    async def good(db):
+        return "ok"
+
+    await db_instance.start_write_queue(max_latency_ms=1)
+    queue = db_instance.write_queue
+    in_batch = asyncio.create_task(queue.submit(blocked))
+    await started.wait()
+    queued = asyncio.create_task(queue.submit(good))
+    await asyncio.sleep(0)
+
+    queue._task.cancel()
+    results = await asyncio.wait_for(
+        asyncio.gather(in_batch, queued, return_exceptions=True), timeout=1
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await queue.submit(good)